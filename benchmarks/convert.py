@@ -0,0 +1,48 @@
+"""Benchmark converting OpenAPI documents between 3.0 and 3.1.
+
+Run with `python -m benchmarks.convert` from the repository root.
+"""
+
+import time
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.convert import downgrade_to_3_0, upgrade_to_3_1
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 3000
+
+
+def main() -> None:
+    """Print the time taken by the converters and by a dump and re-parse."""
+    open_api = parse_obj(synthetic_spec(N_PATHS, version="3.0.4"))
+    assert isinstance(open_api, v3_0.OpenAPI)
+    print(f"{N_PATHS:,} paths:")
+
+    start = time.perf_counter()
+    upgrade_to_3_1(open_api)
+    done = time.perf_counter()
+    print(f"  {'upgrade_to_3_1()':<18} {(done - start) * 1000:8.1f} ms")
+
+    # the lower bound of a round trip: without updating the schemas
+    start = time.perf_counter()
+    if PYDANTIC_V2:
+        raw = open_api.model_dump(by_alias=True, exclude_unset=True)
+    else:
+        raw = open_api.dict(by_alias=True, exclude_unset=True)
+    parse_obj({**raw, "openapi": "3.1.1"})
+    done = time.perf_counter()
+    print(f"  {'dump and re-parse':<18} {(done - start) * 1000:8.1f} ms")
+
+    open_api_3_1 = parse_obj(synthetic_spec(N_PATHS))
+    assert isinstance(open_api_3_1, v3_1.OpenAPI)
+    start = time.perf_counter()
+    downgrade_to_3_0(open_api_3_1)
+    done = time.perf_counter()
+    print(f"  {'downgrade_to_3_0()':<18} {(done - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
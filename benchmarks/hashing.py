@@ -0,0 +1,47 @@
+"""Benchmark hashing an OpenAPI document, and hashing it again after an update.
+
+Run with `python -m benchmarks.hashing` from the repository root.
+"""
+
+import hashlib
+import time
+from typing import Any, Callable
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3.hashing import content_hash
+from openapi_pydantic.v3.serializer import invalidate_json_bytes, to_json_bytes
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 3000
+
+
+def _time(label: str, function: Callable[[], Any]) -> None:
+    """Print the time taken by a function."""
+    start = time.perf_counter()
+    function()
+    print(f"  {label:<30} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Print the time taken by `content_hash()`, and by hashing the sorted JSON."""
+    open_api: Any = parse_obj(synthetic_spec(N_PATHS))
+    print(f"{N_PATHS:,} paths:")
+
+    def hash_json() -> str:
+        invalidate_json_bytes(open_api)
+        return hashlib.sha256(to_json_bytes(open_api, sort_keys=True)).hexdigest()
+
+    def update() -> None:
+        operation = open_api.paths["/resource7/{itemId}"].get
+        operation.summary = f"{operation.summary}!"
+
+    _time("sha256 of the sorted JSON", hash_json)
+    _time("content_hash()", lambda: content_hash(open_api))
+    _time("content_hash() (unchanged)", lambda: content_hash(open_api))
+    update()
+    _time("content_hash() (1 update)", lambda: content_hash(open_api))
+
+
+if __name__ == "__main__":
+    main()
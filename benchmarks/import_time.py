@@ -0,0 +1,62 @@
+"""Benchmark the time taken to import the package, in a new interpreter.
+
+Run with `python -m benchmarks.import_time` from the repository root.
+"""
+
+import json
+import subprocess
+import sys
+from typing import List, Tuple
+
+REPEAT = 5
+
+_DOCUMENT = '{"openapi": "3.1.1", "info": {"title": "a", "version": "1"}, "paths": {}}'
+
+STATEMENTS = {
+    "import pydantic": "import pydantic",
+    "import openapi_pydantic": "import openapi_pydantic",
+    "openapi_pydantic.OpenAPI": "import openapi_pydantic; openapi_pydantic.OpenAPI",
+    "Info.model_validate()": (
+        "import openapi_pydantic; openapi_pydantic.Info.model_validate("
+        "{'title': 'a', 'version': '1'})"
+    ),
+    "parse_obj() (3.1)": (
+        "import json, openapi_pydantic;"
+        f"openapi_pydantic.parse_obj(json.loads({_DOCUMENT!r}))"
+    ),
+    "warmup() (3.1)": "import openapi_pydantic; openapi_pydantic.warmup('3.1')",
+    "both versions": "from openapi_pydantic.v3 import v3_0, v3_1",
+}
+
+
+def _run(statement: str) -> Tuple[float, List[str]]:
+    """Get the time taken by a statement in a new interpreter, in seconds.
+
+    :return: the time, and the version packages imported by the statement
+    """
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "versions = sorted(m for m in sys.modules if m.endswith(('.v3_0', '.v3_1')))\n"
+        "print(json.dumps([elapsed, versions]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    elapsed, versions = json.loads(output)
+    return elapsed, versions
+
+
+def main() -> None:
+    """Print the best time of each statement, and the versions it imported."""
+    for label, statement in STATEMENTS.items():
+        results = [_run(statement) for _ in range(REPEAT)]
+        best = min(elapsed for elapsed, _versions in results)
+        versions = ", ".join(v.rpartition(".")[2] for v in results[0][1]) or "-"
+        print(f"{label:<28} {best * 1000:8.1f} ms   versions: {versions}")
+
+
+if __name__ == "__main__":
+    main()
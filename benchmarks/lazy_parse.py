@@ -0,0 +1,44 @@
+"""Benchmark the cold start of a large document with lazy paths and components.
+
+Run with `python -m benchmarks.lazy_parse` from the repository root.
+"""
+
+import io
+import json
+import time
+
+from openapi_pydantic import load, parse_obj
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 10000
+
+
+def main() -> None:
+    """Print the time taken to parse a document and read a few paths and schemas."""
+    document = json.dumps(synthetic_spec(N_PATHS)).encode()
+    used = range(0, N_PATHS, N_PATHS // 10)
+    print(f"{N_PATHS:,} paths and schemas, {len(used)} of each used:")
+    for label, func in (
+        ("parse_obj()", lambda: parse_obj(json.loads(document))),
+        ("parse_obj(lazy=True)", lambda: parse_obj(json.loads(document), lazy=True)),
+        ("load()", lambda: load(io.BytesIO(document))),
+        ("load(lazy=True)", lambda: load(io.BytesIO(document), lazy=True)),
+    ):
+        start = time.perf_counter()
+        open_api = func()
+        parsed = time.perf_counter()
+        assert open_api.paths is not None and open_api.components is not None
+        assert open_api.components.schemas is not None
+        for i in used:
+            open_api.paths[f"/resource{i}/{{itemId}}"]
+            open_api.components.schemas[f"Item{i}"]
+        done = time.perf_counter()
+        print(
+            f"  {label:<22} parse {(parsed - start) * 1000:8.1f} ms"
+            f"  + use {(done - parsed) * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the peak memory of loading a large document from a file.
+
+Each approach runs in its own process, and the peak resident set size of the
+process is reported, as most of the memory used while parsing is allocated by
+pydantic-core and is not visible to `tracemalloc`.
+
+Run with `python -m benchmarks.load_memory` from the repository root.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from .synthetic import synthetic_spec
+
+APPROACHES = {
+    "import only": "None",
+    "parse_json(f.read())": "parse_json(open(path, 'rb').read())",
+    "parse_obj(json.load(f))": "parse_obj(json.load(open(path, 'rb')))",
+    "load(path)": "load(path)",
+    "load(path, intern=True)": "load(path, intern=True)",
+}
+
+SCRIPT = """
+import json, resource, sys, time
+from openapi_pydantic import load, parse_json, parse_obj
+path = sys.argv[1]
+start = time.perf_counter()
+result = {expression}
+seconds = time.perf_counter() - start
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, seconds)
+"""
+
+
+def main() -> None:
+    """Print the peak memory and time taken by each approach."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "openapi.json")
+        with open(path, "w") as f:
+            json.dump(synthetic_spec(20000), f, indent=2)
+        print(f"document: {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+        for label, expression in APPROACHES.items():
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", SCRIPT.format(expression=expression), path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            max_rss, seconds = output.split()
+            wall = time.perf_counter() - start
+            print(
+                f"  {label:<26} peak RSS {int(max_rss) / 1024:8.1f} MiB"
+                f"  parse {float(seconds):6.2f} s  (process {wall:5.2f} s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
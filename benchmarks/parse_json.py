@@ -0,0 +1,43 @@
+"""Benchmark parsing JSON documents with version inference.
+
+Run with `python -m benchmarks.parse_json` from the repository root.
+"""
+
+import json
+import timeit
+
+from openapi_pydantic import parse_json, parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3.parser import _root_model  # type: ignore[attr-defined]
+
+from .synthetic import synthetic_spec
+
+
+def parse_union(document: bytes) -> object:
+    """Parse through the discriminated union of the OpenAPI versions."""
+    if PYDANTIC_V2:
+        return _root_model().model_validate_json(document).root
+    return _root_model().parse_raw(document).__root__
+
+
+def main() -> None:
+    """Print the time taken to parse small and large documents."""
+    documents = {
+        "small (1 path)": json.dumps(synthetic_spec(1)).encode(),
+        "large (2,000 paths)": json.dumps(synthetic_spec(2000)).encode(),
+        "large, sorted keys": json.dumps(synthetic_spec(2000), sort_keys=True).encode(),
+    }
+    for name, document in documents.items():
+        number = 2000 if len(document) < 10_000 else 5
+        print(f"{name}:")
+        for label, func in (
+            ("parse_obj(json.loads())", lambda d=document: parse_obj(json.loads(d))),
+            ("union model_validate_json", lambda d=document: parse_union(d)),
+            ("parse_json()", lambda d=document: parse_json(d)),
+        ):
+            seconds = timeit.timeit(func, number=number)
+            print(f"  {label:<28} {seconds / number * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark validating the `Reference` unions discriminated by "$ref".
+
+Run with `python -m benchmarks.reference_union` from the repository root.
+"""
+
+import json
+import time
+from typing import Any, Callable, List, Union
+
+from openapi_pydantic import parse_json
+from openapi_pydantic.compat import PYDANTIC_V2, ReferenceUnion
+from openapi_pydantic.v3.v3_1 import Reference, Schema
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 3000
+N_SCHEMAS = 20_000
+SWAGGER = "tests/data/swagger_openapi_v3.0.1.json"
+
+
+def _best(function: Callable[[], Any], number: int) -> float:
+    """Get the best time taken by a function, in seconds per call."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def main() -> None:
+    """Print the parsing throughput, and the time taken to validate the unions."""
+    with open(SWAGGER, "rb") as f:
+        documents = {
+            "swagger_openapi_v3.0.1.json": (f.read(), 500),
+            f"synthetic ({N_PATHS:,} paths)": (
+                json.dumps(synthetic_spec(N_PATHS)).encode(),
+                1,
+            ),
+        }
+    print("parse_json():")
+    for name, (document, number) in documents.items():
+        seconds = _best(lambda d=document: parse_json(d), number)
+        print(
+            f"  {name:<30} {seconds * 1000:8.2f} ms"
+            f" {len(document) / seconds / 1e6:8.1f} MB/s"
+        )
+
+    if not PYDANTIC_V2:
+        return
+    from pydantic import TypeAdapter
+
+    values = [
+        {"$ref": f"#/components/schemas/Item{i}"}
+        if i % 2
+        else {"type": "object", "properties": {"id": {"type": "string"}}}
+        for i in range(N_SCHEMAS)
+    ]
+    print(f"{N_SCHEMAS:,} schemas, half of them references:")
+    for label, union in (
+        ("smart Union", Union[Reference, Schema]),
+        ("ReferenceUnion", ReferenceUnion[Reference, Schema]),
+    ):
+        adapter: Any = TypeAdapter(List[union])
+        seconds = _best(lambda a=adapter: a.validate_python(values), 1)
+        print(f"  {label:<30} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark matching request paths against the path templates of a document.
+
+Run with `python -m benchmarks.router` from the repository root.
+"""
+
+import re
+import time
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3.router import compile_router
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 10000
+N_REQUESTS = 1000
+
+
+def main() -> None:
+    """Print the time taken to match requests with a router and a regex scan."""
+    open_api = parse_obj(synthetic_spec(N_PATHS))
+    assert open_api.paths is not None
+    requests = [
+        f"/resource{i}/3f2504e0-4f89-11d3-9a0c-0305e82c3301"
+        for i in range(0, N_PATHS, N_PATHS // N_REQUESTS)
+    ]
+    print(f"{N_PATHS:,} paths, {len(requests):,} requests:")
+
+    start = time.perf_counter()
+    router = compile_router(open_api)
+    compiled = time.perf_counter()
+    for path in requests:
+        assert router.match("GET", path) is not None
+    done = time.perf_counter()
+    print(
+        f"  {'compile_router()':<14} build {(compiled - start) * 1000:8.1f} ms"
+        f"  match {(done - compiled) / len(requests) * 1e6:8.1f} us/request"
+    )
+
+    start = time.perf_counter()
+    patterns = [
+        (re.compile(re.sub(r"{[^}/]+}", "([^/]+)", template)), template)
+        for template in open_api.paths
+    ]
+    compiled = time.perf_counter()
+    for path in requests:
+        assert next(t for pattern, t in patterns if pattern.fullmatch(path))
+    done = time.perf_counter()
+    print(
+        f"  {'regex scan':<14} build {(compiled - start) * 1000:8.1f} ms"
+        f"  match {(done - compiled) / len(requests) * 1e6:8.1f} us/request"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark serializing an OpenAPI document to JSON bytes.
+
+Run with `python -m benchmarks.serialize` from the repository root.
+"""
+
+import json
+import time
+from typing import Any, Callable
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3.serializer import invalidate_json_bytes, to_json_bytes
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 3000
+
+
+def _time(label: str, function: Callable[[], Any]) -> None:
+    """Print the best time of a few calls of a function."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<30} {best * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Print the time taken by `to_json_bytes()` and by a dump and `json.dumps`."""
+    open_api = parse_obj(synthetic_spec(N_PATHS))
+    print(f"{N_PATHS:,} paths:")
+
+    def dump_and_encode() -> bytes:
+        if PYDANTIC_V2:
+            value = open_api.model_dump(by_alias=True, exclude_none=True)
+        else:
+            value = open_api.dict(by_alias=True, exclude_none=True)
+        return json.dumps(value).encode()
+
+    def serialize(sort_keys: bool = False) -> bytes:
+        invalidate_json_bytes(open_api)
+        return to_json_bytes(open_api, sort_keys=sort_keys)
+
+    _time("dump and json.dumps", dump_and_encode)
+    _time("to_json_bytes()", serialize)
+    _time("to_json_bytes(sort_keys=True)", lambda: serialize(sort_keys=True))
+    to_json_bytes(open_api)
+    _time("to_json_bytes() (cached)", lambda: to_json_bytes(open_api))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark loading an OpenAPI document through a snapshot of the parsed document.
+
+Run with `python -m benchmarks.snapshot` from the repository root.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+from openapi_pydantic.v3 import parse_json
+from openapi_pydantic.v3.snapshot import SNAPSHOT_SUFFIX, load_cached
+
+from .synthetic import synthetic_spec
+
+N_PATHS = 3000
+
+
+def _time(label: str, function: Callable[[], Any]) -> None:
+    """Print the time taken by a function."""
+    start = time.perf_counter()
+    function()
+    print(f"  {label:<30} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Print the time taken by `parse_json()`, and by `load_cached()`."""
+    data = json.dumps(synthetic_spec(N_PATHS)).encode()
+    print(f"{N_PATHS:,} paths, {len(data) / 1e6:.1f} MB of JSON:")
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "openapi.json")
+        cache_dir = os.path.join(directory, "cache")
+        with open(source, "wb") as stream:
+            stream.write(data)
+
+        _time("parse_json()", lambda: parse_json(data))
+        _time("load_cached() (miss)", lambda: load_cached(source, cache_dir))
+        _time("load_cached() (hit)", lambda: load_cached(source, cache_dir))
+        _time(
+            "load_cached() (hit, mmap)",
+            lambda: load_cached(source, cache_dir, use_mmap=True),
+        )
+        (snapshot,) = (
+            name for name in os.listdir(cache_dir) if name.endswith(SNAPSHOT_SUFFIX)
+        )
+        size = os.path.getsize(os.path.join(cache_dir, snapshot))
+        print(f"  snapshot size: {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Synthetic OpenAPI documents shared by the benchmark scripts."""
+
+from typing import Any, Dict
+
+
+def synthetic_spec(n_paths: int, version: str = "3.1.1") -> Dict[str, Any]:
+    """Build a raw OpenAPI document with `n_paths` paths of two operations each."""
+    paths: Dict[str, Any] = {}
+    schemas: Dict[str, Any] = {}
+    for i in range(n_paths):
+        schemas[f"Item{i}"] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "string", "format": "uuid"},
+                "name": {"type": "string", "maxLength": 64},
+                "count": {"type": "integer", "minimum": 0},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        paths[f"/resource{i}/{{itemId}}"] = {
+            "parameters": [
+                {
+                    "name": "itemId",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string", "format": "uuid"},
+                }
+            ],
+            "get": {
+                "operationId": f"getItem{i}",
+                "tags": [f"tag{i % 20}"],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Item{i}"}
+                            }
+                        },
+                    },
+                    "404": {"$ref": "#/components/responses/NotFound"},
+                },
+            },
+            "put": {
+                "operationId": f"putItem{i}",
+                "tags": [f"tag{i % 20}"],
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": f"#/components/schemas/Item{i}"}
+                        }
+                    }
+                },
+                "responses": {"204": {"description": "Updated"}},
+            },
+        }
+    return {
+        "openapi": version,
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {
+            "schemas": {
+                **schemas,
+                "Error": {
+                    "type": "object",
+                    "properties": {
+                        "code": {"type": "integer"},
+                        "message": {"type": "string"},
+                    },
+                },
+            },
+            "responses": {
+                "NotFound": {
+                    "description": "Not found",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Error"}
+                        }
+                    },
+                }
+            },
+        },
+    }
@@ -0,0 +1,70 @@
+"""Benchmark validating request bodies against a schema of a document.
+
+The `jsonschema` package is used for comparison if it is installed.
+
+Run with `python -m benchmarks.validator` from the repository root.
+"""
+
+import time
+import uuid
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3.resolver import RefResolver
+from openapi_pydantic.v3.validator import compile_validator, validate_many
+
+from .synthetic import synthetic_spec
+
+N_INSTANCES = 20000
+
+
+def main() -> None:
+    """Print the time taken to validate instances of the `Item0` schema."""
+    spec = synthetic_spec(10)
+    open_api = parse_obj(spec)
+    instances = [
+        {"id": str(uuid.uuid4()), "name": f"item {i}", "count": i, "tags": ["a", "b"]}
+        for i in range(N_INSTANCES)
+    ]
+    print(f"{N_INSTANCES:,} instances:")
+
+    start = time.perf_counter()
+    resolver = RefResolver(open_api)
+    validator = compile_validator(
+        resolver.resolve("#/components/schemas/Item0"), resolver
+    )
+    compiled = time.perf_counter()
+    assert all(validator.is_valid(instance) for instance in instances)
+    done = time.perf_counter()
+    _report("compile_validator()", start, compiled, done)
+
+    start = time.perf_counter()
+    schema = resolver.resolve("#/components/schemas/Item0")
+    assert validate_many(schema, instances[:1], RefResolver(open_api)) == {}
+    compiled = time.perf_counter()
+    assert validate_many(schema, instances, resolver) == {}
+    done = time.perf_counter()
+    _report("validate_many()", start, compiled, done)
+
+    try:
+        import jsonschema
+    except ImportError:
+        return
+    start = time.perf_counter()
+    schema = spec["components"]["schemas"]["Item0"]
+    json_validator = jsonschema.Draft202012Validator(schema)
+    compiled = time.perf_counter()
+    assert all(json_validator.is_valid(instance) for instance in instances)
+    done = time.perf_counter()
+    _report("jsonschema", start, compiled, done)
+
+
+def _report(label: str, start: float, compiled: float, done: float) -> None:
+    """Print the compilation time and the validation time per instance."""
+    print(
+        f"  {label:<20} compile {(compiled - start) * 1000:6.2f} ms"
+        f"  validate {(done - compiled) / N_INSTANCES * 1e6:6.2f} us/instance"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,109 @@
 """OpenAPI schema interface utilizing Pydantic."""
 
 import logging
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, FrozenSet, List
+
+if TYPE_CHECKING:
+    from .v3 import XML as XML
+    from .v3 import Callback as Callback
+    from .v3 import Components as Components
+    from .v3 import Contact as Contact
+    from .v3 import DataType as DataType
+    from .v3 import Discriminator as Discriminator
+    from .v3 import Encoding as Encoding
+    from .v3 import Example as Example
+    from .v3 import ExternalDocumentation as ExternalDocumentation
+    from .v3 import Header as Header
+    from .v3 import Info as Info
+    from .v3 import License as License
+    from .v3 import Link as Link
+    from .v3 import MediaType as MediaType
+    from .v3 import OAuthFlow as OAuthFlow
+    from .v3 import OAuthFlows as OAuthFlows
+    from .v3 import OpenAPI as OpenAPI
+    from .v3 import Operation as Operation
+    from .v3 import Parameter as Parameter
+    from .v3 import ParameterLocation as ParameterLocation
+    from .v3 import PathItem as PathItem
+    from .v3 import Paths as Paths
+    from .v3 import Reference as Reference
+    from .v3 import RequestBody as RequestBody
+    from .v3 import Response as Response
+    from .v3 import Responses as Responses
+    from .v3 import Schema as Schema
+    from .v3 import SecurityRequirement as SecurityRequirement
+    from .v3 import SecurityScheme as SecurityScheme
+    from .v3 import Server as Server
+    from .v3 import ServerVariable as ServerVariable
+    from .v3 import Tag as Tag
+    from .v3 import load as load
+    from .v3 import parse_json as parse_json
+    from .v3 import parse_obj as parse_obj
+    from .v3 import parse_trusted as parse_trusted
+    from .v3 import schema_validate as schema_validate
+    from .v3 import warmup as warmup
+
+_NAMES: FrozenSet[str] = frozenset(
+    {
+        "XML",
+        "Callback",
+        "Components",
+        "Contact",
+        "DataType",
+        "Discriminator",
+        "Encoding",
+        "Example",
+        "ExternalDocumentation",
+        "Header",
+        "Info",
+        "License",
+        "Link",
+        "MediaType",
+        "OAuthFlow",
+        "OAuthFlows",
+        "OpenAPI",
+        "Operation",
+        "Parameter",
+        "ParameterLocation",
+        "PathItem",
+        "Paths",
+        "Reference",
+        "RequestBody",
+        "Response",
+        "Responses",
+        "Schema",
+        "SecurityRequirement",
+        "SecurityScheme",
+        "Server",
+        "ServerVariable",
+        "Tag",
+        "load",
+        "parse_json",
+        "parse_obj",
+        "parse_trusted",
+        "schema_validate",
+        "warmup",
+    }
+)
+"""The names of `openapi_pydantic.v3`, imported on first access."""
+
+__all__ = sorted({*_NAMES, "v3"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import a name of `openapi_pydantic.v3`, or the package, on first access."""
+    if name == "v3":
+        return import_module(".v3", __name__)
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(".v3", __name__), name)
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the names of the package, including the names not imported yet."""
+    return sorted({*globals(), *__all__})
 
-from .v3 import XML as XML
-from .v3 import Callback as Callback
-from .v3 import Components as Components
-from .v3 import Contact as Contact
-from .v3 import DataType as DataType
-from .v3 import Discriminator as Discriminator
-from .v3 import Encoding as Encoding
-from .v3 import Example as Example
-from .v3 import ExternalDocumentation as ExternalDocumentation
-from .v3 import Header as Header
-from .v3 import Info as Info
-from .v3 import License as License
-from .v3 import Link as Link
-from .v3 import MediaType as MediaType
-from .v3 import OAuthFlow as OAuthFlow
-from .v3 import OAuthFlows as OAuthFlows
-from .v3 import OpenAPI as OpenAPI
-from .v3 import Operation as Operation
-from .v3 import Parameter as Parameter
-from .v3 import ParameterLocation as ParameterLocation
-from .v3 import PathItem as PathItem
-from .v3 import Paths as Paths
-from .v3 import Reference as Reference
-from .v3 import RequestBody as RequestBody
-from .v3 import Response as Response
-from .v3 import Responses as Responses
-from .v3 import Schema as Schema
-from .v3 import SecurityRequirement as SecurityRequirement
-from .v3 import SecurityScheme as SecurityScheme
-from .v3 import Server as Server
-from .v3 import ServerVariable as ServerVariable
-from .v3 import Tag as Tag
-from .v3 import parse_obj as parse_obj
-from .v3 import schema_validate as schema_validate
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
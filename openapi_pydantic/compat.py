@@ -1,5 +1,6 @@
 """Compatibility layer to make this package usable with Pydantic 1 or 2."""
 
+import sys
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from pydantic.version import VERSION as PYDANTIC_VERSION
@@ -14,6 +15,7 @@ __all__ = [
     "v1_schema",
     "DEFS_KEY",
     "min_length_arg",
+    "ReferenceUnion",
 ]
 
 PYDANTIC_MAJOR_VERSION = int(PYDANTIC_VERSION.split(".", 1)[0])
@@ -31,6 +33,7 @@ if TYPE_CHECKING:
 
     def ConfigDict(
         extra: Literal["allow", "ignore", "forbid"] = "allow",
+        defer_build: bool = False,
         json_schema_extra: Optional[Dict[str, Any]] = None,
         populate_by_name: bool = True,
     ) -> PydanticConfigDict:
@@ -77,6 +80,9 @@ if TYPE_CHECKING:
         """Generate a min_length or min_items parameter for Field(...)."""
         ...
 
+    # a union of a `Reference` class and other types, discriminated by "$ref"
+    from typing import Union as ReferenceUnion
+
 elif PYDANTIC_V2:
     from typing import TypedDict
 
@@ -93,6 +99,104 @@ elif PYDANTIC_V2:
         """Generate a min_length or min_items parameter for Field(...)."""
         return {"min_length": min_length}
 
+    if PYDANTIC_MINOR_VERSION >= 5:
+        from typing import Annotated, Any, Union
+
+        from pydantic import Discriminator, Tag
+
+        class ReferenceUnion:
+            """A union of a `Reference` class and other types, discriminated by "$ref".
+
+            `ReferenceUnion[Reference, Schema]` validates an object with a "$ref" as a
+            `Reference`, and any other object as a `Schema`, without trying both as a
+            smart `Union` does. The other types are a pydantic class or a `Dict`, and
+            optionally `bool`. A class with its own "$ref" field (`PathItem`) takes
+            precedence over the `Reference`, as with a smart `Union`.
+            """
+
+            def __class_getitem__(cls, members: Tuple[Any, ...]) -> Any:
+                """Create the discriminated union of some types.
+
+                :raises TypeError: if none of the types is a `Reference` class
+                """
+                references = _reference_classes()
+                reference = next(
+                    (member for member in members if member in references), None
+                )
+                if reference is None:
+                    raise TypeError(f"no Reference class in ReferenceUnion{members}")
+                own_ref = any(
+                    _has_ref_field(member)
+                    for member in members
+                    if member is not reference
+                )
+
+                def reference_tag(value: Any) -> str:
+                    """Get the tag of the member of the union to validate a value."""
+                    if isinstance(value, dict):
+                        if "$ref" in value and not own_ref:
+                            return "reference"
+                        return "object"
+                    if isinstance(value, reference):
+                        return "reference"
+                    return "bool" if isinstance(value, bool) else "object"
+
+                choices = tuple(
+                    Annotated[member, Tag(_member_tag(reference, member))]
+                    for member in members
+                )
+                return Annotated[
+                    Union[choices],
+                    Discriminator(reference_tag),
+                    _AnyOfJsonSchema(),
+                ]
+
+        def _reference_classes() -> Tuple[type, ...]:
+            """Get the `Reference` classes of the OpenAPI versions already imported.
+
+            The modules are looked up rather than imported, so that a version which
+            is not used is not built.
+            """
+            modules = (
+                sys.modules.get(f"openapi_pydantic.v3.{version}.reference")
+                for version in ("v3_0", "v3_1")
+            )
+            return tuple(
+                module.Reference
+                for module in modules
+                if module is not None and hasattr(module, "Reference")
+            )
+
+        def _has_ref_field(member: Any) -> bool:
+            """Check whether a member of a `ReferenceUnion` has its own "$ref" field."""
+            return isinstance(member, type) and any(
+                field.alias == "$ref"
+                for field in getattr(member, "model_fields", {}).values()
+            )
+
+        def _member_tag(reference: type, member: Any) -> str:
+            """Get the tag of a member of a `ReferenceUnion`."""
+            if member is reference:
+                return "reference"
+            return "bool" if member is bool else "object"
+
+        class _AnyOfJsonSchema:
+            """Keeps the "anyOf" JSON schema of a `ReferenceUnion`.
+
+            A discriminated union is a "oneOf" by default, but an object with a "$ref"
+            is also valid for the other types.
+            """
+
+            def __get_pydantic_json_schema__(self, schema: Any, handler: Any) -> Any:
+                """Rename the "oneOf" of the JSON schema to "anyOf"."""
+                json_schema = handler(schema)
+                if "oneOf" in json_schema:
+                    json_schema["anyOf"] = json_schema.pop("oneOf")
+                return json_schema
+
+    else:
+        from typing import Union as ReferenceUnion
+
     # Create V1 stubs. These should not be used when PYDANTIC_V2 is true.
     Extra = None
     v1_schema = None
@@ -114,6 +218,8 @@ else:
         """Generate a min_length or min_items parameter for Field(...)."""
         return {"min_items": min_length}
 
+    from typing import Union as ReferenceUnion
+
     # Create V2 stubs. These should not be used when PYDANTIC_V2 is false.
     ConfigDict = None
     models_json_schema = None
@@ -1,6 +1,18 @@
 import logging
 import re
-from typing import Any, Dict, Generic, List, Optional, Set, Type, TypeVar, cast
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from pydantic import BaseModel
 
@@ -11,6 +23,7 @@ from openapi_pydantic.compat import (
     models_json_schema,
     v1_schema,
 )
+from openapi_pydantic.v3.visitor import Transformer
 
 from . import Components, OpenAPI, Reference, Schema, schema_validate
 
@@ -20,6 +33,9 @@ PydanticType = TypeVar("PydanticType", bound=BaseModel)
 ref_prefix = "#/components/schemas/"
 ref_template = "#/components/schemas/{model}"
 
+SCHEMA_CACHE_SIZE = 1024
+"""Maximum number of cached JSON schema generations, see `clear_schema_cache`."""
+
 
 class PydanticSchema(Schema, Generic[PydanticType]):
     """Special `Schema` class to indicate a reference from pydantic class."""
@@ -45,14 +61,20 @@ def get_mode(
     return cast(JsonSchemaMode, mode)
 
 
-def construct_open_api_with_schema_class(
+def construct_open_api_with_schema_class(  # noqa: C901
     open_api: OpenAPI,
     schema_classes: Optional[List[Type[BaseModel]]] = None,
     scan_for_pydantic_schema_reference: bool = True,
     by_alias: bool = True,
+    in_place: bool = False,
+    copy_on_write: bool = False,
 ) -> OpenAPI:
     """Construct an OpenAPI object, utilising Pydantic classes to produce JSON schemas.
 
+    The JSON schema definitions are cached per class, and the `Schema` objects are
+    validated from them for each document, so they are not shared with the other
+    documents built from the same classes.
+
     :param open_api: the base `OpenAPI` object
     :param schema_classes: Pydantic classes that their schema will be used
                            "#/components/schemas" values
@@ -61,15 +83,21 @@ def construct_open_api_with_schema_class(
                                                is needed for "#/components/schemas"
                                                value updates
     :param by_alias: construct schema by alias (default is True)
+    :param in_place: update the given `open_api` object instead of returning
+                     a new one (default is False)
+    :param copy_on_write: only copy the objects which are updated, sharing
+                          every other object with the given `open_api`
+                          instead of deep copying it (default is False)
+
     :return: new OpenAPI object with "#/components/schemas" values updated.
              If there is no update in "#/components/schemas" values, the original
              `open_api` will be returned.
     """
-    copy_func = getattr(open_api, "model_copy" if PYDANTIC_V2 else "copy")
-    new_open_api: OpenAPI = copy_func(deep=True)
-
+    new_open_api = open_api
     if scan_for_pydantic_schema_reference:
-        extracted_schema_classes = _handle_pydantic_schema(new_open_api)
+        new_open_api, extracted_schema_classes = _handle_pydantic_schema(
+            open_api, in_place=in_place
+        )
         if schema_classes:
             schema_classes = list({*schema_classes, *extracted_schema_classes})
         else:
@@ -81,90 +109,166 @@ def construct_open_api_with_schema_class(
     schema_classes.sort(key=lambda x: x.__name__)
     logger.debug("schema_classes: %s", schema_classes)
 
+    if not in_place:
+        if copy_on_write:
+            new_open_api = _copy_model(new_open_api)
+            if new_open_api.components:
+                new_open_api.components = _copy_model(new_open_api.components)
+        else:
+            new_open_api = _copy_model(new_open_api, deep=True)
+
     # update new_open_api with new #/components/schemas
-    if PYDANTIC_V2:
-        _key_map, schema_definitions = models_json_schema(
-            [(c, get_mode(c)) for c in schema_classes],
-            by_alias=by_alias,
-            ref_template=ref_template,
-        )
-    else:
-        schema_definitions = v1_schema(
-            schema_classes, by_alias=by_alias, ref_prefix=ref_prefix
-        )
+    schema_definitions, schemas = _generate_schemas(schema_classes, by_alias)
 
     if not new_open_api.components:
         new_open_api.components = Components()
     if new_open_api.components.schemas:
         for existing_key in new_open_api.components.schemas:
-            if existing_key in schema_definitions[DEFS_KEY]:
+            if existing_key in schema_definitions:
                 logger.warning(
                     f'"{existing_key}" already exists in {ref_prefix}. '
                     f'The value of "{ref_prefix}{existing_key}" will be overwritten.'
                 )
-        new_open_api.components.schemas.update(_validate_schemas(schema_definitions))
+        new_open_api.components.schemas = {
+            **new_open_api.components.schemas,
+            **schemas,
+        }
     else:
-        new_open_api.components.schemas = _validate_schemas(schema_definitions)
+        new_open_api.components.schemas = schemas
     return new_open_api
 
 
-def _validate_schemas(schema_definitions: Dict[str, Any]) -> Dict[str, Schema]:
+def clear_schema_cache() -> None:
+    """Clear the cache of JSON schemas generated from Pydantic classes.
+
+    This is needed if a cached Pydantic class is modified, e.g. rebuilt with
+    different annotations.
+    """
+    _cached_definitions.cache_clear()
+
+
+def _generate_schemas(
+    schema_classes: List[Type[BaseModel]], by_alias: bool
+) -> Tuple[Dict[str, Any], Dict[str, Schema]]:
+    """Generate the JSON schema definitions of Pydantic classes.
+
+    The definitions are generated and cached per class, and only generated for all
+    the classes together if two classes give different definitions for the same name
+    (e.g. for a class used in both validation and serialization mode, Pydantic will
+    produce distinct names for each mode).
+
+    :param schema_classes: Pydantic classes to generate the definitions for
+    :param by_alias: construct schema by alias
+    :return: the JSON schema definitions and the new parsed `Schema` objects
+    """
+    schema_definitions: Dict[str, Any] = {}
+    for schema_class in schema_classes:
+        class_definitions = _cached_definitions(
+            ((schema_class, get_mode(schema_class)),),
+            by_alias,
+            ref_template,
+        )
+        if any(
+            schema_definitions.get(key, value) != value
+            for key, value in class_definitions.items()
+        ):
+            schema_definitions = _cached_definitions(
+                tuple((c, get_mode(c)) for c in schema_classes),
+                by_alias,
+                ref_template,
+            )
+            break
+        schema_definitions.update(class_definitions)
+    if PYDANTIC_V2:
+        # Pydantic 2 sorts the definitions by name
+        schema_definitions = dict(sorted(schema_definitions.items()))
+    return schema_definitions, _validate_schemas(schema_definitions)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _cached_definitions(
+    schema_classes: Tuple[Tuple[Type[BaseModel], JsonSchemaMode], ...],
+    by_alias: bool,
+    ref_template: str,
+) -> Dict[str, Any]:
+    """Generate the JSON schema definitions of Pydantic classes.
+
+    The returned definitions are shared by every caller, and must not be mutated.
+    """
+    if PYDANTIC_V2:
+        _key_map, schema_definitions = models_json_schema(
+            list(schema_classes),
+            by_alias=by_alias,
+            ref_template=ref_template,
+        )
+    else:
+        schema_definitions = v1_schema(
+            [c for c, _mode in schema_classes],
+            by_alias=by_alias,
+            ref_prefix=ref_template.format(model=""),
+        )
+    definitions: Dict[str, Any] = schema_definitions[DEFS_KEY]
+    return definitions
+
+
+def _validate_schemas(
+    schema_definitions: Dict[str, Any],
+) -> Dict[str, Schema]:
     """Convert JSON Schema definitions to parsed OpenAPI objects."""
     # Note: if an error occurs in schema_validate(), it may indicate that
     # the generated JSON schemas are not compatible with the version
     # of OpenAPI this module depends on.
     return {
         key: schema_validate(schema_dict)
-        for key, schema_dict in schema_definitions[DEFS_KEY].items()
+        for key, schema_dict in schema_definitions.items()
     }
 
 
-def _handle_pydantic_schema(open_api: OpenAPI) -> List[Type[BaseModel]]:  # noqa: C901
+def _handle_pydantic_schema(
+    open_api: OpenAPI, in_place: bool = True
+) -> Tuple[OpenAPI, List[Type[BaseModel]]]:
     """This function traverses the `OpenAPI` object and.
 
     1. Replaces the `PydanticSchema` object with `Reference` object, with correct ref
        value;
     2. Extracts the involved schema class from `PydanticSchema` object.
 
-    **This function will mutate the input `OpenAPI` object.**
+    **This function will mutate the input `OpenAPI` object if `in_place` is True.**
+    Otherwise only the objects containing a `PydanticSchema` are copied, and all
+    other objects are shared between the input and the returned `OpenAPI` object.
 
-    :param open_api: the `OpenAPI` object to be traversed and mutated
-    :return: a list of schema classes extracted from `PydanticSchema` objects
+    :param open_api: the `OpenAPI` object to be traversed
+    :param in_place: flag to indicate if the input `OpenAPI` object is mutated
+    :return: the updated `OpenAPI` object and a list of schema classes extracted
+             from `PydanticSchema` objects
     """
-    pydantic_types: Set[Type[BaseModel]] = set()
+    transformer = _PydanticSchemaTransformer()
+    new_open_api = transformer.transform(open_api, in_place=in_place)
+    return new_open_api, list(transformer.schema_classes)
 
-    def _traverse(obj: Any) -> None:
-        if isinstance(obj, BaseModel):
-            fields = getattr(
-                obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__"
-            )
-            for field in fields:
-                child_obj = obj.__getattribute__(field)
-                if isinstance(child_obj, PydanticSchema):
-                    logger.debug("PydanticSchema found in %s: %s", obj, child_obj)
-                    obj.__setattr__(field, _construct_ref_obj(child_obj))
-                    pydantic_types.add(child_obj.schema_class)
-                else:
-                    _traverse(child_obj)
-        elif isinstance(obj, list):
-            for index, elem in enumerate(obj):
-                if isinstance(elem, PydanticSchema):
-                    logger.debug(f"PydanticSchema found in list: {elem}")
-                    obj[index] = _construct_ref_obj(elem)
-                    pydantic_types.add(elem.schema_class)
-                else:
-                    _traverse(elem)
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, PydanticSchema):
-                    logger.debug(f"PydanticSchema found in dict: {value}")
-                    obj[key] = _construct_ref_obj(value)
-                    pydantic_types.add(value.schema_class)
-                else:
-                    _traverse(value)
-
-    _traverse(open_api)
-    return list(pydantic_types)
+
+class _PydanticSchemaTransformer(Transformer):
+    """Replaces the `PydanticSchema` objects with `Reference` objects."""
+
+    def __init__(self) -> None:
+        """Create a transformer without extracted schema classes."""
+        self.schema_classes: Set[Type[BaseModel]] = set()
+        """The classes of the replaced `PydanticSchema` objects."""
+
+    def visit_PydanticSchema(
+        self, obj: PydanticSchema[PydanticType], pointer: str
+    ) -> Reference:
+        """Replace a `PydanticSchema` object, extracting its class."""
+        logger.debug("PydanticSchema found: %s", obj)
+        self.schema_classes.add(obj.schema_class)
+        return _construct_ref_obj(obj)
+
+
+def _copy_model(obj: PydanticType, **kwargs: Any) -> PydanticType:
+    """Copy a pydantic object, shallow by default."""
+    copy_func = getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")
+    new_obj: PydanticType = copy_func(**kwargs)
+    return new_obj
 
 
 def _construct_ref_obj(pydantic_schema: PydanticSchema[PydanticType]) -> Reference:
@@ -1,36 +1,115 @@
-"""OpenAPI V3 schema interface utilizing Pydantic."""
-
-from .parser import parse_obj as parse_obj
-from .v3_1 import XML as XML
-from .v3_1 import Callback as Callback
-from .v3_1 import Components as Components
-from .v3_1 import Contact as Contact
-from .v3_1 import DataType as DataType
-from .v3_1 import Discriminator as Discriminator
-from .v3_1 import Encoding as Encoding
-from .v3_1 import Example as Example
-from .v3_1 import ExternalDocumentation as ExternalDocumentation
-from .v3_1 import Header as Header
-from .v3_1 import Info as Info
-from .v3_1 import License as License
-from .v3_1 import Link as Link
-from .v3_1 import MediaType as MediaType
-from .v3_1 import OAuthFlow as OAuthFlow
-from .v3_1 import OAuthFlows as OAuthFlows
-from .v3_1 import OpenAPI as OpenAPI
-from .v3_1 import Operation as Operation
-from .v3_1 import Parameter as Parameter
-from .v3_1 import ParameterLocation as ParameterLocation
-from .v3_1 import PathItem as PathItem
-from .v3_1 import Paths as Paths
-from .v3_1 import Reference as Reference
-from .v3_1 import RequestBody as RequestBody
-from .v3_1 import Response as Response
-from .v3_1 import Responses as Responses
-from .v3_1 import Schema as Schema
-from .v3_1 import SecurityRequirement as SecurityRequirement
-from .v3_1 import SecurityScheme as SecurityScheme
-from .v3_1 import Server as Server
-from .v3_1 import ServerVariable as ServerVariable
-from .v3_1 import Tag as Tag
-from .v3_1 import schema_validate as schema_validate
+"""OpenAPI V3 schema interface utilizing Pydantic.
+
+The names are imported on first access, so that importing the package does not
+build the classes of a version which is not used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .loader import load as load
+    from .parser import parse_json as parse_json
+    from .parser import parse_obj as parse_obj
+    from .trusted import parse_trusted as parse_trusted
+    from .v3_1 import XML as XML
+    from .v3_1 import Callback as Callback
+    from .v3_1 import Components as Components
+    from .v3_1 import Contact as Contact
+    from .v3_1 import DataType as DataType
+    from .v3_1 import Discriminator as Discriminator
+    from .v3_1 import Encoding as Encoding
+    from .v3_1 import Example as Example
+    from .v3_1 import ExternalDocumentation as ExternalDocumentation
+    from .v3_1 import Header as Header
+    from .v3_1 import Info as Info
+    from .v3_1 import License as License
+    from .v3_1 import Link as Link
+    from .v3_1 import MediaType as MediaType
+    from .v3_1 import OAuthFlow as OAuthFlow
+    from .v3_1 import OAuthFlows as OAuthFlows
+    from .v3_1 import OpenAPI as OpenAPI
+    from .v3_1 import Operation as Operation
+    from .v3_1 import Parameter as Parameter
+    from .v3_1 import ParameterLocation as ParameterLocation
+    from .v3_1 import PathItem as PathItem
+    from .v3_1 import Paths as Paths
+    from .v3_1 import Reference as Reference
+    from .v3_1 import RequestBody as RequestBody
+    from .v3_1 import Response as Response
+    from .v3_1 import Responses as Responses
+    from .v3_1 import Schema as Schema
+    from .v3_1 import SecurityRequirement as SecurityRequirement
+    from .v3_1 import SecurityScheme as SecurityScheme
+    from .v3_1 import Server as Server
+    from .v3_1 import ServerVariable as ServerVariable
+    from .v3_1 import Tag as Tag
+    from .v3_1 import schema_validate as schema_validate
+    from .warmup import warmup as warmup
+
+_MODULES: Dict[str, str] = {
+    "load": ".loader",
+    "parse_json": ".parser",
+    "parse_obj": ".parser",
+    "parse_trusted": ".trusted",
+    "warmup": ".warmup",
+    **dict.fromkeys(
+        (
+            "XML",
+            "Callback",
+            "Components",
+            "Contact",
+            "DataType",
+            "Discriminator",
+            "Encoding",
+            "Example",
+            "ExternalDocumentation",
+            "Header",
+            "Info",
+            "License",
+            "Link",
+            "MediaType",
+            "OAuthFlow",
+            "OAuthFlows",
+            "OpenAPI",
+            "Operation",
+            "Parameter",
+            "ParameterLocation",
+            "PathItem",
+            "Paths",
+            "Reference",
+            "RequestBody",
+            "Response",
+            "Responses",
+            "Schema",
+            "SecurityRequirement",
+            "SecurityScheme",
+            "Server",
+            "ServerVariable",
+            "Tag",
+            "schema_validate",
+        ),
+        ".v3_1",
+    ),
+}
+"""The module of each name of the package (the 3.1 classes by default)."""
+
+_PACKAGES = ("v3_0", "v3_1")
+
+__all__ = sorted({*_MODULES, *_PACKAGES})
+
+
+def __getattr__(name: str) -> Any:
+    """Import a name of the package, or a version package, on first access."""
+    if name in _PACKAGES:
+        return import_module(f".{name}", __name__)
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the names of the package, including the names not imported yet."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,71 @@
+import weakref
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+_updates = 0
+_frozen: Dict[int, "weakref.ref[BaseModel]"] = {}
+
+
+class OpenAPIModel(BaseModel):
+    """Base class of the OpenAPI classes of both versions.
+
+    The updates of the fields of the objects (e.g. `operation.operationId = "x"`)
+    are counted, so that the caches derived from a document (e.g. the cached
+    `operation_index()`) are checked in constant time.
+    """
+
+    if not PYDANTIC_V2:
+        # the caches of an object are kept until the object is collected
+        __slots__ = ("__weakref__",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and count the update.
+
+        :raises TypeError: if the object is read-only, see `freeze`
+        """
+        if id(self) in _frozen:
+            raise TypeError(f"{type(self).__name__} object is read-only")
+        _count_update()
+        super().__setattr__(name, value)
+
+
+def freeze(obj: BaseModel) -> None:
+    """Make an OpenAPI object read-only, e.g. an object shared by `intern_schemas`.
+
+    Setting a field of the object raises a `TypeError` afterwards. The dicts and
+    lists it holds (e.g. the `properties` of a `Schema`) are not frozen, and the
+    copies of the object are not read-only.
+    """
+    key = id(obj)
+    if key not in _frozen:
+        _frozen[key] = weakref.ref(obj, lambda ref: _thaw(key, ref))
+
+
+def is_frozen(obj: BaseModel) -> bool:
+    """Check whether an OpenAPI object is read-only, see `freeze`."""
+    return id(obj) in _frozen
+
+
+def update_count() -> int:
+    """Get the number of updates of OpenAPI objects, in any document.
+
+    The count changes when a field of an OpenAPI object is set, or when a
+    `LazyDict` gets entries set or removed. The updates of the other dicts and lists
+    (e.g. `open_api.paths["/pets"] = path_item`) are not counted.
+    """
+    return _updates
+
+
+def _count_update() -> None:
+    """Count an update of an OpenAPI object."""
+    global _updates
+    _updates += 1
+
+
+def _thaw(key: int, ref: "weakref.ref[BaseModel]") -> None:
+    """Forget a read-only object which is garbage collected."""
+    if _frozen.get(key) is ref:
+        del _frozen[key]
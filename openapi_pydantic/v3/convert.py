@@ -0,0 +1,524 @@
+import operator
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import chain
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .lazy import fields, value_validator
+
+_Path = Optional[Tuple[Any, Any]]
+
+_SCALARS = frozenset({str, int, float, bool})
+_CONTAINERS = (BaseModel, dict, list)
+# the keywords of a schema which do not restrict its values
+_ANNOTATIONS = frozenset(
+    {
+        "title",
+        "description",
+        "default",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "examples",
+        "externalDocs",
+        "xml",
+    }
+)
+
+
+def upgrade_to_3_1(open_api: v3_0.OpenAPI) -> v3_1.OpenAPI:
+    """Convert an OpenAPI 3.0 document to OpenAPI 3.1.
+
+    The objects are converted to their 3.1 classes directly, without serializing
+    the document and validating it again. The `openapi` version becomes "3.1.1",
+    and the `Schema` objects are updated to JSON Schema 2020-12:
+
+    - `nullable: true` adds "null" to the `type` and `None` to the `enum`, or, for a
+      schema without `type` (e.g. an `allOf` with a `$ref`), wraps the schema in an
+      `anyOf` with a "null" schema
+    - boolean `exclusiveMinimum` and `exclusiveMaximum` become the `minimum` and
+      `maximum` they apply to
+    - `example` becomes `examples`
+    - `format: binary` (file uploads) becomes
+      `contentMediaType: application/octet-stream`, and `format: byte` becomes
+      `contentEncoding: base64`
+
+    The component schemas defined with a `Reference` become a `Schema` with a
+    `$ref`, and the other objects keep their values. The objects shared by several
+    parts of the document (e.g. by `intern_schemas`) are converted once, and are
+    shared by the new document.
+
+    :param open_api: the 3.0 `OpenAPI` object, which is not modified. The values
+                     of its `LazyDict` fields are validated.
+    :return: the 3.1 `OpenAPI` object
+    """
+    return cast(v3_1.OpenAPI, _Upgrader().convert(open_api))
+
+
+class LossyConstruct(NamedTuple):
+    """A value of a document which has no equivalent in the target version."""
+
+    pointer: str
+    """The JSON pointer of the object holding the value, e.g. "#/info"."""
+
+    keyword: str
+    """The key of the value in the object, e.g. "summary"."""
+
+
+class Downgrade(NamedTuple):
+    """The result of `downgrade_to_3_0`."""
+
+    open_api: v3_0.OpenAPI
+    """The 3.0 `OpenAPI` object."""
+
+    lossy: List[LossyConstruct]
+    """The values which were dropped, in document order."""
+
+
+def downgrade_to_3_0(open_api: v3_1.OpenAPI) -> Downgrade:
+    """Convert an OpenAPI 3.1 document to OpenAPI 3.0, for 3.0-only consumers.
+
+    The objects are converted to their 3.0 classes in a single pass over the
+    document, which also collects the values 3.0 cannot express. The `openapi`
+    version becomes "3.0.4", and the `Schema` objects are updated when 3.0 has an
+    equivalent:
+
+    - a "null" `type` becomes `nullable: true`
+    - numeric `exclusiveMinimum` and `exclusiveMaximum` become a `minimum` and
+      `maximum` with a boolean flag
+    - `const` becomes an `enum` of one value, and `examples` becomes `example`
+    - `contentMediaType` becomes `format: binary`, and `contentEncoding: base64`
+      becomes `format: byte`
+    - a `$ref` becomes a `Reference`, or an `allOf` item if the schema has other
+      keywords
+
+    The other values which are not in 3.0 are dropped and reported as lossy, e.g.
+    the `webhooks`, and the `prefixItems` or `if`/`then`/`else` of schemas. The
+    objects shared by several parts of the document are converted (and reported)
+    once.
+
+    :param open_api: the 3.1 `OpenAPI` object, which is not modified. The values
+                     of its `LazyDict` fields are validated.
+    :return: the 3.0 `OpenAPI` object, and the dropped values
+    """
+    downgrader = _Downgrader()
+    downgraded = cast(v3_0.OpenAPI, downgrader.convert(open_api))
+    return Downgrade(downgraded, downgrader.lossy)
+
+
+class _Converter:
+    """Converts objects to the classes of another OpenAPI version.
+
+    The objects of each class are converted to the class with the same name in the
+    target package, and their values are converted recursively. Subclasses update
+    the values of each object with `update`.
+    """
+
+    target: ModuleType
+
+    def __init__(self) -> None:
+        """Create a converter without converted objects."""
+        self._converted: Dict[int, BaseModel] = {}
+
+    def convert(self, value: Any, path: _Path = None) -> Any:
+        """Convert a value and its children.
+
+        The children are converted before their parent, without recursion, so deep
+        documents do not hit the recursion limit.
+
+        :param path: the location of the value in the document
+        """
+        result: Dict[Any, Any] = {}
+        # (value, path, converted children of the parent, key in the parent), or,
+        # once the children of the value are pushed, the same with the converted
+        # children of the value
+        stack: List[Tuple[Any, ...]] = [(value, path, result, None)]
+        while stack:
+            frame = stack.pop()
+            if len(frame) == 5:
+                value, path, parent, key, converted = frame
+                parent[key] = self._convert_container(value, path, converted)
+                continue
+            value, path, parent, key = frame
+            if isinstance(value, BaseModel) and id(value) in self._converted:
+                parent[key] = self._converted[id(value)]
+                continue
+            children = _children(value)
+            if children is None:
+                parent[key] = self._convert_value(value)
+                continue
+            converted = {}
+            stack.append((value, path, parent, key, converted))
+            stack.extend(
+                (child, (path, name), converted, child_key)
+                for child_key, name, child in reversed(children)
+            )
+        return result[None]
+
+    def update(
+        self, cls: Type[BaseModel], values: Dict[str, Any], path: _Path
+    ) -> Type[BaseModel]:
+        """Update the converted values of an object, before creating the new object.
+
+        :param cls: the class of the new object, in the target version
+        :param values: the values of the set fields by name, and the extra values
+        :param path: the location of the object in the document
+        :return: the class of the new object, usually `cls`
+        """
+        return cls
+
+    def _convert_value(self, value: Any) -> Any:
+        """Convert a value which is not a pydantic object, list or dict."""
+        if value is None or type(value) in _SCALARS:
+            return value
+        if isinstance(value, Enum) and hasattr(self.target, type(value).__name__):
+            try:
+                return getattr(self.target, type(value).__name__)(value.value)
+            except ValueError:
+                # a value missing from the target version, left to `update`
+                return value
+        return value
+
+    def _convert_container(
+        self, value: Any, path: _Path, converted: Dict[Any, Any]
+    ) -> Any:
+        """Convert a pydantic object, list or dict.
+
+        :param converted: the converted children holding objects, by field name,
+                          list index or dict key
+        """
+        if isinstance(value, BaseModel):
+            new_obj = self._convert_model(value, path, converted)
+            # the objects are kept alive by the converted document, so their ids
+            # identify them until the conversion is done
+            self._converted[id(value)] = new_obj
+            return new_obj
+        if isinstance(value, dict):
+            return {
+                key: converted[key] if key in converted else self._convert_value(item)
+                for key, item in value.items()
+            }
+        return [
+            converted[i] if i in converted else self._convert_value(item)
+            for i, item in enumerate(value)
+        ]
+
+    def _convert_model(
+        self, obj: BaseModel, path: _Path, converted: Dict[Any, Any]
+    ) -> BaseModel:
+        """Convert a pydantic object to the class of the target version.
+
+        :param converted: the converted children holding objects, by field name
+        """
+        cls: Type[BaseModel] = getattr(self.target, type(obj).__name__)
+        source_fields = _aliases(type(obj))
+        target_fields = _field_names(cls)
+        fields_set = _fields_set(obj)
+        values: Dict[str, Any] = {}
+        # in Pydantic 2, the extra values are not in __dict__
+        extra = getattr(obj, "model_extra", None) or {}
+        for key, value in chain(obj.__dict__.items(), extra.items()):
+            if key not in fields_set:
+                continue
+            if key in converted:
+                values[key] = converted[key]
+            elif key in source_fields:
+                values[key] = self._convert_value(value)
+            elif key in target_fields:
+                # an extra value which is a field of the target class, e.g. a
+                # "const" in a 3.0 schema
+                name = target_fields[key]
+                values[name] = value_validator(cls, name)(value)
+            else:
+                values[key] = value
+        return _create(self.update(cls, values, path), values)
+
+
+class _Upgrader(_Converter):
+    """Converts OpenAPI 3.0 objects to OpenAPI 3.1."""
+
+    target = v3_1
+
+    def update(
+        self, cls: Type[BaseModel], values: Dict[str, Any], path: _Path
+    ) -> Type[BaseModel]:
+        """Update the converted values of an object to OpenAPI 3.1."""
+        if cls is v3_1.Schema:
+            _upgrade_schema(values)
+        elif cls is v3_1.OpenAPI:
+            values["openapi"] = "3.1.1"
+        elif cls is v3_1.Components and values.get("schemas"):
+            # a 3.1 component schema is a `Schema`, which can have a `$ref`
+            values["schemas"] = {
+                key: _create(v3_1.Schema, {"$ref": value.ref})
+                if isinstance(value, v3_1.Reference)
+                else value
+                for key, value in values["schemas"].items()
+            }
+        return cls
+
+
+class _Downgrader(_Converter):
+    """Converts OpenAPI 3.1 objects to OpenAPI 3.0, collecting the lossy values."""
+
+    target = v3_0
+
+    def __init__(self) -> None:
+        """Create a converter without converted objects."""
+        super().__init__()
+        self.lossy: List[LossyConstruct] = []
+
+    def update(
+        self, cls: Type[BaseModel], values: Dict[str, Any], path: _Path
+    ) -> Type[BaseModel]:
+        """Update the converted values of an object to OpenAPI 3.0."""
+        ref = values.pop("$ref", None) if cls is v3_0.Schema else None
+        if cls is v3_0.Schema:
+            _downgrade_schema(values, partial(self._report, path))
+        elif cls is v3_0.OpenAPI:
+            values["openapi"] = "3.0.4"
+            values.setdefault("paths", {})
+        elif cls is v3_0.Operation:
+            values.setdefault("responses", {})
+            self._drop_callback_references(values, path, allow_references=False)
+        elif cls is v3_0.Components:
+            self._drop_callback_references(values, path, allow_references=True)
+        elif cls is v3_0.OAuthFlow:
+            values.setdefault("scopes", {})
+        self._drop_unknown(cls, values, path)
+        return cls if ref is None else _downgrade_ref(values, ref)
+
+    def _drop_unknown(
+        self, cls: Type[BaseModel], values: Dict[str, Any], path: _Path
+    ) -> None:
+        """Drop the values which are not fields of a class or extensions."""
+        names = _field_names(cls)
+        aliases = _aliases(getattr(v3_1, cls.__name__))
+        for key in [key for key in values if key not in names]:
+            if not key.startswith("x-"):
+                self._report(path, aliases.get(key, key))
+                del values[key]
+
+    def _drop_callback_references(
+        self, values: Dict[str, Any], path: _Path, allow_references: bool
+    ) -> None:
+        """Drop the `Reference` objects of callbacks, which 3.0 does not allow.
+
+        :param allow_references: flag to indicate if a callback can be a `Reference`
+        """
+        callbacks: Dict[str, Any] = values.get("callbacks") or {}
+        callbacks_path = (path, "callbacks")
+        for name, callback in list(callbacks.items()):
+            if isinstance(callback, v3_0.Reference):
+                if not allow_references:
+                    self._report(callbacks_path, name)
+                    del callbacks[name]
+                continue
+            for expression, item in list(callback.items()):
+                if isinstance(item, v3_0.Reference):
+                    self._report((callbacks_path, name), expression)
+                    del callback[expression]
+
+    def _report(self, path: _Path, keyword: str) -> None:
+        """Report a value of an object which is dropped."""
+        self.lossy.append(LossyConstruct(_pointer(path), keyword))
+
+
+def _upgrade_schema(values: Dict[str, Any]) -> None:
+    """Update the values of a 3.0 `Schema` to JSON Schema 2020-12."""
+    nullable = values.pop("nullable", None)
+    for exclusive, bound in (
+        ("exclusiveMinimum", "minimum"),
+        ("exclusiveMaximum", "maximum"),
+    ):
+        if values.get(exclusive) is True and values.get(bound) is not None:
+            values[exclusive] = values.pop(bound)
+        elif isinstance(values.get(exclusive), bool):
+            del values[exclusive]
+    if "example" in values:
+        example = values.pop("example")
+        values.setdefault("examples", [example])
+    schema_format = values.get("schema_format")
+    if schema_format == "binary":
+        values["contentMediaType"] = "application/octet-stream"
+        del values["schema_format"]
+    elif schema_format == "byte":
+        values["contentEncoding"] = "base64"
+        del values["schema_format"]
+    if nullable:
+        _upgrade_nullable(values)
+
+
+def _upgrade_nullable(values: Dict[str, Any]) -> None:
+    """Allow the null value in the values of a 3.1 `Schema`, as `nullable` did."""
+    enum = values.get("enum")
+    if enum is not None and None not in enum:
+        values["enum"] = [*enum, None]
+    if values.get("type") is not None:
+        values["type"] = [values["type"], v3_1.DataType.NULL]
+    elif any(
+        key not in _ANNOTATIONS and key != "enum" and not key.startswith("x-")
+        for key in values
+    ):
+        # e.g. an `allOf` with a `$ref`, which does not allow null by itself
+        schema = _create(v3_1.Schema, dict(values))
+        values.clear()
+        values["anyOf"] = [schema, _create(v3_1.Schema, {"type": v3_1.DataType.NULL})]
+
+
+def _downgrade_schema(values: Dict[str, Any], report: Callable[[str], None]) -> None:
+    """Update the values of a 3.1 `Schema` to OpenAPI 3.0.
+
+    :param report: the function called with the keywords which are dropped
+    """
+    _downgrade_type(values, report)
+    _downgrade_bounds(values)
+    if "const" in values:
+        if "enum" in values:
+            report("const")
+        else:
+            values["enum"] = [values["const"]]
+        del values["const"]
+    examples = values.pop("examples", None)
+    if examples:
+        if "example" in values or len(examples) > 1:
+            report("examples")
+        values.setdefault("example", examples[0])
+    if values.pop("contentEncoding", None) == "base64":
+        values.setdefault("schema_format", "byte")
+    if values.pop("contentMediaType", None) is not None:
+        values.setdefault("schema_format", "binary")
+
+
+def _downgrade_type(values: Dict[str, Any], report: Callable[[str], None]) -> None:
+    """Convert the "null" type of a 3.1 `Schema` to `nullable`."""
+    types = values.get("type")
+    if not isinstance(types, list):
+        types = [] if types is None else [types]
+    others = [name for name in types if name != "null"]
+    if len(others) < len(types):
+        values["nullable"] = True
+    if len(others) > 1 or not others and types:
+        # 3.0 has no "null" type, and no list of types
+        report("type")
+        del values["type"]
+    elif others:
+        values["type"] = others[0]
+
+
+def _downgrade_bounds(values: Dict[str, Any]) -> None:
+    """Convert the numeric exclusive bounds of a 3.1 `Schema` to boolean flags."""
+    for exclusive, bound, tighter in (
+        ("exclusiveMinimum", "minimum", operator.ge),
+        ("exclusiveMaximum", "maximum", operator.le),
+    ):
+        limit = values.pop(exclusive, None)
+        if limit is not None and (
+            values.get(bound) is None or tighter(limit, values[bound])
+        ):
+            values[bound] = limit
+            values[exclusive] = True
+
+
+def _downgrade_ref(values: Dict[str, Any], ref: str) -> Type[BaseModel]:
+    """Convert the `$ref` of a 3.1 `Schema` to a 3.0 `Reference`.
+
+    :return: `Reference` if the schema has no other keywords, else `Schema` with
+             the `Reference` as the first `allOf` item
+    """
+    if not values:
+        values["ref"] = ref
+        return v3_0.Reference
+    # the keywords next to a `$ref` are ignored in 3.0
+    reference = _create(v3_0.Reference, {"ref": ref})
+    values["allOf"] = [reference, *values.get("allOf", ())]
+    return v3_0.Schema
+
+
+def _create(cls: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """Create a pydantic object from converted values, as if they were all set.
+
+    In Pydantic 2, validating the values is faster than constructing the object
+    without validation, and the pydantic objects among them are used as is. In
+    Pydantic 1, they would be copied, so the object is constructed instead.
+    """
+    create = getattr(cls, "model_validate" if PYDANTIC_V2 else "construct")
+    obj: BaseModel = create(values) if PYDANTIC_V2 else create(set(values), **values)
+    return obj
+
+
+def _fields_set(obj: BaseModel) -> Any:
+    """Get the names of the fields which were set on a pydantic object."""
+    return getattr(obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__")
+
+
+def _children(value: Any) -> Optional[List[Tuple[Any, Any, Any]]]:
+    """Get the (name, key, value) of the children of a value which can hold objects.
+
+    The names are the field names, the list indexes or the dict keys, and the keys
+    are the names as in the document (the field aliases). Only the fields of
+    pydantic objects which are set are read, and not their extra values.
+
+    :return: the children which are pydantic objects, lists or dicts, or `None` if
+             the value is not one of them
+    """
+    if isinstance(value, BaseModel):
+        aliases = _aliases(type(value))
+        fields_set = _fields_set(value)
+        values = value.__dict__
+        return [
+            (name, aliases[name], child)
+            for name, child in values.items()
+            if name in aliases and name in fields_set and isinstance(child, _CONTAINERS)
+        ]
+    items: Iterable[Tuple[Any, Any]]
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return None
+    return [(key, key, child) for key, child in items if isinstance(child, _CONTAINERS)]
+
+
+@lru_cache(maxsize=None)
+def _aliases(cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map the field names of a pydantic class to their aliases."""
+    return {name: field.alias or name for name, field in fields(cls).items()}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map the field names and aliases of a pydantic class to the field names."""
+    names = {}
+    for name, field in fields(cls).items():
+        names[name] = name
+        if field.alias:
+            names[field.alias] = name
+    return names
+
+
+def _pointer(path: _Path) -> str:
+    """Convert the location of a value in a document to a JSON pointer."""
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+    return "".join(["#", *(f"/{key}" for key in reversed(keys))])
@@ -0,0 +1,115 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .resolver import get_ref
+
+DISPATCH_CACHE_SIZE = 1024
+"""Maximum number of cached dispatch tables, see `dispatch_table`."""
+
+_SCHEMAS_PREFIX = "#/components/schemas/"
+
+
+class DispatchTable:
+    """Maps the discriminator values of a schema to its `oneOf` (or `anyOf`) schemas.
+
+    The values are the keys of the `mapping` of the `Discriminator`, and the names
+    of the component schemas referenced by the `oneOf` schemas (the implicit
+    mapping) which are not targets of the `mapping`. Selecting the schema of a
+    payload is then a dict lookup, instead of trying each schema.
+    """
+
+    def __init__(self, schema: Any) -> None:
+        """Build the table of a schema with a `discriminator`.
+
+        :param schema: a `Schema` (3.0 or 3.1)
+        :raises ValueError: if the schema has no `discriminator`
+        """
+        discriminator = getattr(schema, "discriminator", None)
+        if discriminator is None:
+            raise ValueError("The schema has no discriminator")
+        self.property_name: str = discriminator.propertyName
+        """The name of the property holding the discriminator value."""
+        self.branches: List[Any] = list(schema.oneOf or schema.anyOf or ())
+        """The `oneOf` (or else `anyOf`) schemas, as in the schema."""
+        self.refs: Dict[str, str] = {}
+        """The reference of the schema of each discriminator value."""
+        self.indexes: Dict[str, int] = {}
+        """The index in `branches` of the schema of each discriminator value."""
+
+        for value, target in (discriminator.mapping or {}).items():
+            # the mapping values are references or schema names
+            self.refs[value] = target if "/" in target else _SCHEMAS_PREFIX + target
+        mapped = set(self.refs.values())
+        positions: Dict[str, int] = {}
+        for index, branch in enumerate(self.branches):
+            ref = get_ref(branch)
+            if ref is None:
+                continue
+            positions.setdefault(ref, index)
+            if ref.startswith(_SCHEMAS_PREFIX) and ref not in mapped:
+                name = ref[len(_SCHEMAS_PREFIX) :]
+                self.refs.setdefault(name.replace("~1", "/").replace("~0", "~"), ref)
+        self.indexes = {
+            value: positions[ref]
+            for value, ref in self.refs.items()
+            if ref in positions
+        }
+
+    def value(self, payload: Any) -> Optional[str]:
+        """Get the discriminator value of a payload (a decoded JSON object)."""
+        if isinstance(payload, dict):
+            value = payload.get(self.property_name)
+            if isinstance(value, str):
+                return value
+        return None
+
+    def index(self, payload: Any) -> Optional[int]:
+        """Get the index in `branches` of the schema of a payload, if it is mapped."""
+        value = self.value(payload)
+        return None if value is None else self.indexes.get(value)
+
+    def select(self, payload: Any) -> Optional[Any]:
+        """Get the `oneOf` (or `anyOf`) schema of a payload, if it is mapped.
+
+        :return: the schema as in `branches`, often a `Reference` to resolve
+        """
+        index = self.index(payload)
+        return None if index is None else self.branches[index]
+
+
+_tables: "OrderedDict[int, Tuple[Any, DispatchTable]]" = OrderedDict()
+_tables_lock = threading.Lock()
+
+
+def dispatch_table(schema: Any) -> Optional[DispatchTable]:
+    """Get the cached `DispatchTable` of a schema.
+
+    The tables are cached per schema object (up to `DISPATCH_CACHE_SIZE` tables).
+    A table is a snapshot of the schema: call `clear_dispatch_cache()` if a cached
+    schema is modified.
+
+    :param schema: a `Schema` (3.0 or 3.1)
+    :return: the table, or `None` if the schema has no `discriminator`
+    """
+    if getattr(schema, "discriminator", None) is None:
+        return None
+    key = id(schema)
+    with _tables_lock:
+        cached = _tables.get(key)
+        # the schema is kept in the cache, so its id is not reused while cached
+        if cached is not None and cached[0] is schema:
+            _tables.move_to_end(key)
+            return cached[1]
+    table = DispatchTable(schema)
+    with _tables_lock:
+        _tables[key] = (schema, table)
+        if len(_tables) > DISPATCH_CACHE_SIZE:
+            _tables.popitem(last=False)
+    return table
+
+
+def clear_dispatch_cache() -> None:
+    """Clear the cache of dispatch tables."""
+    with _tables_lock:
+        _tables.clear()
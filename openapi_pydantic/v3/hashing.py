@@ -0,0 +1,209 @@
+import json
+import weakref
+from functools import lru_cache
+from hashlib import sha256
+from operator import is_
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .lazy import fields
+from .visitor import child_fields
+
+_NODES = (BaseModel, dict, list)
+# the attributes of the set fields and of the extra fields, not the properties
+_FIELDS_SET = "__pydantic_fields_set__" if PYDANTIC_V2 else "__fields_set__"
+_EXTRA = "__pydantic_extra__"
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+_State = Tuple[Optional[Tuple[Any, ...]], Tuple[Any, ...], List[Any]]
+
+
+class _Memo:
+    """The digest of a pydantic object, dict or list, with the values it is from."""
+
+    __slots__ = ("keys", "values", "children", "digest")
+
+    def __init__(
+        self, state: _State, children: Tuple["_Memo", ...], digest: bytes
+    ) -> None:
+        self.keys, self.values, _nodes = state
+        self.children = children
+        self.digest = digest
+
+    def is_current(self, state: _State, children: Tuple["_Memo", ...]) -> bool:
+        """Check whether an object has the same values, and the same children."""
+        keys, values, _nodes = state
+        # the memos are compared by identity
+        return (
+            self.children == children
+            and self.keys == keys
+            and len(self.values) == len(values)
+            and all(map(is_, self.values, values))
+        )
+
+
+# the memos of the objects of each hashed document, by object id. The memos keep
+# the values of the objects, so the ids of the memoized objects are not reused.
+_documents: Dict[int, Tuple["weakref.ref[Any]", Dict[int, _Memo]]] = {}
+
+
+def content_hash(obj: Any) -> str:
+    """Get the SHA-256 hash of the canonical form of an OpenAPI object (3.0 or 3.1).
+
+    The canonical form is the content written by `to_json_bytes()` (the field
+    aliases, without the unset fields nor `None` values), with sorted keys: it
+    does not depend on the order of the keys, nor on the version of Pydantic. The
+    hash can be used as an ETag, or to detect changes between deployments.
+
+    The hash of each object is computed from the hashes of its children (a Merkle
+    tree), and memoized per document. When the hash of an updated document is
+    computed again, the objects are checked by identity, and only the updated
+    objects and the objects containing them are encoded and hashed again. The
+    hashes of the last hashed document are also reused for a new document, e.g. a
+    copy-on-write update (with a `Transformer`) sharing its unchanged objects.
+
+    :param obj: a pydantic object, list or dict
+    :return: the hexadecimal hash
+    :raises TypeError: if the object is not a pydantic object, list or dict
+    """
+    if not isinstance(obj, _NODES):
+        raise TypeError(f"Cannot hash a {type(obj).__name__}")
+    key = id(obj)
+    document = _documents.pop(key, None)
+    if document is None or document[0]() is not obj:
+        # e.g. a copy-on-write update of the last hashed document
+        document = next(reversed(_documents.values()), None)
+    memos = _hash(obj, document[1] if document else {})
+    try:
+        ref = weakref.ref(obj, lambda ref: _forget(key, ref))
+    except TypeError:
+        # not memoized, e.g. for a dict, or a Pydantic 1 object of another class
+        pass
+    else:
+        _documents[key] = (ref, memos)
+    return memos[key].digest.hex()
+
+
+def _hash(obj: Any, memos: Dict[int, _Memo]) -> Dict[int, _Memo]:
+    """Hash an object and its children, without recursion.
+
+    :param obj: a pydantic object, list or dict
+    :param memos: the memos of the previous hash of the object
+    :return: the new memos of the object and its children
+    """
+    new_memos: Dict[int, _Memo] = {}
+    # (value, None), or, once its children are pushed, (value, state)
+    stack: List[Tuple[Any, Optional[_State]]] = [(obj, None)]
+    while stack:
+        value, state = stack.pop()
+        if state is None:
+            if id(value) not in new_memos:
+                state = _state(value)
+                stack.append((value, state))
+                stack.extend([(child, None) for child in state[2]])
+            continue
+        # the memos of the children, which are reused if they are current
+        children = tuple(map(new_memos.__getitem__, map(id, state[2])))
+        memo = memos.get(id(value))
+        if memo is None or not memo.is_current(state, children):
+            memo = _Memo(state, children, _encode(value, new_memos))
+        new_memos[id(value)] = memo
+    return new_memos
+
+
+def _state(value: Any) -> _State:
+    """Get the keys (which can change), the values, and the children of an object.
+
+    The children are the pydantic objects, dicts and lists to hash first: the
+    values of the fields holding pydantic objects (see `child_fields()`), and the
+    values of the dicts and lists. The other values are encoded as JSON.
+    """
+    if isinstance(value, BaseModel):
+        attributes = value.__dict__
+        fields_set = getattr(value, _FIELDS_SET)
+        children = _nodes(map(attributes.__getitem__, child_fields(type(value))))
+        extra = getattr(value, _EXTRA, None)
+        if extra:
+            keys = (len(fields_set), *extra)
+            return keys, (*attributes.values(), *extra.values()), children
+        return (len(fields_set),), tuple(attributes.values()), children
+    if isinstance(value, dict):
+        values = tuple(value.values())
+        return tuple(value), values, _nodes(values)
+    values = tuple(value)
+    return None, values, _nodes(values)
+
+
+def _nodes(values: Any) -> List[Any]:
+    """Get the pydantic objects, dicts and lists of some values."""
+    return [
+        value for value in values if value is not None and isinstance(value, _NODES)
+    ]
+
+
+def _encode(value: Any, memos: Dict[int, _Memo]) -> bytes:
+    """Hash the canonical encoding of a pydantic object, dict or list.
+
+    The encoding has the JSON values by key, and the digests of the children by
+    key, with sorted keys.
+    """
+    leaves: Dict[Any, Any] = {}
+    digests: Dict[Any, str] = {}
+    if isinstance(value, BaseModel):
+        nested = child_fields(type(value))
+        for name, alias, child in _model_items(value):
+            if name in nested and isinstance(child, _NODES):
+                digests[alias] = memos[id(child)].digest.hex()
+            else:
+                leaves[alias] = child
+    else:
+        items: Iterable[Tuple[Any, Any]] = (
+            value.items() if isinstance(value, dict) else enumerate(value)
+        )
+        for key, child in items:
+            if isinstance(child, _NODES):
+                digests[key] = memos[id(child)].digest.hex()
+            else:
+                leaves[key] = child
+    return _sha256(["a" if isinstance(value, list) else "o", leaves, digests])
+
+
+def _model_items(obj: BaseModel) -> List[Tuple[str, str, Any]]:
+    """Get the (name, key, value) of the values of a pydantic object.
+
+    The keys are the names as in the document. The fields which are not set or
+    `None` are skipped, except the version of the `OpenAPI` objects, as in
+    `to_json_bytes()`.
+    """
+    fields_set = getattr(obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__")
+    aliases = _aliases(type(obj))
+    items = [
+        (name, aliases.get(name, name), value)
+        for name, value in obj.__dict__.items()
+        if value is not None and (name in fields_set or name == "openapi")
+    ]
+    extra = getattr(obj, "model_extra", None)
+    if extra:
+        items.extend((name, name, value) for name, value in extra.items())
+    return items
+
+
+def _sha256(value: Any) -> bytes:
+    """Hash a value as compact JSON, with sorted keys."""
+    return sha256(_ENCODER.encode(value).encode()).digest()
+
+
+@lru_cache(maxsize=None)
+def _aliases(cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map the field names of a pydantic class to their aliases."""
+    return {name: field.alias for name, field in fields(cls).items() if field.alias}
+
+
+def _forget(key: int, ref: "weakref.ref[Any]") -> None:
+    """Drop the memos of a garbage collected document."""
+    document = _documents.get(key)
+    if document is not None and document[0] is ref:
+        del _documents[key]
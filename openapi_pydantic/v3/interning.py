@@ -0,0 +1,195 @@
+import sys
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .base import freeze
+from .lazy import LazyDict
+
+INTERNED_CLASSES: FrozenSet[Type[BaseModel]] = frozenset(
+    {
+        v3_1.Schema,
+        v3_1.Reference,
+        v3_1.Discriminator,
+        v3_1.XML,
+        v3_0.Schema,
+        v3_0.Reference,
+        v3_0.Discriminator,
+        v3_0.XML,
+    }
+)
+"""Classes whose equal objects are replaced by a shared object."""
+
+_SHARED = object()
+_SCALARS = frozenset({str, int, float, bool})
+
+
+class InternReport(NamedTuple):
+    """Summary of an interning pass."""
+
+    nodes: int
+    """Number of objects of the `INTERNED_CLASSES` visited."""
+
+    interned: int
+    """Number of objects replaced by an equal shared object."""
+
+    bytes_saved: int
+    """
+    Estimated memory no longer used by the replaced objects (excluding the strings
+    and numbers they hold, which are often shared anyway).
+    """
+
+
+def intern_schemas(obj: BaseModel) -> InternReport:
+    """Replace the equal schema objects of a document with shared objects.
+
+    The `INTERNED_CLASSES` are `Schema`, `Reference`, `Discriminator` and `XML`.
+    Generated documents often repeat the same small schemas many times
+    (e.g. `{"type": "string", "format": "uuid"}`), which are parsed into separate
+    objects. Objects are equal if they have the same class, values and set
+    fields, so that interning does not change how the document is serialized.
+
+    **This function mutates the given object.** The objects of the
+    `INTERNED_CLASSES` are read-only afterwards (see `freeze`), as updating a
+    shared object would update it everywhere it is used: setting their fields
+    raises a `TypeError`, and the dicts and lists they hold must not be mutated
+    either. Replace them with updated copies instead. The values of a `LazyDict`
+    which are not validated yet are skipped.
+
+    :param obj: the `OpenAPI` object (or any of its children)
+    :return: the number of objects interned and the estimated memory saved
+    """
+    interner = Interner()
+    interner.intern(obj)
+    return interner.report()
+
+
+class Interner:
+    """Table of the shared objects of one or more interning passes.
+
+    Using the same `Interner` for several objects shares equal objects between
+    them, e.g. between the entries of a document parsed one at a time.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        self._table: Dict[Hashable, BaseModel] = {}
+        self._nodes = 0
+        self._interned = 0
+        self._bytes_saved = 0
+
+    def report(self) -> InternReport:
+        """Summarize the interning passes so far."""
+        return InternReport(self._nodes, self._interned, self._bytes_saved)
+
+    def intern(self, value: Any) -> Any:
+        """Intern the children of a value, and the value itself.
+
+        :return: the shared object equal to the value, or the value
+        """
+        new_value, _key = self._visit(value)
+        return new_value
+
+    def _visit(self, value: Any) -> Tuple[Any, Hashable]:
+        """Intern a value and get its key, equal for equal values."""
+        if isinstance(value, BaseModel):
+            return self._visit_model(value)
+        if isinstance(value, list):
+            keys = []
+            for i, item in enumerate(value):
+                new_item, item_key = self._visit(item)
+                if new_item is not item:
+                    value[i] = new_item
+                keys.append(item_key)
+            return value, (list, tuple(keys))
+        if isinstance(value, dict):
+            return value, (dict, self._visit_items(value))
+        try:
+            hash(value)
+        except TypeError:
+            return value, (type(value), id(value))
+        # the type distinguishes e.g. True from 1
+        return value, (type(value), value)
+
+    def _visit_items(self, values: Dict[Any, Any]) -> Tuple[Hashable, ...]:
+        """Intern the values of a dict, and get the (name, value key) pairs."""
+        pending = values.pending if isinstance(values, LazyDict) else frozenset()
+        keys: List[Tuple[Any, Hashable]] = []
+        # not values.items(), which validates the pending values of a `LazyDict`
+        for name, child in dict.items(values):
+            if name in pending:
+                keys.append((name, (LazyDict, id(values))))
+                continue
+            if child is None:
+                # most fields are unset, the set fields are part of the key
+                continue
+            if type(child) in _SCALARS:
+                keys.append((name, (type(child), child)))
+                continue
+            new_child, child_key = self._visit(child)
+            if new_child is not child:
+                dict.__setitem__(values, name, new_child)
+            keys.append((name, child_key))
+        return tuple(keys)
+
+    def _visit_model(self, obj: BaseModel) -> Tuple[Any, Hashable]:
+        """Intern the children of a pydantic object, and the object itself."""
+        key: Hashable = (
+            type(obj),
+            self._visit_items(obj.__dict__),
+            # in Pydantic 2, the extra values are not in __dict__
+            self._visit_items(getattr(obj, "model_extra", None) or {}),
+            frozenset(_fields_set(obj)),
+        )
+        if type(obj) not in INTERNED_CLASSES:
+            return obj, key
+        self._nodes += 1
+        shared = self._table.setdefault(key, obj)
+        if shared is obj:
+            freeze(obj)
+        else:
+            self._interned += 1
+            self._bytes_saved += _owned_size(obj)
+        # the shared object is kept in the table, so its id identifies it
+        return shared, (_SHARED, id(shared))
+
+
+def _fields_set(obj: BaseModel) -> Any:
+    """Get the names of the fields which were set on a pydantic object."""
+    return getattr(obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__")
+
+
+def _owned_size(value: Any) -> int:
+    """Estimate the memory used by a value, excluding the objects it shares.
+
+    For pydantic objects, this is the object with its attribute dicts, and the
+    lists and dicts of its fields. Strings, numbers and child pydantic objects are
+    not counted.
+    """
+    if isinstance(value, BaseModel):
+        size = sys.getsizeof(value) + sys.getsizeof(value.__dict__)
+        size += sys.getsizeof(_fields_set(value))
+        extra = getattr(value, "__pydantic_extra__", None)
+        if extra is not None:
+            size += _owned_size(extra)
+        values: Iterable[Any] = value.__dict__.values()
+    elif isinstance(value, dict):
+        size, values = sys.getsizeof(value), value.values()
+    elif isinstance(value, list):
+        size, values = sys.getsizeof(value), value
+    else:
+        return 0
+    return size + sum(_owned_size(v) for v in values if isinstance(v, (list, dict)))
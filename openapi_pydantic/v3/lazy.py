@@ -0,0 +1,305 @@
+import threading
+from copy import deepcopy
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .base import _count_update
+
+_V = TypeVar("_V")
+
+_MISSING: Any = object()
+
+
+class LazyDict(Dict[str, _V]):
+    """A dict which validates its values on first access.
+
+    The dict is created with the raw values (decoded JSON, or JSON text), and each
+    value is validated and cached the first time it is read. Reading a value is
+    thread-safe: concurrent first reads of a key validate it only once.
+
+    Reading all the values at once, e.g. with `items()`, `values()`, `==` or when
+    serializing the object containing the dict, validates every pending value.
+    """
+
+    def __init__(self, raw: Mapping[str, Any], validator: Callable[[Any], _V]) -> None:
+        """Create a dict of raw values.
+
+        :param raw: the raw values
+        :param validator: the function converting a raw value to a validated value
+        """
+        super().__init__(raw)
+        self._validator = validator
+        self._pending = set(raw)
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> FrozenSet[str]:
+        """The keys whose value has not been validated yet."""
+        return frozenset(self._pending)
+
+    def materialize(self) -> None:
+        """Validate every pending value."""
+        for key in list(self._pending):
+            self[key]
+
+    def __getitem__(self, key: str) -> _V:
+        """Get a value, validating it on first access."""
+        if key in self._pending:
+            with self._lock:
+                if key in self._pending:
+                    value = self._validator(super().__getitem__(key))
+                    super().__setitem__(key, value)
+                    self._pending.discard(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        """Set a validated value."""
+        _count_update()
+        with self._lock:
+            super().__setitem__(key, value)
+            self._pending.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a value."""
+        _count_update()
+        with self._lock:
+            super().__delitem__(key)
+            self._pending.discard(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        # overridden so that dict(), {**...} and dict.update() use __getitem__
+        return super().__iter__()
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override,unused-ignore]
+        """Get a value if the key exists, validating it on first access."""
+        return self[key] if key in self else default
+
+    def items(self) -> Any:
+        """Get the (key, value) pairs, validating every pending value."""
+        self.materialize()
+        return super().items()
+
+    def values(self) -> Any:
+        """Get the values, validating every pending value."""
+        self.materialize()
+        return super().values()
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        """Remove a value and return it validated."""
+        if key not in self:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[str, _V]:
+        """Remove the last (key, value) pair and return it validated."""
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Get a value, setting it first if the key does not exist."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Set validated values."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        """Remove all the values."""
+        _count_update()
+        with self._lock:
+            super().clear()
+            self._pending.clear()
+
+    def copy(self) -> "LazyDict[_V]":
+        """Get a shallow copy, without validating the pending values."""
+        with self._lock:
+            # not dict.copy(), which calls __getitem__ as __iter__ is overridden
+            raw = {key: super(LazyDict, self).__getitem__(key) for key in self.keys()}
+            new = LazyDict(raw, self._validator)
+            new._pending = set(self._pending)
+        return new
+
+    def __copy__(self) -> "LazyDict[_V]":
+        """Get a shallow copy, without validating the pending values."""
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "LazyDict[_V]":
+        """Get a deep copy, without validating the pending values."""
+        new = self.copy()
+        for key in new.keys():
+            dict.__setitem__(new, key, deepcopy(dict.__getitem__(new, key), memo))
+        return new
+
+    def __reduce__(self) -> Any:
+        """Pickle as a dict, validating every pending value."""
+        # the validator can't be pickled
+        return dict, (dict(self),)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with a mapping, validating every pending value."""
+        self.materialize()
+        if isinstance(other, LazyDict):
+            other.materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare with a mapping, validating every pending value."""
+        return not self == other
+
+    def __or__(self, other: Any) -> Any:
+        """Merge into a new dict, validating every pending value."""
+        return {**self, **other}
+
+    def __ror__(self, other: Any) -> Any:
+        """Merge into a new dict, validating every pending value."""
+        return {**other, **self}
+
+    def __ior__(self, other: Any) -> "LazyDict[_V]":  # type: ignore[override,misc,unused-ignore]
+        """Set validated values."""
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        """Represent the dict, validating every pending value."""
+        self.materialize()
+        return super().__repr__()
+
+
+def materialized(value: _V) -> _V:
+    """Validate every pending value of a `LazyDict`, returning the value as is."""
+    if isinstance(value, LazyDict):
+        value.materialize()
+    return value
+
+
+def materialize_fields(obj: BaseModel) -> None:
+    """Validate the pending values of every `LazyDict` field of a pydantic object."""
+    for value in obj.__dict__.values():
+        materialized(value)
+
+
+def make_lazy(
+    obj: BaseModel, name: str, raw: Optional[Mapping[str, Any]], json: bool = False
+) -> None:
+    """Replace the value of a `Dict` field of a pydantic object with a `LazyDict`.
+
+    :param obj: the pydantic object
+    :param name: the name of the field
+    :param raw: the raw values of the field, or None to leave it unset
+    :param json: flag to indicate if the raw values are JSON text
+    """
+    if raw is not None:
+        obj.__dict__[name] = LazyDict(raw, item_validator(type(obj), name, json))
+
+
+def fields(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the fields of a pydantic class."""
+    model_fields: Dict[str, Any] = getattr(
+        model, "model_fields" if PYDANTIC_V2 else "__fields__"
+    )
+    return model_fields
+
+
+def field_type(model: Type[BaseModel], name: str) -> Any:
+    """Get the type of a field of a pydantic class, without `Optional`."""
+    annotation = fields(model)[name].annotation
+    if get_origin(annotation) is Union:
+        args = tuple(arg for arg in get_args(annotation) if arg is not type(None))
+        annotation = args[0] if len(args) == 1 else Union[args]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def item_validator(
+    model: Type[BaseModel], name: str, json: bool = False
+) -> Callable[[Any], Any]:
+    """Get a function validating a value of the `Dict` field of a pydantic class.
+
+    :param model: the pydantic class
+    :param name: the name of the field
+    :param json: flag to indicate if the values to validate are JSON text
+    """
+    _key_type, value_type = get_args(field_type(model, name))
+    return _validator(value_type, json)
+
+
+@lru_cache(maxsize=None)
+def value_validator(model: Type[BaseModel], name: str) -> Callable[[Any], Any]:
+    """Get a function validating a raw value of a field of a pydantic class.
+
+    :param model: the pydantic class
+    :param name: the name of the field
+    """
+    return _validator(fields(model)[name].annotation, False)
+
+
+if TYPE_CHECKING:
+
+    def _validator(type_: Any, json: bool) -> Callable[[Any], Any]:
+        """Get a function validating a raw value or JSON text against a type."""
+        ...
+
+    def lazy_serializer(*names: str) -> Any:
+        """Create a serializer validating the `LazyDict` values of fields."""
+        ...
+
+elif PYDANTIC_V2:
+    from pydantic import TypeAdapter, field_serializer
+
+    def _validator(type_: Any, json: bool) -> Callable[[Any], Any]:
+        """Get a function validating a raw value or JSON text against a type."""
+        adapter = TypeAdapter(type_)
+        return adapter.validate_json if json else adapter.validate_python
+
+    def lazy_serializer(*names: str) -> Any:
+        """Create a serializer validating the `LazyDict` values of fields.
+
+        Pydantic reads the values of a dict without calling its methods when
+        serializing it, so they have to be validated first.
+        """
+        # no return annotation, so that the JSON schema of the fields is unchanged
+        return field_serializer(*names, mode="wrap")(
+            lambda self, value, handler: handler(materialized(value))
+        )
+
+else:
+    from functools import partial
+
+    from pydantic import parse_obj_as, parse_raw_as
+
+    def _validator(type_: Any, json: bool) -> Callable[[Any], Any]:
+        """Get a function validating a raw value or JSON text against a type."""
+        return partial(parse_raw_as if json else parse_obj_as, type_)
+
+    # Pydantic 1 serializes dicts with their `items()` method
+    lazy_serializer = None
+
+
+__all__: Tuple[str, ...] = ("LazyDict",)
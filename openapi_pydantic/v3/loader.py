@@ -0,0 +1,234 @@
+import codecs
+import json
+import os
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .interning import Interner
+from .lazy import field_type, fields, item_validator
+from .parser import (
+    LAZY_COMPONENTS,
+    LAZY_FIELDS,
+    OpenAPIv3,
+    _parse_lazy,
+    _version_model,
+    parse_obj,
+)
+
+STREAMED_FIELDS = ("paths", "webhooks")
+"""Top-level maps which are validated one entry at a time."""
+
+STREAMED_COMPONENTS = "components"
+"""Top-level object whose maps are validated one entry at a time."""
+
+_WHITESPACE = " \t\n\r"
+
+
+def load(  # noqa: C901
+    source: Union[str, "os.PathLike[str]", IO[bytes], IO[str]],
+    chunk_size: int = 1024 * 1024,
+    lazy: bool = False,
+    intern: bool = False,
+) -> OpenAPIv3:
+    """Load an OpenAPI JSON document from a file or stream, with version inference.
+
+    The document is read incrementally: each entry of the top-level `paths` and
+    `webhooks` maps and of the `components` maps is decoded and validated on its
+    own, so the raw document is never held in memory as a whole.
+
+    The entries can only be validated as they are read if the "openapi" key
+    comes before them in the document, otherwise they are validated at the end
+    (like `parse_obj`).
+
+    With `lazy=True`, the JSON text of each value of the `LAZY_FIELDS` and
+    `LAZY_COMPONENTS` maps (e.g. each `PathItem` of `paths`) is kept, and only
+    validated on first access.
+
+    :param source: a file path, or a binary or text stream
+    :param chunk_size: number of bytes or characters read from the stream at once
+    :param lazy: flag to indicate if the values of the lazy maps are validated
+                 on first access (default is False)
+    :param intern: flag to indicate if equal schema objects are replaced with
+                   shared objects as they are parsed, see `intern_schemas`
+                   (default is False)
+    :return: the parsed `OpenAPI` object
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            return load(stream, chunk_size, lazy, intern)
+    reader = _JsonReader(source, chunk_size)
+    interner = Interner() if intern else None
+
+    def validate(model: Type[BaseModel], name: str, value: Any) -> Any:
+        value = item_validator(model, name)(value)
+        return interner.intern(value) if interner else value
+
+    document: Dict[str, Any] = {}
+    model: Optional[Type[OpenAPIv3]] = None
+    streamed: Set[str] = set()
+    for key in reader.iter_keys():
+        if lazy and key in LAZY_FIELDS:
+            document[key] = dict(reader.iter_raw_items())
+        elif lazy and key == STREAMED_COMPONENTS:
+            document[key] = {
+                section: dict(reader.iter_raw_items())
+                if section in LAZY_COMPONENTS
+                else reader.read_value()
+                for section in reader.iter_keys()
+            }
+        elif model is not None and key in STREAMED_FIELDS and key in fields(model):
+            streamed.add(key)
+            document[key] = {
+                name: validate(model, key, value) for name, value in reader.iter_items()
+            }
+        elif model is not None and key == STREAMED_COMPONENTS:
+            streamed.add(key)
+            components_model = field_type(model, key)
+            document[key] = {
+                section: {
+                    name: validate(components_model, section, value)
+                    for name, value in reader.iter_items()
+                }
+                if section in fields(components_model)
+                else reader.read_value()
+                for section in reader.iter_keys()
+            }
+        else:
+            document[key] = reader.read_value()
+            if key == "openapi":
+                model = _version_model(document[key])
+    reader.read_end()
+    open_api = _parse_lazy(document, json=True) if lazy else parse_obj(document)
+    if interner:
+        # the values of the streamed maps are already interned
+        for name, value in open_api.__dict__.items():
+            if name not in streamed:
+                interner.intern(value)
+    return open_api
+
+
+class _JsonReader:
+    """Incremental reader of a JSON document from a stream."""
+
+    def __init__(self, stream: Union[IO[bytes], IO[str]], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read(self, size: int) -> bool:
+        """Append up to `size` more characters to the buffer, if not at the end."""
+        if self.eof:
+            return False
+        data = self.stream.read(size)
+        text = data if isinstance(data, str) else self.decoder.decode(data, not data)
+        if not data:
+            self.eof = True
+        if self.pos > len(self.buffer) // 2:
+            # drop the consumed part of the buffer
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        self.buffer += text
+        return True
+
+    def _next_char(self) -> str:
+        """Skip whitespace and get the next character, without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read(self.chunk_size):
+                raise json.JSONDecodeError("Unexpected end of data", self.buffer, 0)
+
+    def _expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self._next_char()
+        if char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self.buffer, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def _decode(self) -> Tuple[Any, int]:
+        """Decode the next JSON value, and get the position where it starts."""
+        self._next_char()
+        size = self.chunk_size
+        while True:
+            # reading more data may drop the start of the buffer, and move `pos`
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # the value may continue past the end of the buffer
+                if not self._read(size):
+                    raise
+                size *= 2
+                continue
+            # a number at the end of the buffer may continue past it
+            if end < len(self.buffer) or not self._read(size):
+                start, self.pos = self.pos, end
+                return value, start
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value."""
+        value, _start = self._decode()
+        return value
+
+    def read_raw(self) -> str:
+        """Get the JSON text of the next JSON value."""
+        _value, start = self._decode()
+        return self.buffer[start : self.pos]
+
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate over the keys of the next JSON object.
+
+        The value of each key must be consumed before getting the next key.
+        """
+        self._expect("{")
+        if self._next_char() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting a key", self.buffer, self.pos)
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the (key, decoded value) pairs of the next JSON object."""
+        for key in self.iter_keys():
+            yield key, self.read_value()
+
+    def iter_raw_items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the (key, JSON text of the value) pairs of the next object."""
+        for key in self.iter_keys():
+            yield key, self.read_raw()
+
+    def read_end(self) -> None:
+        """Check that there is nothing but whitespace left in the stream."""
+        try:
+            char = self._next_char()
+        except json.JSONDecodeError:
+            return
+        raise json.JSONDecodeError(f"Extra data: {char!r}", self.buffer, self.pos)
+
+
+__all__: Tuple[str, ...] = ("load",)
@@ -0,0 +1,174 @@
+import weakref
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .base import update_count
+from .router import HTTP_METHODS
+
+_INDEXED_FIELDS = ("paths", "webhooks")
+
+
+class OperationEntry(NamedTuple):
+    """An operation of a document, with the path item it is defined in."""
+
+    operation: Any
+    """The `Operation` object."""
+
+    method: str
+    """The lowercase HTTP method of the operation."""
+
+    path: str
+    """The path template, webhook name or callback expression of the path item."""
+
+    path_item: Any
+    """The `PathItem` defining the operation."""
+
+    pointer: str
+    """The JSON pointer of the operation, e.g. "#/paths/~1pets/get"."""
+
+
+class OperationIndex:
+    """Index of the operations of an OpenAPI document (3.0 or 3.1).
+
+    The operations of the paths, the webhooks and the callbacks of these
+    operations are indexed in one pass, by `operationId`, by (method, path) for
+    the paths, and by tag. Path items and callbacks defined with `$ref` are not
+    followed.
+
+    The index is a snapshot of the document: use `operation_index()` to get an
+    index which is rebuilt when the document is updated.
+    """
+
+    def __init__(self, open_api: BaseModel) -> None:
+        """Index the operations of a document.
+
+        :param open_api: the `OpenAPI` object
+        """
+        self._entries: List[OperationEntry] = []
+        self._by_id: Dict[str, OperationEntry] = {}
+        self._by_method_path: Dict[Tuple[str, str], OperationEntry] = {}
+        self._by_tag: Dict[str, List[OperationEntry]] = {}
+        self._updates = update_count()
+        self._maps = _indexed_maps(open_api)
+        self._lengths = tuple(len(paths or ()) for paths in self._maps)
+        for name, paths in zip(_INDEXED_FIELDS, self._maps):
+            for path, path_item in (paths or {}).items():
+                self._add(f"#/{name}", path, path_item)
+
+    def __len__(self) -> int:
+        """Get the number of operations."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[OperationEntry]:
+        """Iterate over the operations, in document order."""
+        return iter(self._entries)
+
+    def get(self, operation_id: str) -> Optional[OperationEntry]:
+        """Find the operation with an `operationId`.
+
+        :return: the operation, or `None` if no operation has this id. If several
+                 operations have the same id (which is not valid), the first one.
+        """
+        return self._by_id.get(operation_id)
+
+    def find(self, method: str, path: str) -> Optional[OperationEntry]:
+        """Find the operation of a method on a path template (of the paths).
+
+        :param method: the HTTP method (case-insensitive)
+        :param path: the path template, e.g. "/users/{userId}"
+        :return: the operation, or `None` if it does not exist
+        """
+        return self._by_method_path.get((method.lower(), path))
+
+    def with_tag(self, tag: str) -> List[OperationEntry]:
+        """Get the operations with a tag, in document order."""
+        return list(self._by_tag.get(tag, ()))
+
+    def _add(self, prefix: str, path: str, path_item: Any) -> None:
+        """Index the operations of a path item, and of their callbacks."""
+        values = getattr(path_item, "__dict__", {})
+        if "get" not in values:
+            # a `Reference` object
+            return
+        pointer = f"{prefix}/{_escape(path)}"
+        for method in HTTP_METHODS:
+            operation = values[method]
+            if operation is None:
+                continue
+            entry = OperationEntry(
+                operation, method, path, path_item, f"{pointer}/{method}"
+            )
+            self._entries.append(entry)
+            if prefix == "#/paths":
+                self._by_method_path.setdefault((method, path), entry)
+            if operation.operationId is not None:
+                self._by_id.setdefault(operation.operationId, entry)
+            for tag in operation.tags or ():
+                self._by_tag.setdefault(tag, []).append(entry)
+            for name, callback in (operation.callbacks or {}).items():
+                if isinstance(callback, dict):
+                    callback_prefix = f"{entry.pointer}/callbacks/{_escape(name)}"
+                    for expression, item in callback.items():
+                        self._add(callback_prefix, expression, item)
+
+
+_indexes: Dict[int, Tuple["weakref.ref[BaseModel]", OperationIndex]] = {}
+
+
+def operation_index(open_api: BaseModel) -> OperationIndex:
+    """Get the cached `OperationIndex` of a document.
+
+    The index is built on the first call, and rebuilt when a field of an OpenAPI
+    object is set (e.g. an `operationId`, or the `get` operation of a path item,
+    in any document, see `update_count()`), or when the `paths` or `webhooks` of
+    the document are replaced or get entries added or removed. This is checked in
+    constant time. Other updates of dicts and lists (e.g. replacing the value of a
+    path in `paths`, or adding a tag to the `tags` list of an operation) are not
+    detected: call `invalidate_operation_index()` after them.
+
+    :param open_api: the `OpenAPI` object
+    :return: the index of its operations
+    """
+    key = id(open_api)
+    cached = _indexes.get(key)
+    if cached is not None:
+        ref, index = cached
+        if ref() is open_api and _is_current(index, open_api):
+            return index
+    index = OperationIndex(open_api)
+    _indexes[key] = (weakref.ref(open_api, lambda ref: _forget(key, ref)), index)
+    return index
+
+
+def invalidate_operation_index(open_api: BaseModel) -> None:
+    """Drop the cached `OperationIndex` of a document, if any."""
+    _indexes.pop(id(open_api), None)
+
+
+def _forget(key: int, ref: "weakref.ref[BaseModel]") -> None:
+    """Drop the index of a garbage collected document."""
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] is ref:
+        del _indexes[key]
+
+
+def _indexed_maps(open_api: BaseModel) -> Tuple[Optional[Mapping[str, Any]], ...]:
+    """Get the maps of path items of a document."""
+    return tuple(getattr(open_api, name, None) for name in _INDEXED_FIELDS)
+
+
+def _is_current(index: OperationIndex, open_api: BaseModel) -> bool:
+    """Check whether a document was not updated since an index was built."""
+    if index._updates != update_count():
+        return False
+    maps = _indexed_maps(open_api)
+    return all(
+        new is old and (new is None or len(new) == length)
+        for new, old, length in zip(maps, index._maps, index._lengths)
+    )
+
+
+def _escape(name: str) -> str:
+    """Escape a name to use it in a JSON pointer."""
+    return name.replace("~", "~0").replace("/", "~1")
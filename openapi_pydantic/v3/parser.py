@@ -1,35 +1,283 @@
-from typing import TYPE_CHECKING, Any, Union
+import re
+from functools import lru_cache
+from importlib import import_module
+from json import loads
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, Union, get_args
 
 from pydantic import BaseModel, Field
 
 from openapi_pydantic.compat import PYDANTIC_V2
 
-from .v3_0 import OpenAPI as OpenAPIv3_0
-from .v3_1 import OpenAPI as OpenAPIv3_1
+from .lazy import field_type, fields, make_lazy
+
+if TYPE_CHECKING:
+    from .v3_0 import OpenAPI as OpenAPIv3_0
+    from .v3_1 import OpenAPI as OpenAPIv3_1
+
+    OpenAPIv3 = Union[OpenAPIv3_1, OpenAPIv3_0]
+
+_VERSION_PACKAGES = {"3.1": "v3_1", "3.0": "v3_0"}
+"""The package of the classes of each major.minor "openapi" version."""
+
+_VERSION_PATTERN = r'"openapi"\s*:\s*"([^"\\]*)"'
+_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_VERSION_RE: Dict[type, "re.Pattern[Any]"] = {
+    str: re.compile(_VERSION_PATTERN),
+    bytes: re.compile(_VERSION_PATTERN.encode()),
+}
+_STRING_RE: Dict[type, "re.Pattern[Any]"] = {
+    str: re.compile(_STRING_PATTERN, re.DOTALL),
+    bytes: re.compile(_STRING_PATTERN.encode(), re.DOTALL),
+}
+_SNIFF_LIMIT = 64 * 1024
+LAZY_FIELDS = ("paths",)
+"""Top-level maps whose values are validated on first access with `lazy=True`."""
+LAZY_COMPONENTS = (
+    "schemas",
+    "responses",
+    "parameters",
+    "examples",
+    "requestBodies",
+    "headers",
+    "securitySchemes",
+    "links",
+    "callbacks",
+    "pathItems",
+)
+"""`Components` maps whose values are validated on first access with `lazy=True`."""
+_TOKENS: Dict[type, Tuple[Any, ...]] = {
+    str: ("{", "[", "}", "]", '"'),
+    bytes: (b"{", b"[", b"}", b"]", b'"'),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the classes of both versions on first access to `OpenAPIv3`."""
+    if name == "OpenAPIv3":
+        return _open_api_union()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _open_api_union() -> Any:
+    """Get the union of the OpenAPI classes of both versions."""
+    from .v3_0 import OpenAPI as OpenAPIv3_0
+    from .v3_1 import OpenAPI as OpenAPIv3_1
+
+    return Union[OpenAPIv3_1, OpenAPIv3_0]
+
+
+@lru_cache(maxsize=None)
+def _version_models(prefix: str) -> Dict[str, "Type[OpenAPIv3]"]:
+    """Map the "openapi" versions of a major.minor version to its OpenAPI class.
+
+    The package of the version is imported on first use, so that parsing a 3.1
+    document does not import the 3.0 classes.
+    """
+    model = import_module(f".{_VERSION_PACKAGES[prefix]}", __package__).OpenAPI
+    fields = getattr(model, "model_fields" if PYDANTIC_V2 else "__fields__")
+    return dict.fromkeys(get_args(fields["openapi"].annotation), model)
+
+
+def _version_model(version: Any) -> "Optional[Type[OpenAPIv3]]":
+    """Get the OpenAPI class for an "openapi" version, if it is supported."""
+    if not isinstance(version, str) or version[:3] not in _VERSION_PACKAGES:
+        return None
+    return _version_models(version[:3]).get(version)
+
+
+def _sniff_version(data: Union[str, bytes, bytearray]) -> Optional[str]:
+    """Find the "openapi" version of a JSON document, without decoding it.
+
+    Only the "openapi" key of the top-level object is considered, keys with the same
+    name inside nested objects or strings are skipped. The key is only searched for
+    in the first `_SNIFF_LIMIT` characters, as finding it further in the document
+    costs more than letting Pydantic pick the version.
+
+    :return: the version, or None if it can't be found this way
+    """
+    kind = str if isinstance(data, str) else bytes
+    text: Any = data
+    for match in _VERSION_RE[kind].finditer(text, 0, _SNIFF_LIMIT):
+        # drop the strings before the key, to count the brackets enclosing it
+        prefix = _STRING_RE[kind].sub(kind(), text[: match.start()])
+        open_object, open_array, close_object, close_array, quote = _TOKENS[kind]
+        if quote in prefix:
+            # the key is inside a string
+            continue
+        depth = (
+            prefix.count(open_object)
+            + prefix.count(open_array)
+            - prefix.count(close_object)
+            - prefix.count(close_array)
+        )
+        if depth == 1:
+            version = match.group(1)
+            return str(version if kind is str else version.decode())
+    return None
+
+
+def _parse_lazy(data: Any, json: bool = False) -> "OpenAPIv3":
+    """Parse a raw object into an OpenAPI model, leaving the lazy maps raw.
+
+    :param data: the raw object
+    :param json: flag to indicate if the values of the `LAZY_FIELDS` and
+                 `LAZY_COMPONENTS` maps are JSON text instead of decoded JSON
+    :return: the `OpenAPI` object, with a `LazyDict` for each of the lazy maps
+    """
+    model = _version_model(data.get("openapi")) if isinstance(data, dict) else None
+    if model is None:
+        return parse_obj(data)
+    data, raw = _split_lazy(data, model, LAZY_FIELDS, json)
+    raw_components: Dict[str, Any] = {}
+    if isinstance(data.get("components"), dict):
+        data["components"], raw_components = _split_lazy(
+            data["components"], field_type(model, "components"), LAZY_COMPONENTS, json
+        )
+    open_api = parse_obj(data)
+    for name, values in raw.items():
+        make_lazy(open_api, name, values, json)
+    if open_api.components is not None:
+        for name, values in raw_components.items():
+            make_lazy(open_api.components, name, values, json)
+    return open_api
+
+
+def _intern(open_api: "OpenAPIv3") -> "OpenAPIv3":
+    """Replace the equal schema objects of a parsed document with shared objects."""
+    # imported on first use, as it imports the classes of both versions
+    from .interning import intern_schemas
+
+    intern_schemas(open_api)
+    return open_api
+
+
+def _split_lazy(
+    data: Dict[str, Any], model: Type[BaseModel], names: Tuple[str, ...], json: bool
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Replace the lazy maps of a raw object with empty maps.
+
+    :return: the updated copy of the raw object, and the raw lazy maps
+    """
+    model_fields = fields(model)
+    maps = {name: data[name] for name in names if isinstance(data.get(name), dict)}
+    raw = {name: values for name, values in maps.items() if name in model_fields}
+    data = {**data, **{name: {} for name in raw}}
+    if json:
+        # the maps which are not fields of this version are extra values
+        for name in maps.keys() - raw.keys():
+            data[name] = {key: loads(value) for key, value in maps[name].items()}
+    return data, raw
 
-OpenAPIv3 = Union[OpenAPIv3_1, OpenAPIv3_0]
 
 if TYPE_CHECKING:
 
-    def parse_obj(data: Any) -> OpenAPIv3:
-        """Parse a raw object into an OpenAPI model with version inference."""
+    def parse_obj(data: Any, lazy: bool = False, intern: bool = False) -> OpenAPIv3:
+        """Parse a raw object into an OpenAPI model with version inference.
+
+        With `lazy=True`, the values of the `LAZY_FIELDS` and `LAZY_COMPONENTS`
+        maps (e.g. each `PathItem` of `paths`) are validated on first access
+        instead. With `intern=True`, the equal schema objects are replaced with
+        shared read-only objects, see `intern_schemas`.
+        """
+        ...
+
+    def parse_json(
+        data: Union[str, bytes, bytearray], intern: bool = False
+    ) -> OpenAPIv3:
+        """Parse a JSON document into an OpenAPI model with version inference.
+
+        With `intern=True`, the equal schema objects are replaced with shared
+        read-only objects, see `intern_schemas`.
+        """
         ...
 
 elif PYDANTIC_V2:
-    from pydantic import RootModel
 
-    class _OpenAPI(RootModel):
-        root: OpenAPIv3 = Field(discriminator="openapi")
+    @lru_cache(maxsize=None)
+    def _root_model() -> Any:
+        """Get the model picking the version of a document by its "openapi" value."""
+        from pydantic import RootModel
+
+        OpenAPIv3 = _open_api_union()
 
-    def parse_obj(data: Any) -> OpenAPIv3:
-        """Parse a raw object into an OpenAPI model with version inference."""
-        return _OpenAPI.model_validate(data).root
+        class _OpenAPI(RootModel):
+            root: OpenAPIv3 = Field(discriminator="openapi")
+
+        return _OpenAPI
+
+    def parse_obj(data: Any, lazy: bool = False, intern: bool = False) -> "OpenAPIv3":
+        """Parse a raw object into an OpenAPI model with version inference.
+
+        With `lazy=True`, the values of the `LAZY_FIELDS` and `LAZY_COMPONENTS`
+        maps (e.g. each `PathItem` of `paths`) are validated on first access
+        instead. With `intern=True`, the equal schema objects are replaced with
+        shared read-only objects, see `intern_schemas`.
+        """
+        if intern:
+            return _intern(parse_obj(data, lazy))
+        if lazy:
+            return _parse_lazy(data)
+        model = _version_model(data.get("openapi")) if isinstance(data, dict) else None
+        if model is not None:
+            return model.model_validate(data)
+        return _root_model().model_validate(data).root
+
+    def parse_json(
+        data: Union[str, bytes, bytearray], intern: bool = False
+    ) -> "OpenAPIv3":
+        """Parse a JSON document into an OpenAPI model with version inference.
+
+        With `intern=True`, the equal schema objects are replaced with shared
+        read-only objects, see `intern_schemas`.
+        """
+        if intern:
+            return _intern(parse_json(data))
+        model = _version_model(_sniff_version(data))
+        if model is not None:
+            return model.model_validate_json(data)
+        return _root_model().model_validate_json(data).root
 
 else:
 
-    class _OpenAPI(BaseModel):
-        __root__: OpenAPIv3 = Field(discriminator="openapi")
+    @lru_cache(maxsize=None)
+    def _root_model() -> Any:
+        """Get the model picking the version of a document by its "openapi" value."""
+        OpenAPIv3 = _open_api_union()
+
+        class _OpenAPI(BaseModel):
+            __root__: OpenAPIv3 = Field(discriminator="openapi")
+
+        return _OpenAPI
+
+    def parse_obj(data: Any, lazy: bool = False, intern: bool = False) -> "OpenAPIv3":
+        """Parse a raw object into an OpenAPI model with version inference.
+
+        With `lazy=True`, the values of the `LAZY_FIELDS` and `LAZY_COMPONENTS`
+        maps (e.g. each `PathItem` of `paths`) are validated on first access
+        instead. With `intern=True`, the equal schema objects are replaced with
+        shared read-only objects, see `intern_schemas`.
+        """
+        if intern:
+            return _intern(parse_obj(data, lazy))
+        if lazy:
+            return _parse_lazy(data)
+        model = _version_model(data.get("openapi")) if isinstance(data, dict) else None
+        if model is not None:
+            return model.parse_obj(data)
+        return _root_model().parse_obj(data).__root__
+
+    def parse_json(
+        data: Union[str, bytes, bytearray], intern: bool = False
+    ) -> "OpenAPIv3":
+        """Parse a JSON document into an OpenAPI model with version inference.
 
-    def parse_obj(data: Any) -> OpenAPIv3:
-        """Parse a raw object into an OpenAPI model with version inference."""
-        return _OpenAPI.parse_obj(data).__root__
+        With `intern=True`, the equal schema objects are replaced with shared
+        read-only objects, see `intern_schemas`.
+        """
+        if intern:
+            return _intern(parse_json(data))
+        model = _version_model(_sniff_version(data))
+        if model is not None:
+            return model.parse_raw(data)
+        return _root_model().parse_raw(data).__root__
@@ -0,0 +1,148 @@
+from itertools import chain
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from urllib.parse import unquote
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .lazy import fields
+from .parser import OpenAPIv3
+from .resolver import get_ref
+from .visitor import child_fields
+
+OpenAPIType = TypeVar("OpenAPIType", bound=OpenAPIv3)
+
+_PATH_ITEM_CLASSES = (v3_1.PathItem, v3_0.PathItem)
+_DISCRIMINATOR_CLASSES = (v3_1.Discriminator, v3_0.Discriminator)
+_COMPONENTS_PREFIX = "#/components/"
+
+
+def prune_unused_components(
+    open_api: OpenAPIType, roots: Optional[Iterable[str]] = None
+) -> OpenAPIType:
+    """Remove the components which are not used by the rest of the document.
+
+    A component is used if it is referenced (directly or through other components)
+    from outside of the "components" object: by a `Reference` object, a `$ref` of
+    a `PathItem` or a `Schema` (or any other extra `$ref`), a discriminator mapping,
+    or a security requirement (for the security schemes). Each object of the
+    document is visited once.
+
+    This can be used after removing some paths (e.g. the paths with a given tag)
+    to remove the components they were the only ones to use.
+
+    :param open_api: the `OpenAPI` object to prune
+    :param roots: references to components to keep even if they are not used
+                  (e.g. `"#/components/schemas/Error"`), along with the components
+                  they use
+    :return: a new `OpenAPI` object with only the used components. The objects
+             which are not updated are shared with the given `open_api`.
+    """
+    components = open_api.components
+    if components is None:
+        return open_api
+    used = _used_components(open_api, components, roots or ())
+    updates = {}
+    for section, names in used.items():
+        values = getattr(components, section)
+        if values is not None and len(names) < len(values):
+            # not values.items(), which validates every value of a `LazyDict`
+            updates[section] = {key: values[key] for key in values if key in names}
+    if not updates:
+        return open_api
+    return cast(
+        OpenAPIType,
+        _copy_model(
+            open_api, update={"components": _copy_model(components, update=updates)}
+        ),
+    )
+
+
+def _used_components(
+    open_api: BaseModel, components: BaseModel, roots: Iterable[str]
+) -> Dict[str, Set[str]]:
+    """Find the names of the used components of each section."""
+    used: Dict[str, Set[str]] = {name: set() for name in fields(type(components))}
+    stack: List[Any] = [
+        value for name, value in open_api.__dict__.items() if name != "components"
+    ]
+
+    def use(ref: str) -> None:
+        """Mark a referenced component as used, and visit it."""
+        key = _component_key(ref)
+        if key is None or key[0] not in used or key[1] in used[key[0]]:
+            return
+        section, name = key
+        used[section].add(name)
+        values = getattr(components, section)
+        if values is not None and name in values:
+            stack.append(values[name])
+
+    # the roots, and the security schemes of the top-level security requirements
+    for ref in chain(roots, _references(open_api)):
+        use(ref)
+    seen: Set[int] = set()
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, BaseModel):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                for ref in _references(obj):
+                    use(ref)
+                children = obj.__dict__
+                stack.extend(children[name] for name in child_fields(type(obj)))
+        elif isinstance(obj, (dict, list)):
+            stack.extend(obj.values() if isinstance(obj, dict) else obj)
+    return used
+
+
+def _references(obj: BaseModel) -> Iterator[str]:
+    """Iterate over the references to components of a pydantic object."""
+    children = obj.__dict__
+    # a `$ref` field of a path item, or a `Reference` object or an extra `$ref`
+    ref = obj.ref if isinstance(obj, _PATH_ITEM_CLASSES) else get_ref(obj)
+    if ref:
+        yield ref
+    elif isinstance(obj, _DISCRIMINATOR_CLASSES) and obj.mapping:
+        for value in obj.mapping.values():
+            # the mapping values are references or schema names
+            yield value if "/" in value else f"{_COMPONENTS_PREFIX}schemas/{value}"
+    for requirement in children.get("security") or ():
+        for name in requirement:
+            yield f"{_COMPONENTS_PREFIX}securitySchemes/{_escape(name)}"
+
+
+def _component_key(ref: str) -> Optional[Tuple[str, str]]:
+    """Get the (section, name) of the component a reference points to, if any."""
+    if not ref.startswith(_COMPONENTS_PREFIX):
+        return None
+    if "%" in ref:
+        ref = unquote(ref)
+    section, _, name = ref[len(_COMPONENTS_PREFIX) :].partition("/")
+    name = name.partition("/")[0]
+    if not name:
+        return None
+    return section, name.replace("~1", "/").replace("~0", "~")
+
+
+def _escape(name: str) -> str:
+    """Escape a name to use it in a JSON pointer."""
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+def _copy_model(obj: Any, update: Dict[str, Any]) -> Any:
+    """Shallow copy a pydantic object, with updated fields."""
+    return getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")(update=update)
@@ -0,0 +1,196 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import unquote
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .lazy import LazyDict
+from .v3_0 import Reference as ReferenceV3_0
+from .v3_1 import Reference as ReferenceV3_1
+
+Reference = Union[ReferenceV3_1, ReferenceV3_0]
+
+
+class RefResolver:
+    """Resolves references against an OpenAPI document (3.0 or 3.1).
+
+    A JSON pointer index of every object, array and map in the document is built
+    once, so that looking up a pointer (e.g. "#/components/schemas/Pet" or
+    "#/paths/~1pets/get") does not walk the document again. References pointing to
+    other references are followed, and their final targets are memoized.
+
+    The values of a lazily parsed document which are not validated yet (see
+    `LazyDict`) are not indexed: a value is validated, and its children indexed,
+    when a pointer into it is looked up.
+
+    The index is a snapshot of the document: a new `RefResolver` has to be created
+    after the document is modified.
+    """
+
+    def __init__(self, open_api: BaseModel) -> None:
+        """Build the JSON pointer index of an OpenAPI document.
+
+        :param open_api: the `OpenAPI` object (or any of its children)
+                         the references are resolved against
+        """
+        self.open_api = open_api
+        self._index: Dict[str, Any] = _build_index(open_api)
+        self._resolved: Dict[str, Any] = {}
+
+    def __contains__(self, pointer: str) -> bool:
+        """Check whether a local JSON pointer exists in the document."""
+        try:
+            self.lookup(pointer)
+        except ValueError:
+            return False
+        return True
+
+    def lookup(self, pointer: str) -> Any:
+        """Get the value at a local JSON pointer, without following references.
+
+        :param pointer: a JSON pointer URI fragment, such as "#/components/schemas/Pet"
+        :return: the value at the pointer
+        :raises ValueError: if the pointer is not a local reference or does not exist
+        """
+        key = _normalize(pointer)
+        try:
+            return self._index[key]
+        except KeyError:
+            pass
+        # scalar values and pending values of a `LazyDict` are not indexed, but
+        # an ancestor is
+        names = key.split("/")
+        depth = len(names) - 1
+        # the root "#" is always indexed
+        while depth > 1 and "/".join(names[:depth]) not in self._index:
+            depth -= 1
+        key = "/".join(names[:depth])
+        value = self._index[key]
+        for name in names[depth:]:
+            value = _get_child(value, name.replace("~1", "/").replace("~0", "~"))
+            if value is None:
+                raise ValueError(f"Unresolvable reference: {pointer}")
+            key = f"{key}/{name}"
+            if isinstance(value, (BaseModel, list, dict)) and key not in self._index:
+                self._index.update(_build_index(value, key))
+        return value
+
+    def resolve(self, ref: Union[str, Reference]) -> Any:
+        """Get the object a reference points to, following chained references.
+
+        :param ref: a `Reference` object or its `$ref` value
+        :return: the first object in the chain of references which is not
+                 a `Reference` object
+        :raises ValueError: if a reference can't be resolved or is circular
+        """
+        pointer = ref if isinstance(ref, str) else ref.ref
+        try:
+            return self._resolved[pointer]
+        except KeyError:
+            pass
+        chain: List[str] = []
+        target: Any = pointer
+        while True:
+            if target in chain:
+                raise ValueError(f"Circular reference: {' -> '.join([*chain, target])}")
+            chain.append(target)
+            target = self.lookup(target)
+            if not isinstance(target, (ReferenceV3_1, ReferenceV3_0)):
+                break
+            target = target.ref
+            if target in self._resolved:
+                target = self._resolved[target]
+                break
+        for chained_pointer in chain:
+            self._resolved[chained_pointer] = target
+        return target
+
+
+def get_ref(obj: Any) -> Optional[str]:
+    """Get the `$ref` of a `Reference` object or of an OpenAPI 3.1 `Schema`.
+
+    In 3.1, a `Schema` can have a `$ref` along with other keywords. It is not a
+    field of the `Schema` class, but an extra value.
+
+    :return: the reference, or `None` if the object has none
+    """
+    if isinstance(obj, (ReferenceV3_1, ReferenceV3_0)):
+        return obj.ref
+    extra = getattr(obj, "model_extra" if PYDANTIC_V2 else "__dict__", None)
+    ref = extra.get("$ref") if extra else None
+    return ref if isinstance(ref, str) else None
+
+
+def _normalize(pointer: str) -> str:
+    """Convert a local reference to the key of the JSON pointer index."""
+    if not pointer.startswith("#"):
+        raise ValueError(f"Only local references are supported: {pointer}")
+    if "%" in pointer:
+        pointer = unquote(pointer)
+    if pointer != "#" and not pointer.startswith("#/"):
+        # e.g. a 3.1 "$anchor" reference
+        raise ValueError(f"Only JSON pointer references are supported: {pointer}")
+    return pointer.rstrip("/") if pointer != "#/" else "#"
+
+
+def _build_index(root: Any, pointer: str = "#") -> Dict[str, Any]:
+    """Map the JSON pointer of every pydantic object, list and dict to the value.
+
+    :param root: the value to index
+    :param pointer: the JSON pointer of the value
+    """
+    index: Dict[str, Any] = {}
+    stack: List[Tuple[str, Any]] = [(pointer, root)]
+    while stack:
+        pointer, obj = stack.pop()
+        index[pointer] = obj
+        for key, child in _iter_children(obj):
+            if isinstance(child, (BaseModel, list, dict)):
+                key = str(key).replace("~", "~0").replace("/", "~1")
+                stack.append((f"{pointer}/{key}", child))
+    return index
+
+
+def _iter_children(obj: Any) -> Iterator[Tuple[Any, Any]]:
+    """Iterate over the (key, value) pairs of a pydantic object, list or dict.
+
+    The keys of pydantic objects are the field aliases, as in the OpenAPI document.
+    The pending values of a `LazyDict` are skipped, so that they are not validated.
+    """
+    if isinstance(obj, BaseModel):
+        aliases = _field_aliases(type(obj))
+        for name, value in obj.__dict__.items():
+            if value is not None:
+                yield aliases.get(name, name), value
+        extra = getattr(obj, "model_extra", None)
+        if extra:
+            yield from extra.items()
+    elif isinstance(obj, LazyDict):
+        pending = obj.pending
+        yield from ((key, obj[key]) for key in obj if key not in pending)
+    elif isinstance(obj, dict):
+        yield from obj.items()
+    elif isinstance(obj, list):
+        yield from enumerate(obj)
+
+
+def _get_child(obj: Any, key: str) -> Any:
+    """Get the value of a key in a pydantic object, list or dict, if it exists."""
+    if isinstance(obj, list):
+        return obj[int(key)] if key.isdigit() and int(key) < len(obj) else None
+    if isinstance(obj, dict):
+        # only validates the value of the key, for a `LazyDict`
+        return obj.get(key)
+    for child_key, child in _iter_children(obj):
+        if child_key == key:
+            return child
+    return None
+
+
+@lru_cache(maxsize=None)
+def _field_aliases(cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map the field names of a pydantic class to their aliases."""
+    fields = getattr(cls, "model_fields" if PYDANTIC_V2 else "__fields__")
+    return {name: field.alias or name for name, field in fields.items()}
@@ -0,0 +1,157 @@
+import re
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import unquote
+
+from pydantic import BaseModel
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+"""The methods with an operation field in a `PathItem`, in the field order."""
+
+_TEMPLATE_EXPRESSION = re.compile(r"{([^{}/]+)}")
+
+
+class RouteMatch(NamedTuple):
+    """The path item and operation matching a request."""
+
+    path_item: Any
+    """The `PathItem` of the matching path template."""
+
+    operation: Any
+    """
+    The `Operation` of the request method, or `None` if the path item has no
+    operation for this method.
+    """
+
+    path_params: Dict[str, str]
+    """The (percent-decoded) values of the path template expressions."""
+
+
+class Router:
+    """Matches request paths to the path templates of an OpenAPI document.
+
+    The path templates are split into segments and stored in a trie. A request
+    path is matched in one walk of the trie, trying the concrete segments before
+    the templated ones (e.g. "/users/me" before "/users/{userId}"), so the time
+    taken depends on the depth of the path rather than the number of paths.
+
+    The `PathItem` objects are only looked up when a path matches, so the paths of
+    a lazily parsed document are not validated by building a router.
+    """
+
+    def __init__(self, paths: Optional[Mapping[str, Any]]) -> None:
+        """Build the trie of path templates.
+
+        :param paths: the `Paths` of an `OpenAPI` object
+        """
+        self._paths: Mapping[str, Any] = paths or {}
+        self._static: Dict[str, str] = {}
+        self._root = _Node()
+        for template in self._paths:
+            if _TEMPLATE_EXPRESSION.search(template) is None:
+                self._static.setdefault(template, template)
+            else:
+                self._root.add(template.split("/"), template)
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        """Find the path item and operation matching a request.
+
+        :param method: the HTTP method of the request (case-insensitive)
+        :param path: the request path, relative to the server URL and without
+                     the query string (e.g. "/users/42/orders/7")
+        :return: the match, or `None` if no path template matches the path
+        """
+        template = self._static.get(path)
+        params: List[Tuple[str, str]] = []
+        if template is None:
+            template = self._root.find(path.split("/"), 0, params)
+            if template is None:
+                return None
+        path_item = self._paths[template]
+        method = method.lower()
+        operation = getattr(path_item, method) if method in HTTP_METHODS else None
+        return RouteMatch(
+            path_item, operation, {name: unquote(value) for name, value in params}
+        )
+
+
+def compile_router(open_api: BaseModel) -> Router:
+    """Build a `Router` matching request paths to the paths of a document.
+
+    :param open_api: the `OpenAPI` object (3.0 or 3.1)
+    :return: the router, a snapshot of the paths of the document
+    """
+    return Router(getattr(open_api, "paths", None))
+
+
+class _Node:
+    """A node of the path template trie, for one segment of the templates."""
+
+    __slots__ = ("static", "patterns", "params", "template")
+
+    def __init__(self) -> None:
+        """Create a node without children."""
+        self.static: Dict[str, _Node] = {}
+        # segments mixing text and expressions, e.g. "{name}.json"
+        self.patterns: Dict[str, Tuple[Pattern[str], List[str], _Node]] = {}
+        # segments with a single expression, by name
+        self.params: Dict[str, _Node] = {}
+        self.template: Optional[str] = None
+
+    def add(self, segments: List[str], template: str) -> None:
+        """Add the remaining segments of a path template below this node."""
+        node = self
+        for segment in segments:
+            names = _TEMPLATE_EXPRESSION.findall(segment)
+            if not names:
+                node = node.static.setdefault(segment, _Node())
+            elif segment == f"{{{names[0]}}}":
+                node = node.params.setdefault(names[0], _Node())
+            else:
+                if segment not in node.patterns:
+                    node.patterns[segment] = (_compile(segment), names, _Node())
+                node = node.patterns[segment][2]
+        if node.template is None:
+            node.template = template
+
+    def find(
+        self, segments: List[str], index: int, params: List[Tuple[str, str]]
+    ) -> Optional[str]:
+        """Find the template matching the remaining segments of a path.
+
+        :param params: the (name, value) pairs of the matched expressions,
+                       appended to while the segments are matched
+        """
+        if index == len(segments):
+            return self.template
+        segment = segments[index]
+        candidates: List[Tuple[_Node, List[Tuple[str, str]]]] = []
+        child = self.static.get(segment)
+        if child is not None:
+            candidates.append((child, []))
+        for pattern, names, child in self.patterns.values():
+            match = pattern.fullmatch(segment)
+            if match is not None:
+                candidates.append((child, list(zip(names, match.groups()))))
+        if segment:
+            candidates.extend(
+                (child, [(name, segment)]) for name, child in self.params.items()
+            )
+        mark = len(params)
+        for child, values in candidates:
+            params.extend(values)
+            found = child.find(segments, index + 1, params)
+            if found is not None:
+                return found
+            del params[mark:]
+        return None
+
+
+def _compile(segment: str) -> Pattern[str]:
+    """Compile a segment mixing text and template expressions to a pattern."""
+    parts = _TEMPLATE_EXPRESSION.split(segment)
+    # the odd parts are the names of the expressions
+    return re.compile(
+        "".join(
+            re.escape(part) if i % 2 == 0 else "(.+?)" for i, part in enumerate(parts)
+        )
+    )
@@ -0,0 +1,122 @@
+import json
+import weakref
+from typing import Any, Dict, Tuple
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .base import update_count
+from .lazy import fields
+
+_DUMP_OPTIONS: Dict[str, Any] = {
+    "by_alias": True,
+    "exclude_unset": True,
+    "exclude_none": True,
+}
+
+
+class _CachedJSON:
+    """The JSON bytes of an object, with the update count when it was serialized."""
+
+    def __init__(self, ref: "weakref.ref[BaseModel]", obj: BaseModel) -> None:
+        self.ref = ref
+        self.updates = update_count()
+        self.lengths = _lengths(obj)
+        self.values: Dict[bool, bytes] = {}
+
+    def is_current(self, obj: BaseModel) -> bool:
+        """Check whether the object was not updated since it was serialized."""
+        return (
+            self.ref() is obj
+            and self.updates == update_count()
+            and self.lengths == _lengths(obj)
+        )
+
+
+_cache: Dict[int, _CachedJSON] = {}
+
+
+def to_json_bytes(obj: BaseModel, sort_keys: bool = False) -> bytes:
+    """Serialize an OpenAPI object (3.0 or 3.1) to compact UTF-8 JSON.
+
+    The fields are written with their aliases (e.g. `$ref`, `in`, `not`), and the
+    fields which are not set (e.g. the default values) or `None` are skipped. With
+    Pydantic 2, the JSON is written by pydantic-core without building dicts.
+
+    The bytes are cached per OpenAPI object. They are serialized again when a field
+    of an OpenAPI object is set (e.g. the `description` of an operation, in any
+    document, see `update_count()`), or when a dict or list field of the object
+    gets items added or removed (e.g. a new path in `paths`). This is checked in
+    constant time. Other updates of dicts and lists (e.g. replacing the value of a
+    path in `paths`) are not detected: call `invalidate_json_bytes()` after them.
+
+    :param obj: the `OpenAPI` object, or any other OpenAPI object
+    :param sort_keys: flag to indicate if the keys of the objects are sorted
+    :return: the JSON bytes
+    """
+    key = id(obj)
+    cached = _cache.get(key)
+    if cached is None or not cached.is_current(obj):
+        try:
+            ref = weakref.ref(obj, lambda ref: _forget(key, ref))
+        except TypeError:
+            # not cached: the Pydantic 1 objects of other classes
+            return _serialize(obj, sort_keys)
+        data = _serialize(obj, sort_keys)
+        # created after serializing, which validates the values of the `LazyDict`
+        # fields without counting them as updates
+        cached = _cache[key] = _CachedJSON(ref, obj)
+        cached.values[sort_keys] = data
+        return data
+    value = cached.values.get(sort_keys)
+    if value is None:
+        value = cached.values[sort_keys] = _serialize(obj, sort_keys)
+    return value
+
+
+def invalidate_json_bytes(obj: BaseModel) -> None:
+    """Drop the cached JSON bytes of an object, if any."""
+    _cache.pop(id(obj), None)
+
+
+def _serialize(obj: BaseModel, sort_keys: bool) -> bytes:
+    """Serialize an object to JSON bytes, without the cache."""
+    fields_set = getattr(obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__")
+    if "openapi" not in fields_set and "openapi" in fields(type(obj)):
+        # the version has a default value, but it is required in the document
+        copy = getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")
+        obj = copy(update={"openapi": obj.__dict__["openapi"]})
+    if PYDANTIC_V2:
+        # the bytes of pydantic-core, without decoding them as `model_dump_json()`
+        serializer = obj.__pydantic_serializer__  # type: ignore[attr-defined,unused-ignore]
+        data: bytes = serializer.to_json(obj, **_DUMP_OPTIONS)
+        if not sort_keys:
+            return data
+        # sorting the decoded JSON is faster than dumping the object to a dict
+        text = json.dumps(
+            json.loads(data), sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+    else:
+        text = obj.json(
+            **_DUMP_OPTIONS,
+            sort_keys=sort_keys,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+    return text.encode()
+
+
+def _lengths(obj: BaseModel) -> Tuple[int, ...]:
+    """Get the lengths of the dicts and lists of an object, or -1 for other values."""
+    return tuple(
+        len(value) if isinstance(value, (dict, list)) else -1
+        for value in obj.__dict__.values()
+    )
+
+
+def _forget(key: int, ref: "weakref.ref[BaseModel]") -> None:
+    """Drop the cached JSON bytes of a garbage collected object."""
+    cached = _cache.get(key)
+    if cached is not None and cached.ref is ref:
+        del _cache[key]
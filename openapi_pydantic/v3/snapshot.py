@@ -0,0 +1,288 @@
+import gc
+import hmac
+import inspect
+import io
+import mmap
+import os
+import pickle
+import sys
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Dict, Optional, Set, Type, Union
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .lazy import LazyDict, fields
+from .parser import OpenAPIv3, parse_json
+
+SNAPSHOT_SUFFIX = ".snapshot"
+"""Suffix of the snapshot files written by `load_cached`."""
+
+KEY_FILE = "snapshot.key"
+"""Name of the file of the key signing the snapshots in the cache directory."""
+
+_MAGIC = b"openapi-pydantic snapshot\n"
+_KEY_SIZE = 32
+_DIGEST_SIZE = sha256().digest_size
+# no snapshot, an invalid one (e.g. truncated, or with a wrong signature), or one
+# referring to classes which were renamed
+_LOAD_ERRORS = (
+    OSError,
+    ValueError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    IndexError,
+)
+_FIELDS_SET = "__pydantic_fields_set__" if PYDANTIC_V2 else "__fields_set__"
+
+_Path = Union[str, "os.PathLike[str]"]
+
+
+def load_cached(
+    source: _Path,
+    cache_dir: _Path,
+    use_mmap: bool = False,
+    key: Optional[bytes] = None,
+) -> OpenAPIv3:
+    """Load an OpenAPI JSON file, through a snapshot of the parsed document.
+
+    The snapshots are stored in `cache_dir`, by hash of the content of the file,
+    and of the versions of openapi-pydantic, Pydantic and Python (see
+    `snapshot_key`). If the file has a snapshot, it is loaded without validating
+    the document again. Otherwise the file is parsed with `parse_json`, and its
+    snapshot is written (if the directory is writable).
+
+    The snapshots are pickles, signed with an HMAC: a snapshot is only unpickled
+    if its signature matches, so a file written by someone without the key is
+    parsed again instead. By default the key is random, and stored in the
+    `KEY_FILE` of the cache directory, readable only by its owner. The cache is
+    not used if this file is owned by another user or readable by others.
+
+    :param source: the path of the JSON file
+    :param cache_dir: the directory of the snapshots, created if needed
+    :param use_mmap: flag to indicate if the snapshot is read by memory-mapping
+                     the file (default is False)
+    :param key: the key signing the snapshots, instead of the key file of the
+                cache directory (default is None)
+    :return: the parsed `OpenAPI` object
+    """
+    with open(source, "rb") as stream:
+        data = stream.read()
+    path = os.path.join(cache_dir, snapshot_key(data) + SNAPSHOT_SUFFIX)
+    try:
+        if key is None:
+            key = _cache_key(cache_dir)
+    except (OSError, ValueError):
+        # e.g. a read-only directory without a key, or a key readable by others
+        return parse_json(data)
+    try:
+        return load_snapshot(path, key, use_mmap)
+    except _LOAD_ERRORS:
+        pass
+    open_api = parse_json(data)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_snapshot(open_api, path, key)
+    except OSError:
+        pass
+    return open_api
+
+
+def snapshot_key(data: bytes) -> str:
+    """Get the key of the snapshot of a JSON document.
+
+    :param data: the content of the JSON file
+    :return: the hexadecimal hash of the content, and of the versions the
+             snapshots depend on
+    """
+    digest = sha256(_version_key())
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def save_snapshot(open_api: OpenAPIv3, path: _Path, key: bytes) -> None:
+    """Write the snapshot of a parsed document to a file.
+
+    The file is replaced atomically, so concurrent readers see either the old
+    file or the new one.
+
+    :param open_api: the `OpenAPI` object
+    :param path: the path of the snapshot file
+    :param key: the key signing the snapshot
+    """
+    buffer = io.BytesIO()
+    _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(open_api)
+    payload = buffer.getbuffer()
+    temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as stream:
+            stream.write(_header())
+            stream.write(_signature(key, payload))
+            stream.write(payload)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_snapshot(path: _Path, key: bytes, use_mmap: bool = False) -> OpenAPIv3:
+    """Read the snapshot of a parsed document from a file, without validation.
+
+    :param path: the path of the snapshot file
+    :param key: the key the snapshot was signed with
+    :param use_mmap: flag to indicate if the file is memory-mapped instead of
+                     read (default is False)
+    :return: the `OpenAPI` object
+    :raises ValueError: if the file is not a snapshot written with the same
+                        versions of openapi-pydantic, Pydantic and Python, or
+                        was not signed with the key
+    """
+    with open(path, "rb") as stream:
+        if not use_mmap:
+            return _unpickle(stream.read(), key)
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with memoryview(data) as view:
+                return _unpickle(view, key)
+
+
+def _unpickle(data: Any, key: bytes) -> OpenAPIv3:
+    """Load the `OpenAPI` object of the content of a snapshot file."""
+    header = _header()
+    if bytes(data[: len(header)]) != header:
+        raise ValueError("The file is not a snapshot of this version")
+    start = len(header) + _DIGEST_SIZE
+    signature = bytes(data[len(header) : start])
+    payload = data[start:]
+    # checked before unpickling: loading a pickle can run any code
+    if not hmac.compare_digest(signature, _signature(key, payload)):
+        raise ValueError("The signature of the snapshot does not match the key")
+    # the objects are created without cycles: the collections triggered by the
+    # allocations would only walk the objects being loaded again and again
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        open_api = pickle.loads(payload)
+    finally:
+        if enabled:
+            gc.enable()
+    if not isinstance(open_api, (v3_1.OpenAPI, v3_0.OpenAPI)):
+        raise ValueError("The snapshot is not an OpenAPI object")
+    return open_api
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler writing the pydantic objects without their `None` values."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduce the pydantic objects to their values, and `LazyDict` to a dict."""
+        if isinstance(obj, BaseModel):
+            values = {
+                key: value for key, value in obj.__dict__.items() if value is not None
+            }
+            extra = getattr(obj, "__pydantic_extra__", None)
+            return _rebuild, (type(obj), values, getattr(obj, _FIELDS_SET), extra)
+        if isinstance(obj, LazyDict):
+            return dict, (dict(obj.items()),)
+        return NotImplemented
+
+
+_set = object.__setattr__
+
+
+def _rebuild(
+    cls: Type[BaseModel], values: Dict[str, Any], fields_set: Set[str], extra: Any
+) -> BaseModel:
+    """Create a pydantic object from its values, without validation."""
+    obj = cls.__new__(cls)
+    _set(obj, "__dict__", {**_nones(cls), **values})
+    _set(obj, _FIELDS_SET, fields_set)
+    if PYDANTIC_V2:
+        _set(obj, "__pydantic_extra__", extra)
+        _set(obj, "__pydantic_private__", None)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _nones(cls: Type[BaseModel]) -> Dict[str, None]:
+    """Get the `None` value of each field of a pydantic class, in field order."""
+    return dict.fromkeys(fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _version_key() -> bytes:
+    """Get the versions the snapshots depend on, as bytes.
+
+    These are the versions of openapi-pydantic, Pydantic and Python, and the
+    fields of the OpenAPI classes (which change without a new version number when
+    running from a source tree).
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    from pydantic.version import VERSION
+
+    try:
+        library = version("openapi-pydantic")
+    except PackageNotFoundError:
+        library = "unknown"
+    layout = sha256(
+        repr(
+            [
+                (module.__name__, name, *fields(value))
+                for module in (v3_0, v3_1)
+                for name, value in vars(module).items()
+                if inspect.isclass(value) and issubclass(value, BaseModel)
+            ]
+        ).encode()
+    ).hexdigest()
+    python = ".".join(map(str, sys.version_info[:2]))
+    return f"{library} {VERSION} {python} {layout}".encode()
+
+
+def _header() -> bytes:
+    """Get the first line of the snapshot files of this version."""
+    return _MAGIC + _version_key() + b"\n"
+
+
+def _signature(key: bytes, payload: Any) -> bytes:
+    """Get the HMAC of the pickle of a snapshot, with the header it is written for."""
+    signature = hmac.new(key, _header(), sha256)
+    signature.update(payload)
+    return signature.digest()
+
+
+def _cache_key(cache_dir: _Path) -> bytes:
+    """Get the key signing the snapshots of a cache directory.
+
+    The directory and its random key are created if needed.
+
+    :raises ValueError: if the key file is owned by another user, or can be read
+                        or written by other users
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, KEY_FILE)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        key = os.urandom(_KEY_SIZE)
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(key)
+        return key
+    with open(path, "rb") as stream:
+        status = os.fstat(stream.fileno())
+        # not available on Windows, where the permissions are ACLs
+        if hasattr(os, "getuid") and (
+            status.st_uid != os.getuid() or status.st_mode & 0o077
+        ):
+            raise ValueError(f"The key file {path} is not private")
+        key = stream.read()
+    if len(key) != _KEY_SIZE:
+        # e.g. being written by another process
+        raise ValueError(f"The key file {path} is incomplete")
+    return key
@@ -0,0 +1,291 @@
+import gc
+import inspect
+import sys
+from enum import Enum
+from functools import partial
+from types import ModuleType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .lazy import fields
+from .parser import OpenAPIv3
+
+_Builder = Optional[Callable[[Any], Any]]
+
+_VERSIONS: Dict[str, ModuleType] = {"3.0": v3_0, "3.1": v3_1}
+_SCALARS = frozenset({str, int, float, bool})
+
+
+def parse_trusted(data: Dict[str, Any], version: Optional[str] = None) -> OpenAPIv3:
+    """Build an OpenAPI model from a raw object, without validating it.
+
+    This is for documents which are already known to be valid, e.g. produced by
+    a build pipeline: the objects are created from the raw values directly, which
+    is several times faster than `parse_obj`. The keys are mapped to the fields by
+    alias (e.g. `$ref`, `in`, `not` or `format`), the other keys are extra values,
+    and the enum values (e.g. the `type` of a `Schema`) are converted. A raw object
+    with a `$ref` is a `Reference` where both are allowed, as with `parse_obj`.
+
+    The values are not checked, and only the integers of the float fields are
+    converted, so an invalid document gives an invalid model rather than an error.
+
+    :param data: the raw object, e.g. decoded JSON. Its dicts and lists are not
+                 modified, and its scalar values are shared with the model.
+    :param version: the OpenAPI version of the document, e.g. "3.1.1" or "3.0"
+                    (by default, its "openapi" value)
+    :return: the `OpenAPI` object
+    :raises ValueError: if the version is not supported
+    """
+    if version is None:
+        version = data.get("openapi")
+    module = _VERSIONS.get(version[:3]) if isinstance(version, str) else None
+    if module is None:
+        raise ValueError(f"Unsupported OpenAPI version: {version!r}")
+    # the objects are created without cycles: the collections triggered by the
+    # allocations would only walk the objects being built again and again
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        open_api: OpenAPIv3 = _build(module.OpenAPI, data)
+    finally:
+        if enabled:
+            gc.enable()
+    return open_api
+
+
+class _Plan(NamedTuple):
+    """How to build the objects of a pydantic class from raw objects."""
+
+    keys: Dict[str, Tuple[str, _Builder]]
+    """The field name and value builder (or None) of each key of the raw objects."""
+
+    defaults: Dict[str, Any]
+    """The immutable default values of the fields, in field order."""
+
+    factories: Tuple[Tuple[str, Any], ...]
+    """The fields whose default value is created for each object."""
+
+    extra: bool
+    """Flag to indicate if the unknown keys are kept as extra values."""
+
+
+_set = object.__setattr__
+
+
+def _build(cls: Type[BaseModel], data: Dict[str, Any]) -> Any:
+    """Create a pydantic object from a raw object, without validation."""
+    plan = _plans.get(cls) or _plan(cls)
+    keys = plan.keys
+    values = plan.defaults.copy()
+    for name, field in plan.factories:
+        values[name] = _default(field)
+    fields_set = set()
+    extra = {}
+    for key, value in data.items():
+        if key in keys:
+            name, builder = keys[key]
+            values[name] = value if builder is None or value is None else builder(value)
+            fields_set.add(name)
+        else:
+            extra[key] = value
+    obj = cls.__new__(cls)
+    if PYDANTIC_V2:
+        _set(obj, "__dict__", values)
+        _set(obj, "__pydantic_fields_set__", fields_set)
+        _set(obj, "__pydantic_extra__", extra if plan.extra else None)
+        _set(obj, "__pydantic_private__", None)
+    else:
+        # the extra values of Pydantic 1 are set like the fields
+        if plan.extra:
+            values.update(extra)
+            fields_set.update(extra)
+        _set(obj, "__dict__", values)
+        _set(obj, "__fields_set__", fields_set)
+    return obj
+
+
+_plans: Dict[Type[BaseModel], _Plan] = {}
+
+
+def _plan(cls: Type[BaseModel]) -> _Plan:
+    """Get how to build the objects of a pydantic class, once per class."""
+    config = getattr(cls, "model_config" if PYDANTIC_V2 else "__config__")
+    if PYDANTIC_V2:
+        by_name = config.get("populate_by_name", False)
+        extra = config.get("extra") == "allow"
+    else:
+        by_name = config.allow_population_by_field_name
+        extra = config.extra == "allow"
+    # the names of the version package (e.g. `v3_1`), for the forward references
+    namespace = vars(sys.modules[cls.__module__.rpartition(".")[0]])
+    keys: Dict[str, Tuple[str, _Builder]] = {}
+    defaults: Dict[str, Any] = {}
+    factories: List[Tuple[str, Any]] = []
+    for name, field in fields(cls).items():
+        entry = (name, _builder(field.annotation, namespace))
+        keys[field.alias or name] = entry
+        if by_name:
+            keys.setdefault(name, entry)
+        default = _default(field)
+        if default is None or type(default) in _SCALARS:
+            defaults[name] = default
+        else:
+            defaults[name] = None
+            factories.append((name, field))
+    plan = _plans[cls] = _Plan(keys, defaults, tuple(factories), extra)
+    return plan
+
+
+def _default(field: Any) -> Any:
+    """Get a new default value of a field, or None if the field is required."""
+    if PYDANTIC_V2:
+        return (
+            None
+            if field.is_required()
+            else field.get_default(call_default_factory=True)
+        )
+    return field.get_default()
+
+
+def _builder(annotation: Any, namespace: Dict[str, Any]) -> _Builder:
+    """Get the function building the raw values of a type.
+
+    :param annotation: the type
+    :param namespace: the names of the OpenAPI classes of the version
+    :return: the function, or None if the raw values are used as is
+    """
+    annotation = _resolve(annotation, namespace)
+    if annotation is float:
+        return _float
+    if inspect.isclass(annotation):
+        if issubclass(annotation, BaseModel):
+            return partial(_build, annotation)
+        if issubclass(annotation, Enum):
+            return partial(_enum, {member.value: member for member in annotation})
+        return None
+    args = get_args(annotation)
+    origin = get_origin(annotation)
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return _builder(members[0], namespace)
+        return _union_builder(members, namespace)
+    if origin is list:
+        item_builder = _builder(args[0], namespace)
+        return None if item_builder is None else partial(_list, item_builder)
+    if origin is dict:
+        value_builder = _builder(args[1], namespace)
+        return None if value_builder is None else partial(_dict, value_builder)
+    # e.g. `Any` or a `Literal`
+    return None
+
+
+def _union_builder(members: List[Any], namespace: Dict[str, Any]) -> _Builder:
+    """Get the function building the raw values of a union of types.
+
+    The raw values are dispatched by JSON type: the objects go to the `Reference`
+    if they have a `$ref`, else to the pydantic class or `Dict` of the union, and
+    the arrays go to its `List`. A class with its own `$ref` field (`PathItem`)
+    takes precedence over `Reference`, as with validation.
+    """
+    reference: _Builder = None
+    mapping: _Builder = None
+    sequence: _Builder = None
+    scalar: _Builder = None
+    has_ref = False
+    for member in members:
+        member = _resolve(member, namespace)
+        builder = _builder(member, namespace)
+        if member is namespace["Reference"]:
+            reference = builder
+        elif get_origin(member) is dict or _is_model(member):
+            if _is_model(member):
+                has_ref = any(
+                    field.alias == "$ref" for field in fields(member).values()
+                )
+            mapping = mapping or builder
+        elif get_origin(member) is list:
+            sequence = sequence or builder
+        else:
+            scalar = scalar or builder
+    if has_ref:
+        reference = None
+    if reference is mapping is sequence is scalar is None:
+        return None
+    return partial(_union, reference, mapping, sequence, scalar)
+
+
+def _resolve(annotation: Any, namespace: Dict[str, Any]) -> Any:
+    """Replace a forward reference (left by Pydantic 1) with its class.
+
+    The metadata of an `Annotated` type (e.g. of a `ReferenceUnion`) is dropped.
+    """
+    while get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if isinstance(annotation, ForwardRef):
+        return namespace[annotation.__forward_arg__]
+    if isinstance(annotation, str):
+        return namespace[annotation]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    """Check whether a type is a pydantic class."""
+    return inspect.isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def _union(
+    reference: _Builder,
+    mapping: _Builder,
+    sequence: _Builder,
+    scalar: _Builder,
+    value: Any,
+) -> Any:
+    """Build a raw value of a union of types, by JSON type."""
+    if isinstance(value, dict):
+        if reference is not None and "$ref" in value:
+            return reference(value)
+        return value if mapping is None else mapping(value)
+    if isinstance(value, list):
+        return value if sequence is None else sequence(value)
+    return value if scalar is None else scalar(value)
+
+
+def _list(builder: Callable[[Any], Any], values: List[Any]) -> List[Any]:
+    """Build the raw items of a list."""
+    return [value if value is None else builder(value) for value in values]
+
+
+def _dict(builder: Callable[[Any], Any], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the raw values of a dict."""
+    return {
+        key: value if value is None else builder(value) for key, value in values.items()
+    }
+
+
+def _float(value: Any) -> Any:
+    """Convert a raw integer to a float, as validation does."""
+    return float(value) if type(value) is int else value
+
+
+def _enum(members: Dict[Any, Enum], value: Any) -> Any:
+    """Convert a raw value to an enum member, if it is one."""
+    return members.get(value, value)
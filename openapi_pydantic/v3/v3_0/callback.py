@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, ForwardRef
 
 if TYPE_CHECKING:
     from .path_item import PathItem
+else:
+    # the module of the class is kept, so that the class is found when the schema
+    # is built on first use, also in the modules which do not import it
+    PathItem = ForwardRef("PathItem", module=f"{__package__}.path_item")
 
 
-Callback = Dict[str, "PathItem"]
+Callback = Dict[str, PathItem]
 """
 A map of possible out-of band callbacks related to the parent operation.
 Each value in the map is a [Path Item Object](#pathItemObject)
@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {
         "name": "API Support",
@@ -13,7 +13,7 @@ _examples = [
 ]
 
 
-class Contact(BaseModel):
+class Contact(OpenAPIModel):
     """Contact information for the exposed API."""
 
     name: Optional[str] = None
@@ -36,6 +36,7 @@ class Contact(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
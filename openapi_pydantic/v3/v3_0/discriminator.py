@@ -1,9 +1,9 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {
         "propertyName": "petType",
@@ -15,7 +15,7 @@ _examples = [
 ]
 
 
-class Discriminator(BaseModel):
+class Discriminator(OpenAPIModel):
     """Request or Response discriminator object.
 
     When request bodies or response payloads may be one of a number of different
@@ -43,6 +43,7 @@ class Discriminator(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
@@ -1,9 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .contact import Contact
 from .license import License
 
@@ -26,7 +25,7 @@ _examples = [
 ]
 
 
-class Info(BaseModel):
+class Info(OpenAPIModel):
     """The object provides metadata about the API.
 
     The metadata MAY be used by the clients if needed,
@@ -71,6 +70,7 @@ class Info(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
@@ -1,9 +1,9 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {
         "authorizationUrl": "https://example.com/api/oauth/dialog",
@@ -32,7 +32,7 @@ _examples = [
 ]
 
 
-class OAuthFlow(BaseModel):
+class OAuthFlow(OpenAPIModel):
     """Configuration details for a supported OAuth Flow."""
 
     authorizationUrl: Optional[str] = None
@@ -64,6 +64,7 @@ class OAuthFlow(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
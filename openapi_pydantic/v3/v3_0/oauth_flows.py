@@ -1,13 +1,12 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .oauth_flow import OAuthFlow
 
 
-class OAuthFlows(BaseModel):
+class OAuthFlows(OpenAPIModel):
     """Allows configuration of the supported OAuth Flows."""
 
     implicit: Optional[OAuthFlow] = None
@@ -37,6 +36,7 @@ class OAuthFlows(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
         )
 
     else:
@@ -1,9 +1,10 @@
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+from ..lazy import lazy_serializer, materialize_fields
+from ..operation_index import OperationIndex, operation_index
 from .components import Components
 from .external_documentation import ExternalDocumentation
 from .info import Info
@@ -13,7 +14,7 @@ from .server import Server
 from .tag import Tag
 
 
-class OpenAPI(BaseModel):
+class OpenAPI(OpenAPIModel):
     """This is the root document object of the OpenAPI document."""
 
     openapi: Literal["3.0.4", "3.0.3", "3.0.2", "3.0.1", "3.0.0"] = "3.0.4"
@@ -73,10 +74,32 @@ class OpenAPI(BaseModel):
     Additional external documentation.
     """
 
+    def ensure_all_valid(self) -> None:
+        """Validate every value of the maps which are validated on first access.
+
+        This is only needed for an object parsed with `lazy=True`, to check that
+        the whole document is valid.
+
+        :raises ValidationError: if a value is invalid
+        """
+        materialize_fields(self)
+        if self.components:
+            self.components.ensure_all_valid()
+
+    def operations(self) -> OperationIndex:
+        """Get the index of the operations by `operationId`, path and tag.
+
+        The index is cached, see `operation_index()` in
+        `openapi_pydantic.v3.operation_index` for when it is rebuilt.
+        """
+        return operation_index(self)
+
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
         )
+        _serialize_lazy_fields = lazy_serializer("paths")
 
     else:
 
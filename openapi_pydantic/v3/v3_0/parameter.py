@@ -1,10 +1,11 @@
 import enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .example import Example
 from .media_type import MediaType
 from .reference import Reference
@@ -75,7 +76,7 @@ class ParameterLocation(str, enum.Enum):
     COOKIE = "cookie"
 
 
-class ParameterBase(BaseModel):
+class ParameterBase(OpenAPIModel):
     """Base class for Parameter and Header.
 
     (Header is like Parameter, but has no `name` or `in` fields.)
@@ -123,7 +124,7 @@ class ParameterBase(BaseModel):
     For all other styles, the default value is `false`.
     """
 
-    param_schema: Optional[Union[Reference, Schema]] = Field(
+    param_schema: Optional[ReferenceUnion[Reference, Schema]] = Field(
         default=None, alias="schema"
     )
     """
@@ -141,7 +142,7 @@ class ParameterBase(BaseModel):
     or YAML, a string value can contain the example with escaping where necessary.
     """
 
-    examples: Optional[Dict[str, Union[Example, Reference]]] = None
+    examples: Optional[Dict[str, ReferenceUnion[Example, Reference]]] = None
     """
     Examples of the parameter's potential value.
     Each example SHOULD contain a value in the correct format as specified in the
@@ -169,6 +170,7 @@ class ParameterBase(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {"$ref": "#/components/schemas/Pet"},
     {"$ref": "Pet.json"},
@@ -9,7 +11,7 @@ _examples = [
 ]
 
 
-class Reference(BaseModel):
+class Reference(OpenAPIModel):
     """A simple object to allow referencing other components in the specification.
 
     The Reference Object is defined by [JSON Reference](https://tools.ietf.org/html/draft-pbryan-zyp-json-ref-03)
@@ -25,6 +27,7 @@ class Reference(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
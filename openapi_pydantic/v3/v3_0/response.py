@@ -1,9 +1,8 @@
-from typing import Dict, Optional, Union
+from typing import Dict, Optional
 
-from pydantic import BaseModel
-
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .header import Header
 from .link import Link
 from .media_type import MediaType
@@ -49,7 +48,7 @@ _examples = [
 ]
 
 
-class Response(BaseModel):
+class Response(OpenAPIModel):
     """Describes a single response from an API Operation.
 
     May include design-time, static `links` to operations based on the response.
@@ -62,7 +61,7 @@ class Response(BaseModel):
     representation.
     """
 
-    headers: Optional[Dict[str, Union[Header, Reference]]] = None
+    headers: Optional[Dict[str, ReferenceUnion[Header, Reference]]] = None
     """
     Maps a header name to its definition.
     [RFC7230](https://tools.ietf.org/html/rfc7230#page-22) states header names are case
@@ -80,7 +79,7 @@ class Response(BaseModel):
     e.g. text/plain overrides text/*
     """
 
-    links: Optional[Dict[str, Union[Link, Reference]]] = None
+    links: Optional[Dict[str, ReferenceUnion[Link, Reference]]] = None
     """
     A map of operations links that can be followed from the response.
     The key of the map is a short name for the link,
@@ -91,6 +90,7 @@ class Response(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
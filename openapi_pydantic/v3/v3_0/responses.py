@@ -1,9 +1,11 @@
-from typing import Dict, Union
+from typing import Dict
+
+from openapi_pydantic.compat import ReferenceUnion
 
 from .reference import Reference
 from .response import Response
 
-Responses = Dict[str, Union[Response, Reference]]
+Responses = Dict[str, ReferenceUnion[Response, Reference]]
 """
 A container for the expected responses of an operation.
 The container maps a HTTP response code to the expected response.
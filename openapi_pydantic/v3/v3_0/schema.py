@@ -1,9 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, min_length_arg
+from openapi_pydantic.compat import (
+    PYDANTIC_V2,
+    ConfigDict,
+    Extra,
+    ReferenceUnion,
+    min_length_arg,
+)
 
+from ..base import OpenAPIModel
 from .datatype import DataType
 from .discriminator import Discriminator
 from .external_documentation import ExternalDocumentation
@@ -109,7 +116,7 @@ _examples = [
 ]
 
 
-class Schema(BaseModel):
+class Schema(OpenAPIModel):
     """The Schema Object allows the definition of input and output data types.
 
     These types can be objects, but also primitives and arrays.
@@ -326,7 +333,7 @@ class Schema(BaseModel):
     types defined by keyword.  Recall: "number" includes "integer".
     """
 
-    allOf: Optional[List[Union[Reference, "Schema"]]] = None
+    allOf: Optional[List[ReferenceUnion[Reference, "Schema"]]] = None
     """
     **From OpenAPI spec:
     Inline or referenced schema MUST be of a [Schema Object](#schemaObject) and not a
@@ -344,7 +351,7 @@ class Schema(BaseModel):
     value.
     """
 
-    oneOf: Optional[List[Union[Reference, "Schema"]]] = None
+    oneOf: Optional[List[ReferenceUnion[Reference, "Schema"]]] = None
     """
     **From OpenAPI spec:
     Inline or referenced schema MUST be of a [Schema Object](#schemaObject) and not a
@@ -362,7 +369,7 @@ class Schema(BaseModel):
     keyword's value.
     """
 
-    anyOf: Optional[List[Union[Reference, "Schema"]]] = None
+    anyOf: Optional[List[ReferenceUnion[Reference, "Schema"]]] = None
     """
     **From OpenAPI spec:
     Inline or referenced schema MUST be of a [Schema Object](#schemaObject) and not a
@@ -380,7 +387,9 @@ class Schema(BaseModel):
     keyword's value.
     """
 
-    schema_not: Optional[Union[Reference, "Schema"]] = Field(default=None, alias="not")
+    schema_not: Optional[ReferenceUnion[Reference, "Schema"]] = Field(
+        default=None, alias="not"
+    )
     """
     **From OpenAPI spec:
     Inline or referenced schema MUST be of a [Schema Object](#schemaObject) and not a
@@ -394,7 +403,7 @@ class Schema(BaseModel):
     successfully against the schema defined by this keyword.
     """
 
-    items: Optional[Union[Reference, "Schema"]] = None
+    items: Optional[ReferenceUnion[Reference, "Schema"]] = None
     """
     **From OpenAPI spec:
     Value MUST be an object and not an array.
@@ -417,7 +426,7 @@ class Schema(BaseModel):
       less than, or equal to, the size of "items".
     """
 
-    properties: Optional[Dict[str, Union[Reference, "Schema"]]] = None
+    properties: Optional[Dict[str, ReferenceUnion[Reference, "Schema"]]] = None
     """
     **From OpenAPI spec:
     Property definitions MUST be a [Schema Object](#schemaObject)
@@ -431,7 +440,7 @@ class Schema(BaseModel):
     If absent, it can be considered the same as an empty object.
     """
 
-    additionalProperties: Optional[Union[bool, Reference, "Schema"]] = None
+    additionalProperties: Optional[ReferenceUnion[bool, Reference, "Schema"]] = None
     """
     **From OpenAPI spec:
     Value can be boolean or object.
@@ -585,6 +594,7 @@ class Schema(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
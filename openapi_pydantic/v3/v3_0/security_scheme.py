@@ -1,9 +1,10 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .oauth_flows import OAuthFlows
 
 _examples = [
@@ -33,7 +34,7 @@ _examples = [
 ]
 
 
-class SecurityScheme(BaseModel):
+class SecurityScheme(OpenAPIModel):
     """Defines a security scheme that can be used by the operations.
 
     Supported schemes are HTTP authentication,
@@ -100,6 +101,7 @@ class SecurityScheme(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
@@ -1,9 +1,8 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .server_variable import ServerVariable
 
 _examples = [
@@ -27,7 +26,7 @@ _examples = [
 ]
 
 
-class Server(BaseModel):
+class Server(OpenAPIModel):
     """An object representing a Server."""
 
     url: str
@@ -57,6 +56,7 @@ class Server(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
@@ -1,11 +1,11 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 
-class ServerVariable(BaseModel):
+class ServerVariable(OpenAPIModel):
     """An object representing a Server Variable for server URL template substitution."""
 
     enum: Optional[List[str]] = None
@@ -34,6 +34,7 @@ class ServerVariable(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
         )
 
     else:
@@ -1,16 +1,16 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {"namespace": "http://example.com/schema/sample", "prefix": "sample"},
     {"name": "aliens", "wrapped": True},
 ]
 
 
-class XML(BaseModel):
+class XML(OpenAPIModel):
     """A metadata object that allows for more fine-tuned XML model definitions.
 
     When using arrays, XML element names are *not* inferred (for singular/plural forms)
@@ -57,6 +57,7 @@ class XML(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
@@ -41,16 +41,9 @@ from .server_variable import ServerVariable as ServerVariable
 from .tag import Tag as Tag
 from .xml import XML as XML
 
-if TYPE_CHECKING:
-    pass
-elif PYDANTIC_V2:
-    # resolve forward references
-    Encoding.model_rebuild()
-    OpenAPI.model_rebuild()
-    Components.model_rebuild()
-    Operation.model_rebuild()
-else:
-    # resolve forward references
+if not TYPE_CHECKING and not PYDANTIC_V2:
+    # resolve forward references (with Pydantic 2, the schemas are built on first
+    # use, see `defer_build`)
     Encoding.update_forward_refs(Header=Header)
     Schema.update_forward_refs()
     Operation.update_forward_refs(PathItem=PathItem)
@@ -1,9 +1,9 @@
-from typing import Dict, Optional, Union
+from typing import Dict, Optional
 
-from pydantic import BaseModel
-
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
+from ..lazy import lazy_serializer, materialize_fields
 from .callback import Callback
 from .example import Example
 from .header import Header
@@ -92,7 +92,7 @@ _examples = [
 ]
 
 
-class Components(BaseModel):
+class Components(OpenAPIModel):
     """Holds a set of reusable objects for different aspects of the OAS.
 
     All objects defined within the components object will have no effect on the API
@@ -102,38 +102,63 @@ class Components(BaseModel):
     schemas: Optional[Dict[str, Schema]] = None
     """An object to hold reusable [Schema Objects](#schemaObject)."""
 
-    responses: Optional[Dict[str, Union[Response, Reference]]] = None
+    responses: Optional[Dict[str, ReferenceUnion[Response, Reference]]] = None
     """An object to hold reusable [Response Objects](#responseObject)."""
 
-    parameters: Optional[Dict[str, Union[Parameter, Reference]]] = None
+    parameters: Optional[Dict[str, ReferenceUnion[Parameter, Reference]]] = None
     """An object to hold reusable [Parameter Objects](#parameterObject)."""
 
-    examples: Optional[Dict[str, Union[Example, Reference]]] = None
+    examples: Optional[Dict[str, ReferenceUnion[Example, Reference]]] = None
     """An object to hold reusable [Example Objects](#exampleObject)."""
 
-    requestBodies: Optional[Dict[str, Union[RequestBody, Reference]]] = None
+    requestBodies: Optional[Dict[str, ReferenceUnion[RequestBody, Reference]]] = None
     """An object to hold reusable [Request Body Objects](#requestBodyObject)."""
 
-    headers: Optional[Dict[str, Union[Header, Reference]]] = None
+    headers: Optional[Dict[str, ReferenceUnion[Header, Reference]]] = None
     """An object to hold reusable [Header Objects](#headerObject)."""
 
-    securitySchemes: Optional[Dict[str, Union[SecurityScheme, Reference]]] = None
+    securitySchemes: Optional[Dict[str, ReferenceUnion[SecurityScheme, Reference]]] = (
+        None
+    )
     """An object to hold reusable [Security Scheme Objects](#securitySchemeObject)."""
 
-    links: Optional[Dict[str, Union[Link, Reference]]] = None
+    links: Optional[Dict[str, ReferenceUnion[Link, Reference]]] = None
     """An object to hold reusable [Link Objects](#linkObject)."""
 
-    callbacks: Optional[Dict[str, Union[Callback, Reference]]] = None
+    callbacks: Optional[Dict[str, ReferenceUnion[Callback, Reference]]] = None
     """An object to hold reusable [Callback Objects](#callbackObject)."""
 
-    pathItems: Optional[Dict[str, Union[PathItem, Reference]]] = None
+    pathItems: Optional[Dict[str, ReferenceUnion[PathItem, Reference]]] = None
     """An object to hold reusable [Path Item Object](#pathItemObject)."""
 
+    def ensure_all_valid(self) -> None:
+        """Validate every value of the maps which are validated on first access.
+
+        This is only needed for an object parsed with `lazy=True`, to check that
+        the whole document is valid.
+
+        :raises ValidationError: if a value is invalid
+        """
+        materialize_fields(self)
+
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
+        _serialize_lazy_fields = lazy_serializer(
+            "schemas",
+            "responses",
+            "parameters",
+            "examples",
+            "requestBodies",
+            "headers",
+            "securitySchemes",
+            "links",
+            "callbacks",
+            "pathItems",
+        )
 
     else:
 
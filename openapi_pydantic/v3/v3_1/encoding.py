@@ -1,13 +1,16 @@
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Dict, ForwardRef, Optional
 
-from pydantic import BaseModel
-
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .reference import Reference
 
 if TYPE_CHECKING:
     from .header import Header
+else:
+    # the module of the class is kept, so that the class is found when the schema
+    # is built on first use, also for the subclasses defined in other modules
+    Header = ForwardRef("Header", module=f"{__package__}.header")
 
 _examples = [
     {
@@ -22,7 +25,7 @@ _examples = [
 ]
 
 
-class Encoding(BaseModel):
+class Encoding(OpenAPIModel):
     """A single encoding definition applied to a single schema property."""
 
     contentType: Optional[str] = None
@@ -38,7 +41,7 @@ class Encoding(BaseModel):
     type (e.g. `image/*`), or a comma-separated list of the two types.
     """
 
-    headers: Optional[Dict[str, Union["Header", Reference]]] = None
+    headers: Optional[Dict[str, ReferenceUnion[Header, Reference]]] = None
     """
     A map allowing additional information to be provided as headers, for example
     `Content-Disposition`.
@@ -90,6 +93,7 @@ class Encoding(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
@@ -1,9 +1,9 @@
 from typing import Any, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {
         "summary": "A foo example",
@@ -20,7 +20,7 @@ _examples = [
 ]
 
 
-class Example(BaseModel):
+class Example(OpenAPIModel):
     """Example object."""
 
     summary: Optional[str] = None
@@ -56,6 +56,7 @@ class Example(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
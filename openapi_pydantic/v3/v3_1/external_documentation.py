@@ -1,13 +1,13 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [{"description": "Find more info here", "url": "https://example.com"}]
 
 
-class ExternalDocumentation(BaseModel):
+class ExternalDocumentation(OpenAPIModel):
     """Allows referencing an external resource for extended documentation."""
 
     description: Optional[str] = None
@@ -26,6 +26,7 @@ class ExternalDocumentation(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
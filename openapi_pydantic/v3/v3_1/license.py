@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {"name": "Apache 2.0", "identifier": "Apache-2.0"},
     {
@@ -13,7 +13,7 @@ _examples = [
 ]
 
 
-class License(BaseModel):
+class License(OpenAPIModel):
     """License information for the exposed API."""
 
     name: str
@@ -38,6 +38,7 @@ class License(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
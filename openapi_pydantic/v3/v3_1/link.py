@@ -1,9 +1,8 @@
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .server import Server
 
 _examples = [
@@ -18,7 +17,7 @@ _examples = [
 ]
 
 
-class Link(BaseModel):
+class Link(OpenAPIModel):
     """The `Link object` represents a possible design-time link for a response.
 
     The presence of a link does not guarantee the caller's ability to successfully
@@ -85,6 +84,7 @@ class Link(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
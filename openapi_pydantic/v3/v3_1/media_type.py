@@ -1,9 +1,10 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .encoding import Encoding
 from .example import Example
 from .reference import Reference
@@ -39,10 +40,10 @@ _examples = [
 ]
 
 
-class MediaType(BaseModel):
+class MediaType(OpenAPIModel):
     """Provides schema and examples for the media type identified by its key."""
 
-    media_type_schema: Optional[Union[Reference, Schema]] = Field(
+    media_type_schema: Optional[ReferenceUnion[Reference, Schema]] = Field(
         default=None, alias="schema"
     )
     """
@@ -61,7 +62,7 @@ class MediaType(BaseModel):
     the `example` value SHALL _override_ the example provided by the schema.
     """
 
-    examples: Optional[Dict[str, Union[Example, Reference]]] = None
+    examples: Optional[Dict[str, ReferenceUnion[Example, Reference]]] = None
     """
     Examples of the media type.
 
@@ -84,6 +85,7 @@ class MediaType(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
@@ -1,9 +1,8 @@
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
-
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .callback import Callback
 from .external_documentation import ExternalDocumentation
 from .parameter import Parameter
@@ -62,7 +61,7 @@ _examples = [
 ]
 
 
-class Operation(BaseModel):
+class Operation(OpenAPIModel):
     """Describes a single API operation on a path."""
 
     tags: Optional[List[str]] = None
@@ -98,7 +97,7 @@ class Operation(BaseModel):
     therefore, it is RECOMMENDED to follow common programming naming conventions.
     """
 
-    parameters: Optional[List[Union[Parameter, Reference]]] = None
+    parameters: Optional[List[ReferenceUnion[Parameter, Reference]]] = None
     """
     A list of parameters that are applicable for this operation.
     If a parameter is already defined at the [Path Item](#pathItemParameters),
@@ -110,7 +109,7 @@ class Operation(BaseModel):
     [OpenAPI Object's components/parameters](#componentsParameters).
     """
 
-    requestBody: Optional[Union[RequestBody, Reference]] = None
+    requestBody: Optional[ReferenceUnion[RequestBody, Reference]] = None
     """
     The request body applicable for this operation.
 
@@ -129,7 +128,7 @@ class Operation(BaseModel):
     The list of possible responses as they are returned from executing this operation.
     """
 
-    callbacks: Optional[Dict[str, Union[Callback, Reference]]] = None
+    callbacks: Optional[Dict[str, ReferenceUnion[Callback, Reference]]] = None
     """
     A map of possible out-of band callbacks related to the parent operation.
     The key is a unique identifier for the Callback Object.
@@ -166,6 +165,7 @@ class Operation(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
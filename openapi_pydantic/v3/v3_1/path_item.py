@@ -1,9 +1,10 @@
-from typing import List, Optional, Union
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
+from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra, ReferenceUnion
 
+from ..base import OpenAPIModel
 from .operation import Operation
 from .parameter import Parameter
 from .reference import Reference
@@ -51,7 +52,7 @@ _examples = [
 ]
 
 
-class PathItem(BaseModel):
+class PathItem(OpenAPIModel):
     """Describes the operations available on a single path.
 
     A Path Item MAY be empty, due to [ACL constraints](#securityFiltering).
@@ -127,7 +128,7 @@ class PathItem(BaseModel):
     An alternative `server` array to service all operations in this path.
     """
 
-    parameters: Optional[List[Union[Parameter, Reference]]] = None
+    parameters: Optional[List[ReferenceUnion[Parameter, Reference]]] = None
     """
     A list of parameters that are applicable for all the operations described under
     this path. These parameters can be overridden at the operation level, but cannot be
@@ -141,6 +142,7 @@ class PathItem(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
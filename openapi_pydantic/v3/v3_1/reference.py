@@ -1,9 +1,11 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {"$ref": "#/components/schemas/Pet"},
     {"$ref": "Pet.json"},
@@ -11,7 +13,7 @@ _examples = [
 ]
 
 
-class Reference(BaseModel):
+class Reference(OpenAPIModel):
     """A simple object to allow referencing other components in the OpenAPI document.
 
     The `$ref` string value contains a URI [RFC3986](https://tools.ietf.org/html/rfc3986),
@@ -42,6 +44,7 @@ class Reference(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             populate_by_name=True,
             json_schema_extra={"examples": _examples},
         )
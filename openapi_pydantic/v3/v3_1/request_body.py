@@ -1,9 +1,8 @@
 from typing import Dict, Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .media_type import MediaType
 
 _examples = [
@@ -55,7 +54,7 @@ _examples = [
 ]
 
 
-class RequestBody(BaseModel):
+class RequestBody(OpenAPIModel):
     """Describes a single request body."""
 
     description: Optional[str] = None
@@ -85,6 +84,7 @@ class RequestBody(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
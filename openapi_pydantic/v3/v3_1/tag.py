@@ -1,15 +1,14 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
 from .external_documentation import ExternalDocumentation
 
 _examples = [{"name": "pet", "description": "Pets operations"}]
 
 
-class Tag(BaseModel):
+class Tag(OpenAPIModel):
     """Adds metadata to a tag that is used by the [Operation Object](#operationObject).
 
     It is not mandatory to have a Tag Object per tag defined in the Operation Object
@@ -36,6 +35,7 @@ class Tag(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
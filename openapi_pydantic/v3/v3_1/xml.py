@@ -1,9 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
-
 from openapi_pydantic.compat import PYDANTIC_V2, ConfigDict, Extra
 
+from ..base import OpenAPIModel
+
 _examples = [
     {"name": "animal"},
     {"attribute": True},
@@ -13,7 +13,7 @@ _examples = [
 ]
 
 
-class XML(BaseModel):
+class XML(OpenAPIModel):
     """A metadata object that allows for more fine-tuned XML model definitions.
 
     When using arrays, XML element names are *not* inferred (for singular/plural forms)
@@ -61,6 +61,7 @@ class XML(BaseModel):
     if PYDANTIC_V2:
         model_config = ConfigDict(
             extra="allow",
+            defer_build=True,
             json_schema_extra={"examples": _examples},
         )
 
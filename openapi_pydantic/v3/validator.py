@@ -0,0 +1,1171 @@
+import importlib
+import math
+import operator
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .dispatch import DispatchTable, dispatch_table
+from .resolver import RefResolver, get_ref
+
+try:
+    numpy: Any = importlib.import_module("numpy")
+except ImportError:  # NumPy is optional
+    numpy = None
+from .v3_0 import Reference as ReferenceV3_0
+from .v3_1 import Reference as ReferenceV3_1
+
+# the location of a value in the instance, as (parent location, key) pairs, so
+# that it is only converted to a JSON pointer when an error is reported
+_Path = Optional[Tuple[Any, Any]]
+_Errors = List[Tuple[_Path, str]]
+_Check = Callable[[Any, _Path, _Errors], None]
+
+_NUMBER_TYPES = (int, float)
+# the ints converted to floats without rounding
+_MAX_EXACT_INT = 2**53
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: type(value) is bool,
+    "string": lambda value: type(value) is str,
+    "integer": lambda value: (
+        type(value) is int or (type(value) is float and value.is_integer())
+    ),
+    "number": lambda value: type(value) in _NUMBER_TYPES,
+    "array": lambda value: type(value) is list,
+    "object": lambda value: type(value) is dict,
+}
+
+
+class InstanceError(NamedTuple):
+    """An error found by a `SchemaValidator`."""
+
+    path: str
+    """The JSON pointer of the invalid value in the instance, e.g. "/items/0"."""
+
+    message: str
+    """The description of the error."""
+
+
+class SchemaValidator:
+    """Validates instances (as decoded by `json.loads`) against a schema.
+
+    Use `compile_validator()` to create one.
+    """
+
+    def __init__(self, check: _Check) -> None:
+        """Wrap a compiled check."""
+        self._check = check
+
+    def __call__(self, instance: Any) -> None:
+        """Validate an instance.
+
+        :raises ValueError: listing the errors, if the instance is invalid
+        """
+        errors = self.errors(instance)
+        if errors:
+            details = "".join(f"\n  {e.path or '/'}: {e.message}" for e in errors)
+            raise ValueError(f"Invalid instance:{details}")
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check whether an instance is valid."""
+        errors: _Errors = []
+        self._check(instance, None, errors)
+        return not errors
+
+    def errors(self, instance: Any) -> List[InstanceError]:
+        """Get the errors of an instance, an empty list if it is valid."""
+        errors: _Errors = []
+        self._check(instance, None, errors)
+        return [InstanceError(_pointer(path), message) for path, message in errors]
+
+
+VALIDATOR_CACHE_SIZE = 1024
+"""Maximum number of schemas compiled without a resolver whose checks are cached."""
+
+_compilers: "weakref.WeakKeyDictionary[RefResolver, _Compiler]" = (
+    weakref.WeakKeyDictionary()
+)
+_unresolved: "OrderedDict[int, Tuple[Any, _Compiler]]" = OrderedDict()
+_compilers_lock = threading.Lock()
+
+
+def compile_validator(
+    schema: Any, resolver: Optional[RefResolver] = None
+) -> SchemaValidator:
+    """Compile a `Schema` (3.0 or 3.1) to a reusable validator.
+
+    The schema tree is compiled once to nested closures, with the references
+    resolved and the patterns compiled, so validating an instance only runs the
+    checks of the keywords present in the schema. The compiled checks are cached
+    per schema object and resolver, so compiling the same schema again (or a
+    schema using the same components) reuses them. They are kept as long as the
+    resolver, or without a resolver, for the last `VALIDATOR_CACHE_SIZE` schemas.
+
+    The keywords checked are `$ref`, `type` (and `nullable` in 3.0), `enum`,
+    `const`, the numeric bounds and `multipleOf`, `minLength`, `maxLength`,
+    `pattern`, `items`, `prefixItems`, `contains`, `minItems`, `maxItems`,
+    `uniqueItems`, `properties`, `patternProperties`, `additionalProperties`,
+    `unevaluatedProperties`, `propertyNames`, `required`, `dependentRequired`,
+    `minProperties`, `maxProperties`, `allOf`, `anyOf`, `oneOf`, `not`, and
+    `if`/`then`/`else`. Other keywords (e.g. `format`) are annotations only.
+
+    For `unevaluatedProperties`, the evaluated properties are the ones of the
+    `properties`, `patternProperties` and `additionalProperties` of the schema,
+    of its `$ref` and `allOf` schemas, and of the `anyOf` and `oneOf` schemas
+    the instance is valid against.
+
+    :param schema: the `Schema` (or `Reference`) to validate against
+    :param resolver: resolves the references of the schema, required if it
+                     has references
+    :return: the validator
+    :raises ValueError: if a reference can't be resolved
+    """
+    return SchemaValidator(_compiler(resolver, schema).compile(schema))
+
+
+def validate_many(
+    schema: Any, records: Sequence[Any], resolver: Optional[RefResolver] = None
+) -> Dict[int, List[InstanceError]]:
+    """Validate a batch of instances (e.g. records) against a `Schema`.
+
+    The errors are the same as with `compile_validator()`, but the work is shared
+    between the records: the properties of an object schema which only have
+    type, numeric, string or `enum` keywords are checked one property (column) at
+    a time over the whole batch. The types of a column are checked all at once,
+    and the numeric bounds of a column are compared as a NumPy array if NumPy is
+    installed. The other keywords are checked record by record.
+
+    :param schema: the `Schema` (or `Reference`) to validate against
+    :param records: the instances to validate
+    :param resolver: resolves the references of the schema, required if it
+                     has references
+    :return: the errors of the invalid records, by position in `records`
+    :raises ValueError: if a reference can't be resolved
+    """
+    compiler = _compiler(resolver, schema)
+    check, columns = compiler.batch_plan(schema)
+    errors: Dict[int, _Errors] = {}
+    positions = []
+    for position, record in enumerate(records):
+        record_errors: _Errors = []
+        check(record, None, record_errors)
+        if record_errors:
+            errors[position] = record_errors
+        if type(record) is dict:
+            positions.append(position)
+    for name, property_check, filters in columns:
+        column = [records[position].get(name, _MISSING) for position in positions]
+        invalid: Set[int] = set()
+        for column_filter in filters:
+            invalid.update(column_filter(column))
+        for index in invalid:
+            # the check of the property gives the same errors as `compile_validator`
+            record_errors = errors.setdefault(positions[index], [])
+            property_check(column[index], (None, name), record_errors)
+    return {
+        position: [InstanceError(_pointer(path), message) for path, message in e]
+        for position, e in sorted(errors.items())
+    }
+
+
+def _compiler(resolver: Optional[RefResolver], schema: Any) -> "_Compiler":
+    """Get the compiler (and its cached checks) of a resolver.
+
+    Without a resolver, the compiler of the schema is used.
+    """
+    with _compilers_lock:
+        if resolver is not None:
+            compiler = _compilers.get(resolver)
+            if compiler is None:
+                compiler = _compilers[resolver] = _Compiler(resolver)
+            return compiler
+        key = id(schema)
+        cached = _unresolved.get(key)
+        # the schema is kept in the cache, so its id is not reused while cached
+        if cached is not None and cached[0] is schema:
+            _unresolved.move_to_end(key)
+            return cached[1]
+        compiler = _Compiler(None)
+        _unresolved[key] = (schema, compiler)
+        if len(_unresolved) > VALIDATOR_CACHE_SIZE:
+            _unresolved.popitem(last=False)
+        return compiler
+
+
+class _Compiler:
+    """Compiles schemas to checks, once per schema object."""
+
+    def __init__(self, resolver: Optional[RefResolver]) -> None:
+        """Create a compiler resolving references with a resolver."""
+        # not a strong reference, which would keep the resolver in `_compilers`
+        self._resolver = None if resolver is None else weakref.ref(resolver)
+        # the schemas are compiled by one thread at a time
+        self._lock = threading.RLock()
+        # the checks being compiled, including the placeholders of the cycles
+        self._pending: Optional[Dict[int, _Check]] = None
+        self._checks: Dict[int, _Check] = {}
+        self._plans: Dict[int, Tuple[_Check, List[_Column]]] = {}
+        # the compiled schemas are kept so that their ids are not reused
+        self._schemas: List[Any] = []
+
+    def compile(self, schema: Any) -> _Check:
+        """Compile a schema, or get its check if it is already compiled."""
+        check = self._checks.get(id(schema))
+        if check is not None:
+            return check
+        with self._lock:
+            if self._pending is not None:
+                # a schema used by the schema being compiled in this thread
+                return self._compile(schema, self._pending)
+            # the checks are only shared once the checks of a cycle are complete
+            pending = self._pending = {}
+            try:
+                check = self._compile(schema, pending)
+                self._checks.update(pending)
+            finally:
+                self._pending = None
+        return check
+
+    def _compile(self, schema: Any, pending: Dict[int, _Check]) -> _Check:
+        """Compile a schema and the schemas it uses to pending checks."""
+        key = id(schema)
+        check = self._checks.get(key) or pending.get(key)
+        if check is not None:
+            return check
+        compiled: List[_Check] = []
+
+        def deferred(value: Any, path: _Path, errors: _Errors) -> None:
+            """Run the check of a schema used while it is compiled (a cycle)."""
+            compiled[0](value, path, errors)
+
+        pending[key] = deferred
+        check = _all(self._keyword_checks(schema))
+        compiled.append(check)
+        pending[key] = check
+        self._schemas.append(schema)
+        return check
+
+    def batch_plan(self, schema: Any) -> Tuple[_Check, List["_Column"]]:
+        """Split a schema into checks by record and checks by column.
+
+        :return: the check of the keywords checked record by record, and the
+                 properties checked by column
+        """
+        plan = self._plans.get(id(schema))
+        if plan is not None:
+            return plan
+        with self._lock:
+            return self._plans.get(id(schema)) or self._batch_plan(schema)
+
+    def _batch_plan(self, schema: Any) -> Tuple[_Check, List["_Column"]]:
+        """Split a schema into checks by record and checks by column."""
+        target = schema
+        if isinstance(target, (ReferenceV3_1, ReferenceV3_0)):
+            target = self.resolve(target.ref)
+        columns: List[_Column] = []
+        properties = dict(getattr(target, "properties", None) or {})
+        for name, property_schema in properties.items():
+            if isinstance(property_schema, (ReferenceV3_1, ReferenceV3_0)):
+                property_schema = self.resolve(property_schema.ref)
+            filters = _column_filters(property_schema)
+            if filters is not None:
+                columns.append((name, self.compile(property_schema), filters))
+                # the property is still known to `additionalProperties`
+                properties[name] = type(target)()
+        if columns:
+            target = _copy_model(target, {"properties": properties})
+        plan = (self.compile(target), columns)
+        self._plans[id(schema)] = plan
+        self._schemas.append(schema)
+        return plan
+
+    def resolve(self, ref: str) -> Any:
+        """Get the schema a reference points to."""
+        resolver = None if self._resolver is None else self._resolver()
+        if resolver is None:
+            raise ValueError(f"A resolver is needed to resolve the reference: {ref}")
+        return resolver.resolve(ref)
+
+    def _keyword_checks(self, schema: Any) -> List[_Check]:
+        """Compile the keywords of a schema to a list of checks."""
+        if isinstance(schema, bool):
+            return [] if schema else [_fail("no value is allowed")]
+        ref = get_ref(schema)
+        checks = [] if ref is None else [self.compile(self.resolve(ref))]
+        if isinstance(schema, (ReferenceV3_1, ReferenceV3_0)):
+            # the other fields of a `Reference` are descriptions
+            return checks
+        fields = schema.__dict__
+        checks.extend(_type_checks(fields, _fields_set(schema)))
+        checks.extend(_number_checks(fields))
+        checks.extend(_string_checks(fields))
+        checks.extend(self._array_checks(fields))
+        checks.extend(self._object_checks(schema, fields))
+        checks.extend(self._applicator_checks(schema, fields))
+        return checks
+
+    def _applicator_checks(self, schema: Any, fields: Dict[str, Any]) -> List[_Check]:
+        """Compile the `allOf`, `anyOf`, `oneOf`, `not` and `if` keywords."""
+        checks = [self.compile(s) for s in fields.get("allOf") or ()]
+        table = dispatch_table(schema)
+        # the discriminator applies to `oneOf`, or else to `anyOf`
+        dispatched = "oneOf" if fields.get("oneOf") else "anyOf"
+        for name, combine in (("anyOf", _any_of), ("oneOf", _one_of)):
+            if fields.get(name):
+                branches = [self.compile(s) for s in fields[name]]
+                check = combine(branches)
+                if table is not None and name == dispatched:
+                    check = _discriminated(table, branches, check)
+                checks.append(check)
+        if fields.get("schema_not") is not None:
+            checks.append(_not(self.compile(fields["schema_not"])))
+        if fields.get("schema_if") is not None:
+            then, otherwise = fields.get("then"), fields.get("schema_else")
+            checks.append(
+                _if(
+                    self.compile(fields["schema_if"]),
+                    self.compile(then) if then is not None else None,
+                    self.compile(otherwise) if otherwise is not None else None,
+                )
+            )
+        return checks
+
+    def _array_checks(self, fields: Dict[str, Any]) -> List[_Check]:
+        """Compile the keywords applying to arrays."""
+        checks = []
+        prefix = [self.compile(s) for s in fields.get("prefixItems") or ()]
+        items = fields.get("items")
+        if prefix or items is not None:
+            checks.append(
+                _items(prefix, self.compile(items) if items is not None else None)
+            )
+        if fields.get("contains") is not None:
+            checks.append(
+                _contains(
+                    self.compile(fields["contains"]),
+                    fields.get("minContains"),
+                    fields.get("maxContains"),
+                )
+            )
+        checks.extend(_array_size_checks(fields))
+        return checks
+
+    def _object_checks(self, schema: Any, fields: Dict[str, Any]) -> List[_Check]:
+        """Compile the keywords applying to objects."""
+        checks = []
+        properties = {
+            name: self.compile(s)
+            for name, s in (fields.get("properties") or {}).items()
+        }
+        # e.g. the properties only described, or checked by column in a batch
+        checked = {n: c for n, c in properties.items() if c is not _nothing}
+        if checked:
+            checks.append(_properties(checked))
+        patterns = [
+            (re.compile(pattern), self.compile(s))
+            for pattern, s in (fields.get("patternProperties") or {}).items()
+        ]
+        additional = fields.get("additionalProperties")
+        additional_check: Optional[_Check] = None
+        if additional is False:
+            additional_check = _fail("additional property is not allowed")
+        elif additional is not None and additional is not True:
+            additional_check = self.compile(additional)
+        if patterns or additional_check is not None:
+            checks.append(
+                _other_properties(frozenset(properties), patterns, additional_check)
+            )
+        if fields.get("unevaluatedProperties") is not None:
+            checks.append(self._unevaluated_check(schema, fields))
+        if fields.get("propertyNames") is not None:
+            checks.append(_property_names(self.compile(fields["propertyNames"])))
+        checks.extend(_object_size_checks(fields))
+        return checks
+
+    def _unevaluated_check(self, schema: Any, fields: Dict[str, Any]) -> _Check:
+        """Compile the `unevaluatedProperties` keyword of a schema."""
+        evaluated = self._evaluated(schema, set())
+        branches = [
+            (self.compile(s), self._evaluated(s, set()))
+            for s in (fields.get("anyOf") or []) + (fields.get("oneOf") or [])
+        ]
+        return _unevaluated(
+            evaluated, branches, self.compile(fields["unevaluatedProperties"])
+        )
+
+    def _evaluated(self, schema: Any, seen: Set[int]) -> "_Evaluated":
+        """Get the properties evaluated by a schema and its `allOf` schemas."""
+        names: Set[str] = set()
+        patterns: List[Pattern[str]] = []
+        everything = False
+        stack = [schema]
+        while stack:
+            schema = stack.pop()
+            if id(schema) in seen or isinstance(schema, bool):
+                continue
+            seen.add(id(schema))
+            ref = get_ref(schema)
+            if ref is not None:
+                stack.append(self.resolve(ref))
+            fields = schema.__dict__
+            names.update(fields.get("properties") or ())
+            patterns.extend(map(re.compile, fields.get("patternProperties") or ()))
+            everything = everything or fields.get("additionalProperties") is not None
+            stack.extend(fields.get("allOf") or ())
+        return _Evaluated(frozenset(names), tuple(patterns), everything)
+
+
+class _Missing:
+    """The value of a property missing from a record."""
+
+
+_MISSING = _Missing()
+
+# the indexes of the values of a column which may be invalid
+_ColumnFilter = Callable[[List[Any]], Iterable[int]]
+_Column = Tuple[str, _Check, List[_ColumnFilter]]
+
+_COLUMN_KEYWORDS = frozenset(
+    {
+        "type",
+        "nullable",
+        "enum",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "multipleOf",
+        "minLength",
+        "maxLength",
+        "pattern",
+        "items",
+        "minItems",
+        "maxItems",
+    }
+)
+_ANNOTATIONS = frozenset(
+    {
+        "title",
+        "description",
+        "default",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "examples",
+        "example",
+        "schema_format",
+        "contentEncoding",
+        "contentMediaType",
+        "xml",
+        "externalDocs",
+    }
+)
+_EXACT_TYPES: Dict[str, Tuple[type, ...]] = {
+    "null": (type(None),),
+    "boolean": (bool,),
+    "string": (str,),
+    "integer": (int,),
+    "number": _NUMBER_TYPES,
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def _column_filters(schema: Any) -> Optional[List[_ColumnFilter]]:
+    """Get the column filters of a property schema, if it can be checked by column.
+
+    :return: the filters, or `None` if the schema has other keywords
+    """
+    if isinstance(schema, bool) or get_ref(schema) is not None:
+        return None
+    fields = {k: v for k, v in schema.__dict__.items() if v is not None}
+    if not fields.keys() <= _COLUMN_KEYWORDS | _ANNOTATIONS:
+        return None
+    filters: List[_ColumnFilter] = []
+    names = _type_names(fields)
+    if names is not None:
+        filters.append(_type_filter(names))
+    if "items" in fields:
+        # the items of all the arrays of the column are checked as one column
+        item_filters = _column_filters(fields["items"])
+        if item_filters is None:
+            return None
+        filters.append(_items_filter(item_filters))
+    size_checks = _array_size_checks(fields)
+    if size_checks:
+        filters.append(_check_filter(_all(size_checks)))
+    bounds = _number_bounds(fields)
+    if bounds or "multipleOf" in fields:
+        filters.append(_number_filter(bounds, fields.get("multipleOf")))
+    string_bounds = _string_bounds(fields)
+    if string_bounds:
+        filters.append(_string_filter([fails for fails, _message in string_bounds]))
+    enum = _enum_values(fields)
+    if enum is not None:
+        filters.append(_enum_filter(enum))
+    return filters
+
+
+def _type_filter(names: List[str]) -> _ColumnFilter:
+    """Create a column filter of the `type` keyword."""
+    exact = {t for name in names for t in _EXACT_TYPES[name]}
+    exact.add(_Missing)
+    predicates = [_TYPES[name] for name in names]
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the values of a column which do not have one of the types."""
+        if set(map(type, column)) <= exact:
+            return ()
+        return [
+            index
+            for index, value in enumerate(column)
+            if value is not _MISSING and not any(p(value) for p in predicates)
+        ]
+
+    return column_filter
+
+
+def _number_filter(
+    bounds: List[Tuple[Any, float, str]], multiple_of: Optional[float]
+) -> _ColumnFilter:
+    """Create a column filter of the numeric keywords."""
+    limits = [limit for _fails, limit, _message in bounds]
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the numbers of a column out of the bounds."""
+        indexes = [i for i, value in enumerate(column) if type(value) in _NUMBER_TYPES]
+        numbers = [column[i] for i in indexes]
+        compared = list(zip(indexes, numbers))
+        invalid: List[int] = []
+        if numpy is not None and numbers and all(map(_is_exact_float, limits)):
+            # the numbers which would be rounded as floats are compared in Python
+            exact = [(i, value) for i, value in compared if _is_exact_float(value)]
+            compared = [(i, v) for i, v in compared if not _is_exact_float(v)]
+            array = numpy.array([value for _i, value in exact], dtype=float)
+            failed = numpy.zeros(len(exact), dtype=bool)
+            for fails, limit, _message in bounds:
+                failed |= fails(array, limit)
+            invalid = [exact[i][0] for i in numpy.flatnonzero(failed)]
+        invalid.extend(
+            index
+            for index, value in compared
+            if any(fails(value, limit) for fails, limit, _message in bounds)
+        )
+        if multiple_of is not None:
+            invalid.extend(
+                index
+                for index, value in zip(indexes, numbers)
+                if not _is_multiple(value, multiple_of)
+            )
+        return invalid
+
+    return column_filter
+
+
+def _string_filter(bounds: List[Callable[[str], bool]]) -> _ColumnFilter:
+    """Create a column filter of the string keywords."""
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the strings of a column failing one of the string keywords."""
+        strings = [(i, value) for i, value in enumerate(column) if type(value) is str]
+        return {i for fails in bounds for i, value in strings if fails(value)}
+
+    return column_filter
+
+
+def _enum_filter(values: List[Any]) -> _ColumnFilter:
+    """Create a column filter of the `enum` keyword."""
+    keys = {_json_key(value) for value in values}
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the values of a column which are not allowed."""
+        return [
+            i
+            for i, value in enumerate(column)
+            if value is not _MISSING and _json_key(value) not in keys
+        ]
+
+    return column_filter
+
+
+def _items_filter(filters: List[_ColumnFilter]) -> _ColumnFilter:
+    """Create a column filter of the `items` keyword."""
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the arrays of a column with invalid items."""
+        items: List[Any] = []
+        owners: List[int] = []
+        for index, value in enumerate(column):
+            if type(value) is list:
+                items.extend(value)
+                owners.extend([index] * len(value))
+        return {owners[i] for item_filter in filters for i in item_filter(items)}
+
+    return column_filter
+
+
+def _check_filter(check: _Check) -> _ColumnFilter:
+    """Create a column filter running a check on each value of a column."""
+
+    def column_filter(column: List[Any]) -> Iterable[int]:
+        """Find the values of a column failing the check."""
+        return [
+            index
+            for index, value in enumerate(column)
+            if value is not _MISSING and not _is_valid(check, value, None)
+        ]
+
+    return column_filter
+
+
+class _Evaluated(NamedTuple):
+    """The properties of an object evaluated by a schema."""
+
+    names: FrozenSet[str]
+    patterns: Tuple[Pattern[str], ...]
+    everything: bool
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a property is evaluated."""
+        return (
+            self.everything
+            or name in self.names
+            or any(p.search(str(name)) for p in self.patterns)
+        )
+
+
+def _nothing(value: Any, path: _Path, errors: _Errors) -> None:
+    """Check nothing, for a schema without assertions."""
+
+
+def _all(checks: Sequence[_Check]) -> _Check:
+    """Combine checks to a check running each of them."""
+    if not checks:
+        return _nothing
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Run each check."""
+        for sub_check in checks:
+            sub_check(value, path, errors)
+
+    return check
+
+
+def _fail(message: str) -> _Check:
+    """Create a check failing for every value."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Report an error."""
+        errors.append((path, message))
+
+    return check
+
+
+def _is_valid(check: _Check, value: Any, path: _Path) -> bool:
+    """Check whether a value passes a check."""
+    errors: _Errors = []
+    check(value, path, errors)
+    return not errors
+
+
+def _keyword(
+    types: Tuple[type, ...], fails: Callable[[Any], bool], message: str
+) -> _Check:
+    """Create a check of a keyword applying to values of the given types.
+
+    :param fails: returns whether a value is invalid
+    :param message: the error message, after the invalid value
+    """
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check a value, if it is of the types the keyword applies to."""
+        if type(value) in types and fails(value):
+            errors.append((path, f"{value!r} {message}"))
+
+    return check
+
+
+def _type_checks(fields: Dict[str, Any], fields_set: Set[str]) -> List[_Check]:
+    """Compile the `type`, `nullable`, `enum` and `const` keywords."""
+    checks = []
+    names = _type_names(fields)
+    if names is not None:
+        checks.append(_type(names))
+    checks.extend(_enum_checks(fields))
+    # `const: null` is only distinguished from no `const` by the set fields
+    if "const" in fields_set and "const" in fields:
+        checks.append(_enum([fields["const"]], f"is not {fields['const']!r}"))
+    return checks
+
+
+def _type_names(fields: Dict[str, Any]) -> Optional[List[str]]:
+    """Get the types allowed by the `type` (and `nullable`) keyword, if any."""
+    type_ = fields.get("type")
+    if type_ is None:
+        return None
+    names = [
+        str(getattr(t, "value", t))
+        for t in (type_ if isinstance(type_, list) else [type_])
+    ]
+    if fields.get("nullable") and "null" not in names:
+        names.append("null")
+    return names
+
+
+def _enum_values(fields: Dict[str, Any]) -> Optional[List[Any]]:
+    """Get the values allowed by the `enum` keyword, if any."""
+    enum = fields.get("enum")
+    if enum is not None and fields.get("nullable") and None not in enum:
+        enum = [*enum, None]
+    return enum
+
+
+def _enum_checks(fields: Dict[str, Any]) -> List[_Check]:
+    """Compile the `enum` keyword."""
+    enum = _enum_values(fields)
+    return [] if enum is None else [_enum(enum, f"is not one of {enum!r}")]
+
+
+def _number_bounds(fields: Dict[str, Any]) -> List[Tuple[Any, float, str]]:
+    """Get the (failing comparison, limit, message) of the bounds of a schema."""
+    minimum, maximum = fields.get("minimum"), fields.get("maximum")
+    exclusive_minimum = fields.get("exclusiveMinimum")
+    exclusive_maximum = fields.get("exclusiveMaximum")
+    # in OpenAPI 3.0, the exclusive bounds are booleans updating the bounds
+    if isinstance(exclusive_minimum, bool):
+        minimum, exclusive_minimum = (
+            (None, minimum) if exclusive_minimum else (minimum, None)
+        )
+    if isinstance(exclusive_maximum, bool):
+        maximum, exclusive_maximum = (
+            (None, maximum) if exclusive_maximum else (maximum, None)
+        )
+    bounds = [
+        (operator.lt, minimum, "is less than the minimum of"),
+        (operator.gt, maximum, "is more than the maximum of"),
+        (
+            operator.le,
+            exclusive_minimum,
+            "is less than or equal to the exclusive minimum of",
+        ),
+        (
+            operator.ge,
+            exclusive_maximum,
+            "is more than or equal to the exclusive maximum of",
+        ),
+    ]
+    return [
+        (fails, limit, f"{message} {limit}")
+        for fails, limit, message in bounds
+        if limit is not None
+    ]
+
+
+def _number_checks(fields: Dict[str, Any]) -> List[_Check]:
+    """Compile the keywords applying to numbers."""
+    checks = [
+        _keyword(_NUMBER_TYPES, partial(_compare, fails, limit), message)
+        for fails, limit, message in _number_bounds(fields)
+    ]
+    multiple_of = fields.get("multipleOf")
+    if multiple_of is not None:
+        checks.append(
+            _keyword(
+                _NUMBER_TYPES,
+                lambda v: not _is_multiple(v, multiple_of),
+                f"is not a multiple of {multiple_of}",
+            )
+        )
+    return checks
+
+
+def _compare(fails: Callable[[Any, Any], bool], limit: float, value: Any) -> bool:
+    """Compare a value to a limit (for `functools.partial`)."""
+    return fails(value, limit)
+
+
+def _string_bounds(fields: Dict[str, Any]) -> List[Tuple[Callable[[str], bool], str]]:
+    """Get the (failing predicate, message) of the string keywords of a schema."""
+    bounds: List[Tuple[Callable[[str], bool], str]] = []
+    min_length, max_length = fields.get("minLength"), fields.get("maxLength")
+    if min_length is not None:
+        bounds.append(
+            (lambda v: len(v) < min_length, f"is shorter than {min_length} characters")
+        )
+    if max_length is not None:
+        bounds.append(
+            (lambda v: len(v) > max_length, f"is longer than {max_length} characters")
+        )
+    pattern = fields.get("pattern")
+    if pattern is not None:
+        regex = re.compile(pattern)
+        bounds.append(
+            (lambda v: regex.search(v) is None, f"does not match {pattern!r}")
+        )
+    return bounds
+
+
+def _string_checks(fields: Dict[str, Any]) -> List[_Check]:
+    """Compile the keywords applying to strings."""
+    return [
+        _keyword((str,), fails, message) for fails, message in _string_bounds(fields)
+    ]
+
+
+def _array_size_checks(fields: Dict[str, Any]) -> List[_Check]:
+    """Compile the `minItems`, `maxItems` and `uniqueItems` keywords."""
+    checks = []
+    min_items, max_items = fields.get("minItems"), fields.get("maxItems")
+    if min_items is not None:
+        checks.append(
+            _keyword(
+                (list,),
+                lambda v: len(v) < min_items,
+                f"has fewer than {min_items} items",
+            )
+        )
+    if max_items is not None:
+        checks.append(
+            _keyword(
+                (list,),
+                lambda v: len(v) > max_items,
+                f"has more than {max_items} items",
+            )
+        )
+    if fields.get("uniqueItems"):
+        checks.append(
+            _keyword((list,), lambda v: not _unique(v), "has non-unique items")
+        )
+    return checks
+
+
+def _object_size_checks(fields: Dict[str, Any]) -> List[_Check]:
+    """Compile the keywords checking the names and number of properties."""
+    checks = []
+    required = fields.get("required")
+    if required:
+        checks.append(_required(required))
+    for name, dependencies in (fields.get("dependentRequired") or {}).items():
+        checks.append(_dependent_required(name, dependencies))
+    min_properties = fields.get("minProperties")
+    max_properties = fields.get("maxProperties")
+    if min_properties is not None:
+        checks.append(
+            _keyword(
+                (dict,),
+                lambda v: len(v) < min_properties,
+                f"has fewer than {min_properties} properties",
+            )
+        )
+    if max_properties is not None:
+        checks.append(
+            _keyword(
+                (dict,),
+                lambda v: len(v) > max_properties,
+                f"has more than {max_properties} properties",
+            )
+        )
+    return checks
+
+
+def _type(names: List[str]) -> _Check:
+    """Create a check of the `type` keyword."""
+    predicates = [_TYPES[name] for name in names]
+    message = f"is not of type {' or '.join(repr(name) for name in names)}"
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that a value has one of the types."""
+        for predicate in predicates:
+            if predicate(value):
+                return
+        errors.append((path, f"{value!r} {message}"))
+
+    return check
+
+
+def _enum(values: List[Any], message: str) -> _Check:
+    """Create a check of the `enum` (or `const`) keyword."""
+    # equal values in Python may not be equal in JSON (e.g. `True` and `1`)
+    keys = {_json_key(value) for value in values}
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that a value is one of the allowed values."""
+        if _json_key(value) not in keys:
+            errors.append((path, f"{value!r} {message}"))
+
+    return check
+
+
+def _any_of(checks: List[_Check]) -> _Check:
+    """Create a check of the `anyOf` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that a value passes at least one of the checks."""
+        if not any(_is_valid(c, value, path) for c in checks):
+            errors.append((path, f"{value!r} is not valid under any of the schemas"))
+
+    return check
+
+
+def _one_of(checks: List[_Check]) -> _Check:
+    """Create a check of the `oneOf` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that a value passes exactly one of the checks."""
+        valid = sum(_is_valid(c, value, path) for c in checks)
+        if valid != 1:
+            errors.append(
+                (path, f"{value!r} is valid under {valid} of the schemas, not 1")
+            )
+
+    return check
+
+
+def _discriminated(
+    table: DispatchTable, branches: List[_Check], fallback: _Check
+) -> _Check:
+    """Create a check of the schema selected by the discriminator value.
+
+    :param fallback: the check of the values without a mapped discriminator value
+    """
+    property_name = table.property_name
+    by_value = {value: branches[index] for value, index in table.indexes.items()}
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check a value against the schema of its discriminator value."""
+        if type(value) is dict:
+            discriminator = value.get(property_name)
+            if type(discriminator) is str and discriminator in by_value:
+                by_value[discriminator](value, path, errors)
+                return
+        fallback(value, path, errors)
+
+    return check
+
+
+def _not(not_check: _Check) -> _Check:
+    """Create a check of the `not` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that a value fails a check."""
+        if _is_valid(not_check, value, path):
+            errors.append((path, f"{value!r} should not be valid under the schema"))
+
+    return check
+
+
+def _if(
+    condition: _Check, then: Optional[_Check], otherwise: Optional[_Check]
+) -> _Check:
+    """Create a check of the `if`, `then` and `else` keywords."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Run the `then` or `else` check, depending on the `if` check."""
+        branch = then if _is_valid(condition, value, path) else otherwise
+        if branch is not None:
+            branch(value, path, errors)
+
+    return check
+
+
+def _items(prefix: List[_Check], items: Optional[_Check]) -> _Check:
+    """Create a check of the `prefixItems` and `items` keywords."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the items of an array."""
+        if type(value) is not list:
+            return
+        for index, (item_check, item) in enumerate(zip(prefix, value)):
+            item_check(item, (path, index), errors)
+        if items is not None:
+            for index in range(len(prefix), len(value)):
+                items(value[index], (path, index), errors)
+
+    return check
+
+
+def _contains(
+    contains: _Check, minimum: Optional[int], maximum: Optional[int]
+) -> _Check:
+    """Create a check of the `contains`, `minContains` and `maxContains` keywords."""
+    minimum = 1 if minimum is None else minimum
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the number of items of an array passing a check."""
+        if type(value) is not list:
+            return
+        count = sum(
+            _is_valid(contains, item, (path, index)) for index, item in enumerate(value)
+        )
+        if count < minimum or (maximum is not None and count > maximum):
+            errors.append((path, f"{value!r} contains {count} matching items"))
+
+    return check
+
+
+def _properties(properties: Dict[str, _Check]) -> _Check:
+    """Create a check of the `properties` keyword."""
+    items = list(properties.items())
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the properties of an object which have a check."""
+        if type(value) is dict:
+            for name, property_check in items:
+                if name in value:
+                    property_check(value[name], (path, name), errors)
+
+    return check
+
+
+def _other_properties(
+    known: FrozenSet[str],
+    patterns: List[Tuple[Pattern[str], _Check]],
+    additional: Optional[_Check],
+) -> _Check:
+    """Create a check of the `patternProperties` and `additionalProperties`."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the properties matching a pattern, and the other properties."""
+        if type(value) is not dict:
+            return
+        for name, item in value.items():
+            matched = False
+            for regex, pattern_check in patterns:
+                if regex.search(name):
+                    matched = True
+                    pattern_check(item, (path, name), errors)
+            if additional is not None and not matched and name not in known:
+                additional(item, (path, name), errors)
+
+    return check
+
+
+def _unevaluated(
+    evaluated: _Evaluated,
+    branches: List[Tuple[_Check, _Evaluated]],
+    unevaluated: _Check,
+) -> _Check:
+    """Create a check of the `unevaluatedProperties` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the properties which were not evaluated by other keywords."""
+        if type(value) is not dict:
+            return
+        valid = [e for c, e in branches if _is_valid(c, value, path)]
+        for name, item in value.items():
+            if name not in evaluated and not any(name in e for e in valid):
+                unevaluated(item, (path, name), errors)
+
+    return check
+
+
+def _property_names(names: _Check) -> _Check:
+    """Create a check of the `propertyNames` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the names of the properties of an object."""
+        if type(value) is dict:
+            for name in value:
+                names(name, (path, name), errors)
+
+    return check
+
+
+def _required(required: List[str]) -> _Check:
+    """Create a check of the `required` keyword."""
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check that an object has the required properties."""
+        if type(value) is dict:
+            for name in required:
+                if name not in value:
+                    errors.append((path, f"{name!r} is a required property"))
+
+    return check
+
+
+def _dependent_required(name: str, dependencies: List[str]) -> _Check:
+    """Create a check of an entry of the `dependentRequired` keyword."""
+    required = _required(dependencies)
+
+    def check(value: Any, path: _Path, errors: _Errors) -> None:
+        """Check the required properties of an object with a property."""
+        if type(value) is dict and name in value:
+            required(value, path, errors)
+
+    return check
+
+
+def _copy_model(obj: Any, update: Dict[str, Any]) -> Any:
+    """Shallow copy a pydantic object, with updated fields."""
+    return getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")(update=update)
+
+
+def _fields_set(obj: Any) -> Set[str]:
+    """Get the names of the fields which were set on a pydantic object."""
+    return set(getattr(obj, "model_fields_set" if PYDANTIC_V2 else "__fields_set__"))
+
+
+def _is_exact_float(value: float) -> bool:
+    """Check whether a number is a finite float, or an int exact as a float."""
+    if type(value) is float:
+        return math.isfinite(value)
+    return -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT
+
+
+def _is_multiple(value: float, multiple_of: float) -> bool:
+    """Check whether a number is a multiple of another."""
+    if type(value) is int and float(multiple_of).is_integer():
+        return value % int(multiple_of) == 0
+    quotient = value / multiple_of
+    return math.isfinite(quotient) and quotient == int(quotient)
+
+
+def _unique(values: List[Any]) -> bool:
+    """Check whether the items of an array are unique (as JSON values)."""
+    keys = [_json_key(value) for value in values]
+    return len(set(keys)) == len(keys)
+
+
+def _json_key(value: Any) -> Any:
+    """Get a hashable key of a JSON value, equal for equal JSON values."""
+    if type(value) is bool or value is None:
+        return (bool, value)
+    if type(value) in _NUMBER_TYPES:
+        # 1 and 1.0 are equal in JSON
+        return (float, value)
+    if type(value) is list:
+        return (list, tuple(_json_key(item) for item in value))
+    if type(value) is dict:
+        return (dict, frozenset((k, _json_key(v)) for k, v in value.items()))
+    return (type(value), value)
+
+
+def _pointer(path: _Path) -> str:
+    """Convert the location of a value in an instance to a JSON pointer."""
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(str(key).replace("~", "~0").replace("/", "~1"))
+    return "".join(f"/{key}" for key in reversed(keys))
@@ -0,0 +1,299 @@
+import inspect
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from . import v3_0, v3_1
+from .lazy import fields
+
+_T = TypeVar("_T")
+
+SKIP: Any = type("Skip", (), {"__repr__": lambda self: "SKIP"})()
+"""Returned by a visit method to skip the children of the visited object."""
+
+_Handler = Callable[[Any, Any, str], Any]
+_Path = Optional[Tuple[Any, Any]]
+
+_MISSING: Any = object()
+_MODEL_CLASSES: Tuple[Type[BaseModel], ...] = tuple(
+    value
+    for module in (v3_0, v3_1)
+    for value in vars(module).values()
+    if inspect.isclass(value) and issubclass(value, BaseModel)
+)
+_SCALARS = frozenset({str, int, float, bool})
+
+
+class Visitor:
+    """Base class of the visitors of OpenAPI objects (3.0 or 3.1).
+
+    `walk()` visits an object and its children depth-first, in document order. For
+    each pydantic object, it calls the method `visit_<class name>` of the visitor
+    (e.g. `visit_Schema` for the `Schema` objects of both versions), or else the
+    method of a base class of the object, or else `generic_visit`. The methods
+    are found once per class of object.
+
+    The walk is iterative, so deep documents do not hit the recursion limit. The
+    lists and dicts are walked without calling a method, and the values of the
+    `LazyDict` fields are validated.
+    """
+
+    def generic_visit(self, obj: BaseModel, pointer: str) -> Any:
+        """Visit a pydantic object without a specific visit method.
+
+        :param obj: the visited object
+        :param pointer: the JSON pointer of the object, e.g. "#/paths/~1pets/get"
+        :return: `SKIP` to skip the children of the object
+        """
+        return None
+
+    def walk(self, obj: Any, pointer: str = "#") -> None:
+        """Visit an object and its children.
+
+        :param obj: a pydantic object, list or dict
+        :param pointer: the JSON pointer of the object
+        """
+        handlers = _handlers(type(self))
+        stack: List[Tuple[Any, _Path]] = [(obj, None)]
+        while stack:
+            value, path = stack.pop()
+            if isinstance(value, BaseModel):
+                handler = handlers.get(type(value), _MISSING)
+                if handler is _MISSING:
+                    handler = handlers[type(value)] = _handler(type(self), type(value))
+                if (
+                    handler is not None
+                    and handler(self, value, _pointer(pointer, path)) is SKIP
+                ):
+                    continue
+            stack.extend(
+                (child, (path, key)) for _name, key, child in reversed(_children(value))
+            )
+
+
+class Transformer(Visitor):
+    """Base class of the visitors replacing OpenAPI objects (3.0 or 3.1).
+
+    `transform()` visits the objects as `walk()` does, and the visit methods
+    return the replacement of the visited object: the object itself to keep it,
+    or `SKIP` to keep it and skip its children. The children of the replacement
+    are visited next.
+
+    The objects containing a replaced object are shallow copied with the new
+    value (unless the transformation is in place), and the other objects are
+    shared with the given object.
+    """
+
+    def generic_visit(self, obj: BaseModel, pointer: str) -> Any:
+        """Visit a pydantic object without a specific visit method.
+
+        :param obj: the visited object
+        :param pointer: the JSON pointer of the object
+        :return: the replacement of the object, the object itself to keep it, or
+                 `SKIP` to keep it and skip its children
+        """
+        return obj
+
+    def transform(self, obj: _T, pointer: str = "#", in_place: bool = False) -> _T:
+        """Replace an object and its children.
+
+        :param obj: a pydantic object, list or dict
+        :param pointer: the JSON pointer of the object
+        :param in_place: flag to indicate if the objects containing a replaced
+                         object are updated, instead of copied
+        :return: the replacement of the object, or the object if nothing is
+                 replaced
+        """
+        handlers = _handlers(type(self))
+        result: Dict[Any, Any] = {}
+        # (value, path, name, updates of the parent), or, once the children of
+        # the value are pushed, (new value, value, name, updates of the parent,
+        # updates of the new value)
+        stack: List[Tuple[Any, ...]] = [(obj, None, None, result)]
+        while stack:
+            frame = stack.pop()
+            if len(frame) == 5:
+                new_value, value, name, parent_updates, value_updates = frame
+                new_value = _apply_updates(new_value, value_updates, in_place)
+                if new_value is not value:
+                    parent_updates[name] = new_value
+                continue
+            value, path, name, parent_updates = frame
+            new_value = value
+            if isinstance(value, BaseModel):
+                handler = handlers.get(type(value), _MISSING)
+                if handler is _MISSING:
+                    handler = handlers[type(value)] = _handler(type(self), type(value))
+                if handler is not None:
+                    new_value = handler(self, value, _pointer(pointer, path))
+                    if new_value is SKIP:
+                        continue
+            children = _children(new_value)
+            if not children:
+                if new_value is not value:
+                    parent_updates[name] = new_value
+                continue
+            updates: Dict[Any, Any] = {}
+            stack.append((new_value, value, name, parent_updates, updates))
+            stack.extend(
+                (child, (path, key), child_name, updates)
+                for child_name, key, child in reversed(children)
+            )
+        new_obj: _T = result.get(None, obj)
+        return new_obj
+
+
+@lru_cache(maxsize=None)
+def child_fields(cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Get the names of the fields of a pydantic class which can hold objects.
+
+    These are the fields whose annotation includes a pydantic class, e.g. `allOf`,
+    `properties` or `items` for a `Schema`, but not its scalar fields nor its `Any`
+    fields such as `example`. Walking these fields is enough to find every
+    pydantic object of a document. The names are found once per class.
+    """
+    return tuple(
+        name for name, field in fields(cls).items() if _holds_models(field.annotation)
+    )
+
+
+def _holds_models(annotation: Any) -> bool:
+    """Check whether a type annotation includes a pydantic class."""
+    if isinstance(annotation, (ForwardRef, str)):
+        # the unresolved references of Pydantic 1 are to the OpenAPI classes
+        return True
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return True
+    if get_origin(annotation) is Literal:
+        return False
+    return any(_holds_models(arg) for arg in get_args(annotation))
+
+
+def _children(value: Any) -> List[Tuple[Any, Any, Any]]:
+    """Get the (name, key, value) of the children of a pydantic object, list or dict.
+
+    The names are the field names, the list indexes or the dict keys, and the keys
+    are the names as in the document (the field aliases). Only the `child_fields`
+    of pydantic objects which are set are read (e.g. not the default `servers` of
+    `OpenAPI`), and the `None` and scalar children are skipped.
+    """
+    if isinstance(value, BaseModel):
+        aliases = _aliases(type(value))
+        fields_set = getattr(
+            value, "model_fields_set" if PYDANTIC_V2 else "__fields_set__"
+        )
+        values = value.__dict__
+        children: List[Tuple[Any, Any, Any]] = []
+        for name in child_fields(type(value)):
+            if name in fields_set:
+                child = values[name]
+                if child is not None and type(child) not in _SCALARS:
+                    children.append((name, aliases.get(name, name), child))
+        return children
+    items: Iterable[Tuple[Any, Any]]
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return []
+    return [
+        (key, key, child)
+        for key, child in items
+        if child is not None and type(child) not in _SCALARS
+    ]
+
+
+def _apply_updates(obj: Any, updates: Dict[Any, Any], in_place: bool) -> Any:
+    """Set the updated children of a pydantic object, list or dict.
+
+    Unless `in_place` is True, the object is shallow copied before being updated.
+    """
+    if not updates:
+        return obj
+    if isinstance(obj, BaseModel):
+        if not in_place:
+            copy = getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")
+            return copy(update=updates)
+        for name, value in updates.items():
+            setattr(obj, name, value)
+        return obj
+    new_obj = obj if in_place else obj.copy()
+    for key, value in updates.items():
+        new_obj[key] = value
+    return new_obj
+
+
+_tables: Dict[Type[Visitor], Dict[Type[BaseModel], Optional[_Handler]]] = {}
+
+
+def _handlers(visitor_cls: Type[Visitor]) -> Dict[Type[BaseModel], Optional[_Handler]]:
+    """Get the table of the visit methods of a visitor class, by pydantic class.
+
+    The table is built for the OpenAPI classes on first use, and the other classes
+    (e.g. subclasses of `Schema`) are added when they are visited.
+    """
+    table = _tables.get(visitor_cls)
+    if table is None:
+        table = {cls: _handler(visitor_cls, cls) for cls in _MODEL_CLASSES}
+        _tables[visitor_cls] = table
+    return table
+
+
+def _handler(visitor_cls: Type[Visitor], cls: Type[BaseModel]) -> Optional[_Handler]:
+    """Get the visit method of a visitor class for a pydantic class.
+
+    This is the `visit_<class name>` method for the class or its closest base
+    class, or else `generic_visit`, or `None` if `generic_visit` is not overridden
+    (the method which does nothing does not need to be called).
+    """
+    for base in cls.__mro__:
+        method: Optional[_Handler] = getattr(
+            visitor_cls, f"visit_{base.__name__}", None
+        )
+        if method is not None:
+            return method
+    method = visitor_cls.generic_visit
+    if method in (Visitor.generic_visit, Transformer.generic_visit):
+        return None
+    return method
+
+
+@lru_cache(maxsize=None)
+def _aliases(cls: Type[BaseModel]) -> Dict[str, str]:
+    """Map the field names of a pydantic class to their aliases."""
+    return {name: field.alias for name, field in fields(cls).items() if field.alias}
+
+
+def _escape(key: Any) -> str:
+    """Escape a key to use it in a JSON pointer."""
+    text = str(key)
+    if "~" in text or "/" in text:
+        return text.replace("~", "~0").replace("/", "~1")
+    return text
+
+
+def _pointer(root: str, path: _Path) -> str:
+    """Convert the location of a value below a root to a JSON pointer."""
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(_escape(key))
+    return "/".join([root, *reversed(keys)])
@@ -0,0 +1,76 @@
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, ForwardRef, Iterator, List, Optional, Set, Type, get_args
+
+from pydantic import BaseModel
+
+from openapi_pydantic.compat import PYDANTIC_V2
+
+from .lazy import fields
+
+_VERSION_PACKAGES = {"3.1": "v3_1", "3.0": "v3_0"}
+
+
+def warmup(version: Optional[str] = None) -> None:
+    """Build the validators and serializers of the OpenAPI classes of a version.
+
+    With Pydantic 2, the classes build their validators and serializers on first
+    use (see `defer_build`), so that a process only pays for the classes it uses.
+    Calling this at start-up (e.g. when initializing a serverless function) builds
+    them all at once instead of in the first requests. With Pydantic 1, they are
+    built when the classes are created, and this only imports the classes.
+
+    :param version: the OpenAPI version, e.g. "3.1.1" or "3.0" (by default, both
+                    versions)
+    :raises ValueError: if the version is not supported
+    """
+    packages: List[str]
+    if version is None:
+        packages = list(_VERSION_PACKAGES.values())
+    elif version[:3] in _VERSION_PACKAGES:
+        packages = [_VERSION_PACKAGES[version[:3]]]
+    else:
+        raise ValueError(f"Unsupported OpenAPI version: {version!r}")
+    for package in packages:
+        module = import_module(f"..{package}", __name__)
+        if not PYDANTIC_V2:
+            continue
+        for cls in _build_order(module):
+            cls.model_rebuild()  # type: ignore[attr-defined,unused-ignore]
+
+
+def _build_order(module: ModuleType) -> List[Type[BaseModel]]:
+    """Sort the pydantic classes of a version package, after the classes they hold.
+
+    The schemas of the classes which are already built are reused when building the
+    classes holding them, instead of being generated again for each of them.
+    """
+    namespace = vars(module)
+    order: List[Type[BaseModel]] = []
+    seen: Set[Type[BaseModel]] = set()
+
+    def visit(cls: Type[BaseModel]) -> None:
+        if cls in seen:
+            return
+        seen.add(cls)
+        for field in fields(cls).values():
+            for child in _classes(field.annotation, namespace):
+                visit(child)
+        order.append(cls)
+
+    for value in namespace.values():
+        if isinstance(value, type) and issubclass(value, BaseModel):
+            visit(value)
+    return order
+
+
+def _classes(annotation: Any, namespace: Dict[str, Any]) -> Iterator[Type[BaseModel]]:
+    """Get the pydantic classes of a type, resolving the forward references."""
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        annotation = namespace.get(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _classes(arg, namespace)
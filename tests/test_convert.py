@@ -0,0 +1,275 @@
+import json
+from typing import Any, Dict
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.convert import (
+    Downgrade,
+    LossyConstruct,
+    downgrade_to_3_0,
+    upgrade_to_3_1,
+)
+from openapi_pydantic.v3.interning import intern_schemas
+
+
+def _document(version: str, schemas: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0", "x-audience": "public"},
+        "paths": {
+            "/files": {
+                "post": {
+                    "parameters": [
+                        {
+                            "name": "page",
+                            "in": "query",
+                            "schema": {"type": "integer"},
+                            "example": 2,
+                        }
+                    ],
+                    "requestBody": {
+                        "content": {
+                            "multipart/form-data": {
+                                "schema": {"$ref": "#/components/schemas/Upload"}
+                            }
+                        }
+                    },
+                    "responses": {"204": {"description": "Uploaded"}},
+                }
+            }
+        },
+        "components": {"schemas": schemas},
+    }
+
+
+def _dump(obj: Any) -> Any:
+    if PYDANTIC_V2:
+        return json.loads(obj.model_dump_json(by_alias=True, exclude_unset=True))
+    return json.loads(obj.json(by_alias=True, exclude_unset=True))
+
+
+def test_upgrade_to_3_1() -> None:
+    open_api = parse_obj(
+        _document(
+            "3.0.4",
+            {
+                "Upload": {
+                    "type": "object",
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "checksum": {"type": "string", "format": "byte"},
+                        "name": {"type": "string", "nullable": True, "example": "a"},
+                        "size": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "exclusiveMinimum": True,
+                            "maximum": 10,
+                            "exclusiveMaximum": False,
+                        },
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                        "tag": {"const": "upload", "x-internal": True},
+                    },
+                },
+                "Owner": {"nullable": True, "example": None},
+                "Alias": {"$ref": "#/components/schemas/Owner"},
+            },
+        )
+    )
+    assert isinstance(open_api, v3_0.OpenAPI)
+
+    upgraded = upgrade_to_3_1(open_api)
+
+    expected = _document(
+        "3.1.1",
+        {
+            "Upload": {
+                "type": "object",
+                "properties": {
+                    "file": {
+                        "type": "string",
+                        "contentMediaType": "application/octet-stream",
+                    },
+                    "checksum": {"type": "string", "contentEncoding": "base64"},
+                    "name": {"type": ["string", "null"], "examples": ["a"]},
+                    "size": {"type": "integer", "exclusiveMinimum": 0, "maximum": 10},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                    "tag": {"const": "upload", "x-internal": True},
+                },
+            },
+            "Owner": {"examples": [None]},
+            "Alias": {"$ref": "#/components/schemas/Owner"},
+        },
+    )
+    assert isinstance(upgraded, v3_1.OpenAPI)
+    assert _dump(upgraded) == expected
+    assert upgraded == parse_obj(expected)
+    # the 3.0 document is unchanged
+    assert _dump(open_api)["components"]["schemas"]["Owner"]["nullable"] is True
+
+
+def test_upgrade_to_3_1_nullable() -> None:
+    open_api = parse_obj(
+        _document(
+            "3.0.4",
+            {
+                "Upload": {"type": "object"},
+                "Status": {"type": "string", "enum": ["a", "b"], "nullable": True},
+                "Owner": {
+                    "allOf": [{"$ref": "#/components/schemas/Upload"}],
+                    "nullable": True,
+                    "description": "The owner",
+                },
+            },
+        )
+    )
+    assert isinstance(open_api, v3_0.OpenAPI)
+
+    upgraded = upgrade_to_3_1(open_api)
+
+    schemas = _dump(upgraded)["components"]["schemas"]
+    assert schemas["Status"] == {"type": ["string", "null"], "enum": ["a", "b", None]}
+    assert schemas["Owner"] == {
+        "anyOf": [
+            {
+                "allOf": [{"$ref": "#/components/schemas/Upload"}],
+                "description": "The owner",
+            },
+            {"type": "null"},
+        ]
+    }
+
+
+def test_upgrade_to_3_1_deep_schema() -> None:
+    schema = v3_0.Schema()
+    for _ in range(5000):
+        schema = v3_0.Schema(items=schema)
+    open_api = v3_0.OpenAPI(
+        info=v3_0.Info(title="foo", version="0.1.0"),
+        paths={},
+        components=v3_0.Components(schemas={"Deep": schema}),
+    )
+
+    upgraded = upgrade_to_3_1(open_api)
+
+    assert upgraded.components is not None and upgraded.components.schemas
+    items = upgraded.components.schemas["Deep"]
+    depth = 0
+    while items.items is not None:
+        assert isinstance(items.items, v3_1.Schema)
+        items = items.items
+        depth += 1
+    assert depth == 5000
+
+
+def test_upgrade_to_3_1_shared_objects() -> None:
+    string = {"type": "string", "nullable": True}
+    open_api = parse_obj(
+        _document(
+            "3.0.4",
+            {"Upload": {"properties": {"a": string, "b": string}}},
+        )
+    )
+    assert isinstance(open_api, v3_0.OpenAPI)
+    intern_schemas(open_api)
+
+    upgraded = upgrade_to_3_1(open_api)
+
+    assert upgraded.components is not None and upgraded.components.schemas
+    properties = upgraded.components.schemas["Upload"].properties
+    assert properties is not None
+    assert properties["a"] is properties["b"]
+    assert isinstance(properties["a"], v3_1.Schema)
+    assert properties["a"].type == [v3_1.DataType.STRING, v3_1.DataType.NULL]
+
+
+def test_downgrade_to_3_0() -> None:
+    document = _document(
+        "3.1.1",
+        {
+            "Upload": {
+                "type": "object",
+                "properties": {
+                    "file": {"contentMediaType": "image/png"},
+                    "checksum": {"type": "string", "contentEncoding": "base64"},
+                    "name": {"type": ["string", "null"], "examples": ["a", "b"]},
+                    "size": {"type": "integer", "exclusiveMinimum": 0, "minimum": 1},
+                    "ratio": {"maximum": 1, "exclusiveMaximum": 1},
+                    "owner": {"$ref": "#/components/schemas/Owner", "readOnly": True},
+                    "tag": {"const": "upload", "x-internal": True},
+                    "pair": {
+                        "type": "array",
+                        "prefixItems": [{"type": "string"}],
+                        "if": {"minItems": 2},
+                        "then": {"maxItems": 2},
+                    },
+                    "any": {"type": ["string", "integer"]},
+                },
+            },
+            "Owner": {"type": "null"},
+            "Alias": {"$ref": "#/components/schemas/Owner"},
+            "Person": {"$ref": "#/components/schemas/Owner", "title": "Person"},
+        },
+    )
+    document["info"]["summary"] = "Files"
+    document["webhooks"] = {"uploaded": {"post": {"responses": {}}}}
+    open_api = parse_obj(document)
+    assert isinstance(open_api, v3_1.OpenAPI)
+
+    result = downgrade_to_3_0(open_api)
+
+    assert isinstance(result, Downgrade)
+    downgraded, lossy = result
+    expected = _document(
+        "3.0.4",
+        {
+            "Upload": {
+                "type": "object",
+                "properties": {
+                    "file": {"format": "binary"},
+                    "checksum": {"type": "string", "format": "byte"},
+                    "name": {"type": "string", "nullable": True, "example": "a"},
+                    "size": {"type": "integer", "minimum": 1},
+                    "ratio": {"maximum": 1, "exclusiveMaximum": True},
+                    "owner": {"$ref": "#/components/schemas/Owner"},
+                    "tag": {"enum": ["upload"], "x-internal": True},
+                    "pair": {"type": "array"},
+                    "any": {},
+                },
+            },
+            "Owner": {"nullable": True},
+            "Alias": {"$ref": "#/components/schemas/Owner"},
+            "Person": {
+                "allOf": [{"$ref": "#/components/schemas/Owner"}],
+                "title": "Person",
+            },
+        },
+    )
+    assert isinstance(downgraded, v3_0.OpenAPI)
+    assert _dump(downgraded) == expected
+    assert downgraded == parse_obj(expected)
+    properties = "#/components/schemas/Upload/properties"
+    assert lossy == [
+        LossyConstruct("#/info", "summary"),
+        LossyConstruct(f"{properties}/name", "examples"),
+        # the keywords next to a `$ref` make a `Reference` with extra values
+        LossyConstruct(f"{properties}/owner", "readOnly"),
+        LossyConstruct(f"{properties}/pair", "if"),
+        LossyConstruct(f"{properties}/pair", "then"),
+        LossyConstruct(f"{properties}/pair", "prefixItems"),
+        LossyConstruct(f"{properties}/any", "type"),
+        LossyConstruct("#/components/schemas/Owner", "type"),
+        LossyConstruct("#", "webhooks"),
+    ]
+
+
+def test_downgrade_to_3_0_upgraded() -> None:
+    open_api = parse_obj(
+        _document("3.0.4", {"Upload": {"type": "string", "nullable": True}})
+    )
+    assert isinstance(open_api, v3_0.OpenAPI)
+
+    downgraded, lossy = downgrade_to_3_0(upgrade_to_3_1(open_api))
+
+    assert _dump(downgraded) == _dump(open_api)
+    assert lossy == []
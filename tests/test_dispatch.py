@@ -0,0 +1,94 @@
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3.dispatch import (
+    DispatchTable,
+    clear_dispatch_cache,
+    dispatch_table,
+)
+from openapi_pydantic.v3.resolver import RefResolver
+from openapi_pydantic.v3.validator import InstanceError, compile_validator
+
+
+def _ref(name: str) -> Dict[str, str]:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _document(version: str) -> Dict[str, Any]:
+    kind = {"type": "string"}
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "oneOf": [_ref("Cat"), _ref("Dog"), _ref("Lizard")],
+                    "discriminator": {
+                        "propertyName": "kind",
+                        "mapping": {"cat": _ref("Cat")["$ref"], "dog": "Dog"},
+                    },
+                },
+                "Cat": {
+                    "type": "object",
+                    "required": ["kind", "lives"],
+                    "properties": {"kind": kind, "lives": {"type": "integer"}},
+                },
+                "Dog": {
+                    "type": "object",
+                    "required": ["kind", "barks"],
+                    "properties": {"kind": kind, "barks": {"type": "boolean"}},
+                },
+                "Lizard": {
+                    "type": "object",
+                    "required": ["kind"],
+                    "properties": {"kind": kind},
+                },
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_dispatch_table(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    resolver = RefResolver(open_api)
+    pet = resolver.lookup("#/components/schemas/Pet")
+
+    table = dispatch_table(pet)
+
+    assert isinstance(table, DispatchTable)
+    assert table.property_name == "kind"
+    # the mapping replaces the implicit values of Cat and Dog
+    assert table.indexes == {"cat": 0, "dog": 1, "Lizard": 2}
+    assert table.refs["dog"] == "#/components/schemas/Dog"
+    assert table.index({"kind": "dog"}) == 1
+    assert table.select({"kind": "Lizard"}) is pet.oneOf[2]
+    for payload in [{"kind": "Cat"}, {"kind": 1}, {}, "cat"]:
+        assert table.select(payload) is None
+    assert dispatch_table(pet) is table
+    clear_dispatch_cache()
+    assert dispatch_table(pet) is not table
+
+    assert dispatch_table(resolver.lookup("#/components/schemas/Cat")) is None
+    with pytest.raises(ValueError):
+        DispatchTable(resolver.lookup("#/components/schemas/Cat"))
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_dispatch_validator(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    resolver = RefResolver(open_api)
+    validator = compile_validator(resolver.lookup("#/components/schemas/Pet"), resolver)
+
+    assert validator.is_valid({"kind": "cat", "lives": 9})
+    assert validator.is_valid({"kind": "Lizard"})
+    # only the schema of the discriminator value is checked
+    assert validator.errors({"kind": "dog", "barks": 1}) == [
+        InstanceError("/barks", "1 is not of type 'boolean'")
+    ]
+    # the other values are checked against every schema
+    assert validator.is_valid({"kind": "cow"})
+    assert not validator.is_valid({"kind": "cow", "lives": 1})
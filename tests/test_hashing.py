@@ -0,0 +1,128 @@
+import json
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.hashing import content_hash
+from openapi_pydantic.v3.serializer import to_json_bytes
+from openapi_pydantic.v3.visitor import Transformer
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "operationId": "listPets",
+                    "parameters": [
+                        {"name": "limit", "in": "query", "schema": {"type": "integer"}}
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "The pets",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "array",
+                                        "items": {"$ref": "#/components/schemas/Pet"},
+                                    }
+                                }
+                            },
+                        }
+                    },
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "not": {"enum": [""]}},
+                        "tags": {"type": "array", "example": ["a", {"b": 1}]},
+                    },
+                    "x-order": 1,
+                }
+            }
+        },
+    }
+
+
+def _reversed(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _reversed(value[key]) for key in reversed(list(value))}
+    return value
+
+
+class _Summarizer(Transformer):
+    def visit_Operation(self, obj: Any, pointer: str) -> Any:
+        copy = getattr(obj, "model_copy" if PYDANTIC_V2 else "copy")
+        return copy(update={"summary": "List the pets"})
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_content_hash(version: str) -> None:
+    data = _document(version)
+
+    result = content_hash(parse_obj(data))
+
+    assert len(result) == 64
+    assert content_hash(parse_obj(_reversed(data))) == result
+    # the hash of the serialized document
+    assert content_hash(parse_obj(json.loads(to_json_bytes(parse_obj(data))))) == (
+        result
+    )
+    data["info"]["title"] = "bar"
+    assert content_hash(parse_obj(data)) != result
+
+
+def test_content_hash_reference() -> None:
+    reference = v3_1.Reference(**{"$ref": "#/components/schemas/Pet"})
+    schema = v3_1.Schema(**{"$ref": "#/components/schemas/Pet"})
+
+    assert content_hash(reference) == content_hash(schema)
+    assert content_hash(v3_0.Schema()) != content_hash(v3_0.Schema(nullable=False))
+
+
+def test_content_hash_update() -> None:
+    open_api: Any = parse_obj(_document("3.1.1"))
+    result = content_hash(open_api)
+    pet = open_api.components.schemas["Pet"]
+
+    pet.properties["name"].schema_not.enum = ["", " "]
+    updated = content_hash(open_api)
+    assert updated != result
+    pet.properties["name"].schema_not.enum = [""]
+    assert content_hash(open_api) == result
+
+    pet.properties["age"] = v3_1.Schema(type="integer")
+    assert content_hash(open_api) not in (result, updated)
+
+
+def test_content_hash_copy_on_write() -> None:
+    open_api = parse_obj(_document("3.0.4"))
+    result = content_hash(open_api)
+
+    updated = content_hash(_Summarizer().transform(open_api))
+
+    data = _document("3.0.4")
+    data["paths"]["/pets"]["get"]["summary"] = "List the pets"
+    assert updated == content_hash(parse_obj(data)) != result
+
+
+def test_content_hash_deep_schema() -> None:
+    schema = v3_1.Schema()
+    for _ in range(5000):
+        schema = v3_1.Schema(items=schema)
+
+    assert len(content_hash(schema)) == 64
+
+
+def test_content_hash_scalar() -> None:
+    with pytest.raises(TypeError):
+        content_hash("foo")
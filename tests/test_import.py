@@ -0,0 +1,114 @@
+import subprocess
+import sys
+from typing import Any, Dict, List, Set
+
+import pytest
+
+import openapi_pydantic
+from openapi_pydantic import v3
+from openapi_pydantic.v3 import v3_1
+
+
+def _imported_versions(statement: str) -> List[str]:
+    """Get the version packages imported by a statement, in a new interpreter."""
+    script = (
+        f"import sys\n{statement}\n"
+        "print(*sorted(m for m in sys.modules if m.endswith(('.v3_0', '.v3_1'))))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return output.split()
+
+
+# the public names of the star imports before the packages were imported lazily
+_BASELINE_NAMES = {
+    "XML",
+    "Callback",
+    "Components",
+    "Contact",
+    "DataType",
+    "Discriminator",
+    "Encoding",
+    "Example",
+    "ExternalDocumentation",
+    "Header",
+    "Info",
+    "License",
+    "Link",
+    "MediaType",
+    "OAuthFlow",
+    "OAuthFlows",
+    "OpenAPI",
+    "Operation",
+    "Parameter",
+    "ParameterLocation",
+    "PathItem",
+    "Paths",
+    "Reference",
+    "RequestBody",
+    "Response",
+    "Responses",
+    "Schema",
+    "SecurityRequirement",
+    "SecurityScheme",
+    "Server",
+    "ServerVariable",
+    "Tag",
+    "parse_obj",
+    "schema_validate",
+}
+
+
+@pytest.mark.parametrize(
+    "module, names",
+    [
+        ("openapi_pydantic", {*_BASELINE_NAMES, "v3"}),
+        ("openapi_pydantic.v3", {*_BASELINE_NAMES, "v3_0", "v3_1"}),
+    ],
+)
+def test_star_import(module: str, names: Set[str]) -> None:
+    namespace: Dict[str, Any] = {}
+    exec(f"from {module} import *", namespace)
+    del namespace["__builtins__"]
+    assert set(namespace) == set(sys.modules[module].__all__)
+    assert names <= set(namespace)
+    assert {"load", "parse_json", "parse_trusted", "warmup"} <= set(namespace)
+
+
+@pytest.mark.parametrize(
+    "statement, versions",
+    [
+        ("import openapi_pydantic", []),
+        ("import openapi_pydantic.v3", []),
+        ("from openapi_pydantic import OpenAPI", ["openapi_pydantic.v3.v3_1"]),
+        (
+            "from openapi_pydantic import parse_obj\n"
+            "parse_obj({'openapi': '3.1.1', 'info': {'title': 'a', 'version': '1'}})",
+            ["openapi_pydantic.v3.v3_1"],
+        ),
+        (
+            "from openapi_pydantic import parse_json\n"
+            'parse_json(\'{"openapi": "3.0.4", "info": {"title": "a", '
+            '"version": "1"}, "paths": {}}\')',
+            ["openapi_pydantic.v3.v3_0"],
+        ),
+    ],
+)
+def test_lazy_import(statement: str, versions: List[str]) -> None:
+    assert _imported_versions(statement) == versions
+
+
+def test_lazy_names() -> None:
+    for name in dir(openapi_pydantic):
+        if not name.startswith("_"):
+            getattr(openapi_pydantic, name)
+    assert openapi_pydantic.OpenAPI is v3.OpenAPI is v3_1.OpenAPI
+    assert openapi_pydantic.v3 is v3
+    assert v3.v3_1 is v3_1
+    assert {"OpenAPI", "parse_obj", "parse_trusted", "v3_0"} <= set(dir(v3))
+
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        openapi_pydantic.missing  # noqa: B018
+    with pytest.raises(ImportError):
+        from openapi_pydantic.v3 import missing  # noqa: F401
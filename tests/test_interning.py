@@ -0,0 +1,109 @@
+import io
+import json
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import load, parse_json, parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.base import is_frozen
+from openapi_pydantic.v3.interning import InternReport, intern_schemas
+
+UUID = {"type": "string", "format": "uuid"}
+TRUE = {"default": True}
+ONE = {"default": 1}
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "A": {"type": "object", "properties": {"id": UUID, "flag": TRUE}},
+                "B": {"type": "object", "properties": {"id": UUID, "flag": ONE}},
+                "C": {"type": "object", "properties": {"id": UUID, "flag": TRUE}},
+                "D": {"$ref": "#/components/schemas/A"},
+                "E": {"$ref": "#/components/schemas/A"},
+            }
+        },
+    }
+
+
+def _dump_json(obj: Any) -> str:
+    if PYDANTIC_V2:
+        return str(obj.model_dump_json(by_alias=True, exclude_unset=True))
+    return str(obj.json(by_alias=True, exclude_unset=True))
+
+
+@pytest.mark.parametrize(
+    "version, module", [("3.1.1", v3_1), ("3.0.4", v3_0)], ids=["3.1", "3.0"]
+)
+def test_intern_schemas(version: str, module: Any) -> None:
+    expected = parse_obj(_document(version))
+    open_api = parse_obj(_document(version))
+
+    report = intern_schemas(open_api)
+
+    assert isinstance(report, InternReport)
+    assert report.interned > 0 and report.bytes_saved > 0
+    assert report.nodes >= report.interned
+    assert open_api == expected
+    assert _dump_json(open_api) == _dump_json(expected)
+
+    assert open_api.components is not None and open_api.components.schemas
+    schemas: Any = open_api.components.schemas
+    properties = [schemas[name].properties for name in "ABC"]
+    assert properties[0]["id"] is properties[1]["id"] is properties[2]["id"]
+    # `True` and `1` are equal in Python, but not in JSON
+    assert schemas["A"] is schemas["C"]
+    assert schemas["A"] is not schemas["B"]
+    assert schemas["D"] is schemas["E"]
+
+    assert intern_schemas(open_api).interned == 0
+
+    # the shared objects are read-only, unlike their copies
+    with pytest.raises(TypeError, match="read-only"):
+        schemas["A"].title = "A"
+    assert schemas["A"].title is None
+    copy = schemas["A"].model_copy() if PYDANTIC_V2 else schemas["A"].copy()
+    copy.title = "A"
+    assert not is_frozen(copy) and is_frozen(schemas["A"])
+    assert not is_frozen(open_api)
+
+
+def test_intern_schemas_keeps_unset_fields() -> None:
+    schemas = v3_1.Components(
+        schemas={
+            "Unset": v3_1.Schema(type="string"),
+            "SetToNone": v3_1.Schema(type="string", format=None),
+        }
+    )
+    intern_schemas(schemas)
+    assert schemas.schemas is not None
+    assert schemas.schemas["Unset"] is not schemas.schemas["SetToNone"]
+
+
+def test_load_intern() -> None:
+    data = _document("3.1.1")
+    open_api = load(io.BytesIO(json.dumps(data).encode()), intern=True)
+    assert open_api == parse_obj(data)
+    assert open_api.components is not None and open_api.components.schemas
+    schemas: Any = open_api.components.schemas
+    assert schemas["A"].properties and schemas["B"].properties
+    assert schemas["A"].properties["id"] is schemas["B"].properties["id"]
+
+
+def test_parse_intern() -> None:
+    data = _document("3.1.1")
+    for open_api in (
+        parse_obj(data, intern=True),
+        parse_json(json.dumps(data), intern=True),
+    ):
+        assert open_api == parse_obj(data)
+        assert open_api.components is not None and open_api.components.schemas
+        schemas: Any = open_api.components.schemas
+        assert schemas["A"].properties["id"] is schemas["B"].properties["id"]
+        assert is_frozen(schemas["B"].properties["id"])
@@ -0,0 +1,170 @@
+import copy
+import io
+import json
+import pickle
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import ValidationError
+
+from openapi_pydantic import load, parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.lazy import LazyDict
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            f"/pets/{i}": {
+                "get": {
+                    "operationId": f"getPet{i}",
+                    "responses": {"200": {"description": "A pet"}},
+                }
+            }
+            for i in range(3)
+        },
+    }
+
+
+def _dump(obj: Any) -> Any:
+    if PYDANTIC_V2:
+        return obj.model_dump(by_alias=True, exclude_none=True)
+    return obj.dict(by_alias=True, exclude_none=True)
+
+
+@pytest.mark.parametrize(
+    "version, module", [("3.1.1", v3_1), ("3.0.4", v3_0)], ids=["3.1", "3.0"]
+)
+def test_parse_obj_lazy(version: str, module: Any) -> None:
+    data = _document(version)
+    expected = parse_obj(data)
+    result = parse_obj(data, lazy=True)
+    assert isinstance(result, module.OpenAPI)
+    assert isinstance(result.paths, LazyDict)
+    assert result.paths.pending == {"/pets/0", "/pets/1", "/pets/2"}
+
+    path_item = result.paths["/pets/1"]
+    assert isinstance(path_item, module.PathItem)
+    assert path_item.get and path_item.get.operationId == "getPet1"
+    assert result.paths["/pets/1"] is path_item
+    assert result.paths.get("/nope") is None
+    assert "/pets/2" in result.paths and len(result.paths) == 3
+    assert result.paths.pending == {"/pets/0", "/pets/2"}
+
+    assert _dump(result) == _dump(expected)
+    assert not result.paths.pending
+    assert result == expected
+
+
+def test_parse_obj_lazy_equality_and_copies() -> None:
+    data = _document("3.1.1")
+    expected = parse_obj(data)
+    assert parse_obj(data, lazy=True) == expected
+    assert expected == parse_obj(data, lazy=True)
+    assert parse_obj(data, lazy=True).paths == parse_obj(data, lazy=True).paths
+
+    result = parse_obj(data, lazy=True)
+    assert isinstance(result.paths, LazyDict)
+    copied = copy.deepcopy(result)
+    assert isinstance(copied.paths, LazyDict) and len(copied.paths.pending) == 3
+    assert copied == expected
+    assert len(result.paths.pending) == 3
+    assert dict(result.paths) == expected.paths
+    assert pickle.loads(pickle.dumps(parse_obj(data, lazy=True))) == expected
+
+
+def test_load_lazy() -> None:
+    data = _document("3.1.1")
+    result = load(io.BytesIO(json.dumps(data).encode()), lazy=True)
+    assert isinstance(result.paths, LazyDict)
+    assert len(result.paths.pending) == 3
+    # the raw values are JSON text
+    assert isinstance(dict.__getitem__(result.paths, "/pets/0"), str)
+    assert isinstance(result.paths["/pets/0"], v3_1.PathItem)
+    assert result == parse_obj(data)
+
+
+def test_lazy_dict_mutations() -> None:
+    lazy: LazyDict[int] = LazyDict({"a": "1", "b": "2", "c": "3"}, int)
+    lazy["a"] = 10
+    assert lazy.pending == {"b", "c"}
+    assert lazy.pop("b") == 2
+    assert lazy.pop("b", None) is None
+    assert lazy.setdefault("c", 0) == 3
+    lazy.update({"d": 4})
+    assert lazy == {"a": 10, "c": 3, "d": 4}
+    del lazy["d"]
+    assert lazy.popitem() == ("c", 3)
+    assert lazy | {"e": 5} == {"a": 10, "e": 5}
+
+
+def test_lazy_dict_validates_once_across_threads() -> None:
+    calls: List[str] = []
+
+    def validator(value: str) -> int:
+        calls.append(value)
+        time.sleep(0.01)
+        return int(value)
+
+    lazy = LazyDict({"a": "1"}, validator)
+    results: List[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(lazy["a"])) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1] * 8
+    assert calls == ["1"]
+
+
+@pytest.mark.parametrize(
+    "version, module", [("3.1.1", v3_1), ("3.0.4", v3_0)], ids=["3.1", "3.0"]
+)
+def test_parse_obj_lazy_components(version: str, module: Any) -> None:
+    data = {
+        **_document(version),
+        "components": {
+            "schemas": {"Pet": {"type": "object"}, "Pets": {"type": "array"}},
+            "responses": {"NotFound": {"description": "Not found"}},
+            "securitySchemes": {"key": {"type": "apiKey", "name": "k", "in": "query"}},
+        },
+    }
+    expected = parse_obj(data)
+    result = parse_obj(data, lazy=True)
+    assert result.components is not None
+    schemas = result.components.schemas
+    assert isinstance(schemas, LazyDict) and schemas.pending == {"Pet", "Pets"}
+    assert isinstance(schemas["Pet"], module.Schema)
+    assert schemas.pending == {"Pets"}
+    assert isinstance(result.components.responses, LazyDict)
+    assert result.components.parameters is None
+
+    result.ensure_all_valid()
+    assert not schemas.pending
+    assert isinstance(result.paths, LazyDict) and not result.paths.pending
+    assert result == expected
+
+    streamed = load(io.BytesIO(json.dumps(data).encode()), lazy=True)
+    assert streamed.components is not None
+    assert isinstance(streamed.components.securitySchemes, LazyDict)
+    assert _dump(streamed) == _dump(expected)
+
+
+def test_ensure_all_valid() -> None:
+    data = {
+        **_document("3.1.1"),
+        "components": {"responses": {"Bad": {"content": "nope"}}},
+    }
+    result = parse_obj(data, lazy=True)
+    assert result.components is not None
+    with pytest.raises(ValidationError):
+        result.components.ensure_all_valid()
+    with pytest.raises(ValidationError):
+        result.ensure_all_valid()
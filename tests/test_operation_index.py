@@ -0,0 +1,127 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_1
+from openapi_pydantic.v3.operation_index import (
+    OperationIndex,
+    invalidate_operation_index,
+    operation_index,
+)
+
+
+def _operation(operation_id: str, tags: List[str]) -> Dict[str, Any]:
+    return {
+        "operationId": operation_id,
+        "tags": tags,
+        "responses": {"200": {"description": "OK"}},
+    }
+
+
+def _document(version: str) -> Dict[str, Any]:
+    subscribe = _operation("subscribe", ["events"])
+    subscribe["callbacks"] = {
+        "onEvent": {"{$request.body#/url}": {"post": _operation("onEvent", ["events"])}}
+    }
+    data = {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            "/pets": {
+                "get": _operation("listPets", ["pets"]),
+                "post": _operation("createPet", ["pets", "admin"]),
+            },
+            "/pets/{petId}": {"get": _operation("getPet", ["pets"])},
+            "/subscriptions": {"post": subscribe},
+            "/other": {"$ref": "#/paths/~1pets"},
+        },
+    }
+    if version.startswith("3.1"):
+        data["webhooks"] = {"newPet": {"post": _operation("newPet", ["pets"])}}
+    return data
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_operation_index(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    index = open_api.operations()
+    assert isinstance(index, OperationIndex)
+
+    entry = index.get("getPet")
+    assert entry is not None
+    assert entry.method == "get" and entry.path == "/pets/{petId}"
+    assert entry.pointer == "#/paths/~1pets~1{petId}/get"
+    assert open_api.paths is not None
+    assert entry.path_item is open_api.paths["/pets/{petId}"]
+    assert entry.operation is open_api.paths["/pets/{petId}"].get
+    assert index.get("missing") is None
+
+    found = index.find("POST", "/pets")
+    assert found is not None and found.operation.operationId == "createPet"
+    assert index.find("delete", "/pets") is None
+
+    callback = index.get("onEvent")
+    assert callback is not None
+    assert callback.pointer == (
+        "#/paths/~1subscriptions/post/callbacks/onEvent/{$request.body#~1url}/post"
+    )
+    assert [e.operation.operationId for e in index.with_tag("events")] == [
+        "subscribe",
+        "onEvent",
+    ]
+    assert [e.operation.operationId for e in index.with_tag("admin")] == ["createPet"]
+    assert index.with_tag("missing") == []
+
+    expected = ["listPets", "createPet", "getPet", "subscribe", "onEvent"]
+    if version.startswith("3.1"):
+        webhook = index.get("newPet")
+        assert webhook is not None and webhook.pointer == "#/webhooks/newPet/post"
+        assert index.find("post", "newPet") is None
+        expected.append("newPet")
+    assert [e.operation.operationId for e in index] == expected
+    assert len(index) == len(expected)
+
+
+def test_operation_index_cache() -> None:
+    open_api = parse_obj(_document("3.1.1"))
+    assert isinstance(open_api, v3_1.OpenAPI) and open_api.paths is not None
+    index = open_api.operations()
+    assert open_api.operations() is index
+    assert operation_index(open_api) is index
+    # an equal document has its own index
+    assert operation_index(parse_obj(_document("3.1.1"))) is not index
+
+    open_api.paths["/owners"] = v3_1.PathItem(
+        get=v3_1.Operation(operationId="listOwners", responses={})
+    )
+    index = open_api.operations()
+    assert index.get("listOwners") is not None
+
+    # replacing a value of a plain dict is not detected
+    open_api.paths["/owners"] = v3_1.PathItem(
+        get=v3_1.Operation(operationId="getOwners", responses={})
+    )
+    assert open_api.operations() is index
+    invalidate_operation_index(open_api)
+    index = open_api.operations()
+    assert index.get("listOwners") is None
+    owners = open_api.paths["/owners"]
+    assert owners.get is not None and index.get("getOwners") is not None
+    # the updates of the fields of the OpenAPI objects are detected
+    owners.get.operationId = "findOwners"
+    assert open_api.operations().get("findOwners") is not None
+    owners.get.tags = ["owners"]
+    assert len(open_api.operations().with_tag("owners")) == 1
+    owners.get = None
+    index = open_api.operations()
+    assert index.get("findOwners") is None
+    assert open_api.operations() is index
+
+    invalidate_operation_index(open_api)
+    assert open_api.operations() is not index
+
+    open_api.paths = {}
+    assert [e.operation.operationId for e in open_api.operations()] == ["newPet"]
+    open_api.webhooks = None
+    assert len(open_api.operations()) == 0
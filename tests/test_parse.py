@@ -1,9 +1,14 @@
-from typing import Literal
+import io
+import json
+from pathlib import Path
+from typing import Any, Literal
 
 import pytest
+from pydantic import ValidationError
 
-from openapi_pydantic import parse_obj
+from openapi_pydantic import load, parse_json, parse_obj
 from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.parser import _sniff_version
 
 
 @pytest.mark.parametrize("version", ["3.0.4", "3.0.3", "3.0.2", "3.0.1", "3.0.0"])
@@ -40,3 +45,154 @@ def test_parse_obj_3_1(version: Literal["3.1.1", "3.1.0"]) -> None:
         info=v3_1.Info(title="foo", version="0.1.0"),
         paths={"/": v3_1.PathItem()},
     )
+
+
+@pytest.mark.parametrize(
+    "version, module", [("3.1.1", v3_1), ("3.0.4", v3_0)], ids=["3.1", "3.0"]
+)
+def test_parse_json(version: str, module: Any) -> None:
+    data = {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {"/": {}},
+    }
+    expected = parse_obj(data)
+    assert isinstance(expected, module.OpenAPI)
+    assert parse_json(json.dumps(data)) == expected
+    assert parse_json(json.dumps(data).encode()) == expected
+    assert parse_json(bytearray(json.dumps(data).encode())) == expected
+
+
+def test_parse_json_nested_openapi_keys() -> None:
+    # with sorted keys, "openapi" keys of nested objects come first
+    document = json.dumps(
+        {
+            "components": {
+                "examples": {
+                    "Nested": {"value": {"openapi": "3.0.4"}},
+                    "Quoted": {"value": '{"openapi": "3.0.4"}'},
+                }
+            },
+            "info": {"title": "foo {[", "version": "0.1.0"},
+            "openapi": "3.1.1",
+        },
+        sort_keys=True,
+    )
+    assert _sniff_version(document) == "3.1.1"
+    assert isinstance(parse_json(document), v3_1.OpenAPI)
+
+
+def test_parse_json_version_after_sniff_limit() -> None:
+    document = json.dumps(
+        {
+            "info": {"title": "foo", "version": "0.1.0", "x-padding": "x" * 65536},
+            "openapi": "3.0.4",
+            "paths": {},
+        }
+    )
+    assert _sniff_version(document) is None
+    assert isinstance(parse_json(document), v3_0.OpenAPI)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"info": {"title": "foo", "version": "0.1.0"}}',
+        b'{"openapi": "2.0", "info": {"title": "foo", "version": "0.1.0"}}',
+        b'{"info": {"title": "foo", "version": "0.1.0"}, "openapi": 3}',
+    ],
+)
+def test_parse_json_unsupported_version(document: bytes) -> None:
+    with pytest.raises(ValidationError):
+        parse_json(document)
+    with pytest.raises(ValidationError):
+        parse_obj(json.loads(document))
+
+
+SWAGGER_DOCUMENT = Path(__file__).parent / "data" / "swagger_openapi_v3.0.1.json"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_load(chunk_size: int) -> None:
+    expected = parse_json(SWAGGER_DOCUMENT.read_bytes())
+    assert load(SWAGGER_DOCUMENT, chunk_size=chunk_size) == expected
+    assert load(str(SWAGGER_DOCUMENT), chunk_size=chunk_size) == expected
+    text = io.StringIO(SWAGGER_DOCUMENT.read_text())
+    assert load(text, chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_load_streamed_sections(version: str) -> None:
+    data = {
+        "openapi": version,
+        "info": {"title": "f\u00f6\u00f6", "version": "0.1.0"},
+        "paths": {
+            "/pets/{petId}": {
+                "get": {"responses": {"200": {"$ref": "#/components/responses/Pet"}}}
+            },
+            "/empty": {},
+        },
+        "webhooks": {"newPet": {"post": {"responses": {"200": {"description": ""}}}}},
+        "components": {
+            "schemas": {"Pet": {"type": "object", "maxProperties": 1000000}},
+            "responses": {"Pet": {"description": "A pet"}},
+            "parameters": {},
+            "x-extension": [1, 2.5, None, True],
+        },
+        "x-number": 123456789,
+    }
+    # with 3.0, "webhooks" is an extra value
+    # a number at the end of a chunk may continue in the next one
+    document = json.dumps(data, indent=2).encode()
+    expected = parse_obj(data)
+    for chunk_size in range(1, 12):
+        assert load(io.BytesIO(document), chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_extra_webhooks(lazy: bool) -> None:
+    data = {
+        "openapi": "3.0.4",
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {},
+        "webhooks": {"newPet": {"post": {}}},
+    }
+    result = load(io.BytesIO(json.dumps(data).encode()), lazy=lazy)
+    assert isinstance(result, v3_0.OpenAPI)
+    assert result == parse_obj(data)
+
+
+def test_load_version_after_paths() -> None:
+    document = b"""{
+        "paths": {"/": {"get": {"responses": {"200": {"description": ""}}}}},
+        "info": {"title": "foo", "version": "0.1.0"},
+        "openapi": "3.0.4"
+    }"""
+    result = load(io.BytesIO(document))
+    assert isinstance(result, v3_0.OpenAPI)
+    assert result == parse_json(document)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'{"openapi": "3.1.1", "info": {"title": "foo", "version": "0.1.0"}',
+        b'{"openapi": "3.1.1", "info": {"title": "foo", "version": "0.1.0"}} []',
+        b'{"openapi": "3.1.1", "info": {"title": "foo", "version": "0.1.0"},}',
+        b'{"openapi": "3.1.1", "paths": {"/": {}] }',
+        b"[]",
+    ],
+)
+def test_load_invalid_json(document: bytes) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        load(io.BytesIO(document), chunk_size=4)
+
+
+def test_load_invalid_entry() -> None:
+    document = b"""{
+        "openapi": "3.1.1",
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {"/": {"get": {"responses": "nope"}}}
+    }"""
+    with pytest.raises(ValidationError):
+        load(io.BytesIO(document))
@@ -0,0 +1,163 @@
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_1
+from openapi_pydantic.v3.pruning import prune_unused_components
+
+
+def _ref(section: str, name: str) -> Dict[str, str]:
+    return {"$ref": f"#/components/{section}/{name}"}
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "security": [{"apiKey": []}],
+        "paths": {
+            "/pets/{petId}": {
+                "parameters": [_ref("parameters", "PetId")],
+                "get": {
+                    "security": [{"oauth/2": ["read"]}],
+                    "responses": {
+                        "200": {
+                            "description": "A pet",
+                            "content": {
+                                "application/json": {"schema": _ref("schemas", "Pet")}
+                            },
+                        },
+                        "404": _ref("responses", "NotFound"),
+                    },
+                },
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "oneOf": [_ref("schemas", "Cat"), _ref("schemas", "Dog")],
+                    "discriminator": {
+                        "propertyName": "kind",
+                        "mapping": {"cat": "#/components/schemas/Cat", "dog": "Dog"},
+                    },
+                },
+                "Cat": {"properties": {"owner": _ref("schemas", "OwnerAlias")}},
+                "OwnerAlias": _ref("schemas", "Owner"),
+                "Dog": {"type": "object"},
+                "Owner": {"type": "object"},
+                "Error": {"type": "object"},
+                "Unused": {"properties": {"error": _ref("schemas", "Error")}},
+                "Cycle": {"properties": {"next": _ref("schemas", "Cycle")}},
+            },
+            "responses": {
+                "NotFound": {
+                    "description": "Not found",
+                    "content": {
+                        "application/json": {"schema": _ref("schemas", "Error")}
+                    },
+                },
+                "Unused": {"description": "Unused"},
+            },
+            "parameters": {
+                "PetId": {"name": "petId", "in": "path", "required": True},
+                "Unused": {"name": "q", "in": "query"},
+            },
+            "securitySchemes": {
+                "apiKey": {"type": "apiKey", "name": "key", "in": "header"},
+                "oauth/2": {
+                    "type": "oauth2",
+                    "flows": {"implicit": {"authorizationUrl": "/", "scopes": {}}},
+                },
+                "unused": {"type": "http", "scheme": "basic"},
+            },
+            "x-extension": {"kept": True},
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_prune_unused_components(version: str) -> None:
+    data = _document(version)
+    open_api = parse_obj(data)
+    expected_components: Any = data["components"]
+    for section in ("schemas", "responses", "parameters"):
+        expected_components[section].pop("Unused")
+    expected_components["schemas"].pop("Cycle")
+    expected_components["securitySchemes"].pop("unused")
+
+    pruned = prune_unused_components(open_api)
+
+    assert pruned == parse_obj(data)
+    assert pruned.paths is open_api.paths
+    # the given object is not updated
+    assert open_api.components and open_api.components.schemas
+    assert "Unused" in open_api.components.schemas
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_prune_unused_components_roots(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    pruned = prune_unused_components(
+        open_api,
+        roots=["#/components/schemas/Unused", "#/components/responses/Unused/x"],
+    )
+    assert pruned.components is not None
+    assert pruned.components.schemas and pruned.components.responses
+    assert "Unused" in pruned.components.schemas
+    assert "Error" in pruned.components.schemas
+    assert "Unused" in pruned.components.responses
+    assert "Cycle" not in pruned.components.schemas
+
+
+def test_prune_unused_components_nothing_to_prune() -> None:
+    open_api = parse_obj(
+        {"openapi": "3.1.1", "info": {"title": "foo", "version": "0.1.0"}}
+    )
+    assert prune_unused_components(open_api) is open_api
+    open_api = parse_obj(
+        {
+            "openapi": "3.1.1",
+            "info": {"title": "foo", "version": "0.1.0"},
+            "webhooks": {"pet": {"post": {"requestBody": _ref("requestBodies", "P")}}},
+            "components": {"requestBodies": {"P": {"content": {}}}},
+        }
+    )
+    assert prune_unused_components(open_api) is open_api
+
+
+def test_prune_unused_components_lazy() -> None:
+    data = _document("3.1.1")
+    data["components"]["schemas"]["Unused"] = {"type": 1}
+    open_api = parse_obj(data, lazy=True)
+    pruned = prune_unused_components(open_api)
+    assert pruned.components is not None and pruned.components.schemas
+    assert "Unused" not in pruned.components.schemas
+
+
+def test_prune_unused_components_path_item_refs() -> None:
+    data: Dict[str, Any] = {
+        "openapi": "3.1.1",
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {"/pets": _ref("pathItems", "Pets")},
+        "webhooks": {"pet": _ref("pathItems", "Hook")},
+        "components": {
+            "pathItems": {
+                "Pets": {"get": {"responses": {"200": _ref("responses", "Pets")}}},
+                "Hook": {"post": {"requestBody": _ref("requestBodies", "Pet")}},
+                "Unused": {"get": {"responses": {"200": _ref("responses", "Unused")}}},
+            },
+            "responses": {
+                "Pets": {"description": "Pets"},
+                "Unused": {"description": "Unused"},
+            },
+            "requestBodies": {"Pet": {"content": {}}},
+        },
+    }
+    pruned = prune_unused_components(parse_obj(data))
+    components = pruned.components
+    assert isinstance(components, v3_1.Components)
+    assert components.pathItems and components.responses
+    assert sorted(components.pathItems) == ["Hook", "Pets"]
+    assert sorted(components.responses) == ["Pets"]
+    assert components.requestBodies and "Pet" in components.requestBodies
@@ -0,0 +1,112 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.compat import PYDANTIC_V2, ReferenceUnion
+from openapi_pydantic.v3 import v3_0, v3_1
+
+
+def _validate(cls: Any, data: Any) -> Any:
+    return cls.model_validate(data) if PYDANTIC_V2 else cls.parse_obj(data)
+
+
+@pytest.mark.parametrize("module", [v3_1, v3_0], ids=["3.1", "3.0"])
+def test_reference_union(module: Any) -> None:
+    schema = _validate(
+        module.Schema,
+        {
+            "allOf": [
+                {"$ref": "#/components/schemas/Pet"},
+                {"type": "object", "description": "A pet"},
+                module.Reference(ref="#/components/schemas/Tag"),
+                module.Schema(type="string"),
+            ],
+            "additionalProperties": False,
+        },
+    )
+
+    assert [type(value) for value in schema.allOf] == [
+        module.Reference,
+        module.Schema,
+        module.Reference,
+        module.Schema,
+    ]
+    assert schema.additionalProperties is False
+    additional = _validate(module.Schema, {"additionalProperties": {"$ref": "#/a"}})
+    assert isinstance(additional.additionalProperties, module.Reference)
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_reference_union_document(version: str) -> None:
+    open_api: Any = parse_obj(
+        {
+            "openapi": version,
+            "info": {"title": "foo", "version": "1"},
+            "paths": {
+                "/pets": {
+                    "parameters": [
+                        {"$ref": "#/components/parameters/Limit"},
+                        {"name": "offset", "in": "query"},
+                    ],
+                    "get": {"responses": {"200": {"$ref": "#/responses/Ok"}}},
+                },
+                "/cats": {"$ref": "#/paths/~1pets"},
+            },
+        }
+    )
+
+    path_item = open_api.paths["/pets"]
+    assert [type(value).__name__ for value in path_item.parameters] == [
+        "Reference",
+        "Parameter",
+    ]
+    assert type(path_item.get.responses["200"]).__name__ == "Reference"
+    # a path item has its own "$ref"
+    assert type(open_api.paths["/cats"]).__name__ == "PathItem"
+
+
+def test_reference_union_invalid() -> None:
+    with pytest.raises(ValidationError):
+        _validate(v3_1.Schema, {"allOf": ["Pet"]})
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="Pydantic 1 has no discriminator")
+def test_reference_union_invalid_reference() -> None:
+    # not a `Schema` with an extra "$ref" value
+    with pytest.raises(ValidationError, match=r"allOf\.0\.reference\.\$ref"):
+        _validate(v3_1.Schema, {"allOf": [{"$ref": 1}]})
+
+
+def test_reference_union_path_items() -> None:
+    components = _validate(
+        v3_1.Components,
+        {
+            "pathItems": {
+                "Pets": {"$ref": "#/x", "summary": "Pets"},
+                "Cats": {"get": {"responses": {}}},
+            }
+        },
+    )
+
+    # the "$ref" of a path item is its own field, as in `paths`
+    assert [type(value) for value in components.pathItems.values()] == [
+        v3_1.PathItem,
+        v3_1.PathItem,
+    ]
+    assert components.pathItems["Pets"].ref == "#/x"
+    if PYDANTIC_V2:
+        reference = v3_1.Reference(**{"$ref": "#/y"})
+        components = _validate(v3_1.Components, {"pathItems": {"Dogs": reference}})
+        assert components.pathItems["Dogs"] is reference
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="Pydantic 1 has no discriminator")
+def test_reference_union_other_reference() -> None:
+    class Reference(v3_1.Schema):
+        pass
+
+    # the class is found by identity, not by name
+    with pytest.raises(TypeError, match="no Reference class"):
+        ReferenceUnion[v3_1.Schema, Reference]
@@ -0,0 +1,146 @@
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.lazy import LazyDict
+from openapi_pydantic.v3.resolver import RefResolver
+
+
+def sample_spec(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            "/pets/{petId}": {
+                "get": {
+                    "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                    "responses": {
+                        "200": {
+                            "description": "A pet",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Pet"}
+                                }
+                            },
+                        },
+                        "default": {"$ref": "#/components/responses/Error"},
+                    },
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string", "format": "name"}},
+                },
+            },
+            "parameters": {
+                "PetId": {
+                    "name": "petId",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                }
+            },
+            "responses": {
+                "Error": {"$ref": "#/components/responses/GeneralError"},
+                "GeneralError": {"description": "General error"},
+                "Loop1": {"$ref": "#/components/responses/Loop2"},
+                "Loop2": {"$ref": "#/components/responses/Loop1"},
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "version, module", [("3.1.1", v3_1), ("3.0.4", v3_0)], ids=["3.1", "3.0"]
+)
+def test_resolve_components(version: str, module: Any) -> None:
+    open_api = parse_obj(sample_spec(version))
+    assert open_api.components is not None
+    assert open_api.components.schemas is not None
+    assert open_api.components.parameters is not None
+    resolver = RefResolver(open_api)
+
+    pet = resolver.resolve("#/components/schemas/Pet")
+    assert isinstance(pet, module.Schema)
+    assert pet is open_api.components.schemas["Pet"]
+
+    parameter = resolver.resolve("#/components/parameters/PetId")
+    assert parameter is open_api.components.parameters["PetId"]
+
+    error = resolver.resolve("#/components/responses/Error")
+    assert isinstance(error, module.Response)
+    assert error.description == "General error"
+    assert isinstance(resolver.lookup("#/components/responses/Error"), module.Reference)
+    assert resolver.resolve(module.Reference(ref="#/components/responses/Error")) is (
+        error
+    )
+
+
+def test_resolve_paths_and_scalars() -> None:
+    open_api = parse_obj(sample_spec("3.1.1"))
+    assert open_api.paths is not None
+    resolver = RefResolver(open_api)
+
+    operation = resolver.resolve("#/paths/~1pets~1%7BpetId%7D/get")
+    assert operation is open_api.paths["/pets/{petId}"].get
+    assert isinstance(
+        resolver.lookup("#/paths/~1pets~1{petId}/get/parameters/0"), v3_1.Reference
+    )
+    assert isinstance(
+        resolver.resolve("#/paths/~1pets~1{petId}/get/parameters/0"), v3_1.Parameter
+    )
+    assert resolver.lookup("#/components/parameters/PetId/in") == "path"
+    assert resolver.lookup("#/components/schemas/Pet/properties/name/format") == (
+        "name"
+    )
+    assert resolver.lookup("#/info/title") == "foo"
+    assert resolver.lookup("#") is open_api
+    assert "#/components/schemas/Pet" in resolver
+    assert "#/components/schemas/Cat" not in resolver
+
+
+def test_resolve_errors() -> None:
+    resolver = RefResolver(parse_obj(sample_spec("3.1.1")))
+    with pytest.raises(ValueError, match="Circular reference"):
+        resolver.resolve("#/components/responses/Loop1")
+    with pytest.raises(ValueError, match="Unresolvable reference"):
+        resolver.resolve("#/components/schemas/Cat")
+    with pytest.raises(ValueError, match="Only local references"):
+        resolver.resolve("Pet.json")
+    for anchor in ("#foo", "#%66oo", "#foo/bar"):
+        with pytest.raises(ValueError, match="Only JSON pointer references"):
+            resolver.resolve(anchor)
+        assert anchor not in resolver
+
+
+def test_resolve_lazy() -> None:
+    open_api = parse_obj(sample_spec("3.1.1"), lazy=True)
+    assert open_api.paths is not None and open_api.components is not None
+    schemas = open_api.components.schemas
+    responses = open_api.components.responses
+    assert isinstance(schemas, LazyDict) and isinstance(responses, LazyDict)
+    assert isinstance(open_api.paths, LazyDict)
+    resolver = RefResolver(open_api)
+    # the pending values are not validated to build the index
+    assert schemas.pending == {"Pet"}
+    assert open_api.paths.pending == {"/pets/{petId}"}
+
+    assert resolver.lookup("#/components/schemas/Pet/properties/name/format") == (
+        "name"
+    )
+    assert schemas.pending == set()
+    assert resolver.lookup("#/components/schemas/Pet") is schemas["Pet"]
+
+    error = resolver.resolve("#/components/responses/Error")
+    assert error is responses["GeneralError"]
+    assert responses.pending == {"Loop1", "Loop2"}
+
+    operation = resolver.resolve("#/paths/~1pets~1%7BpetId%7D/get")
+    assert operation is open_api.paths["/pets/{petId}"].get
+    assert "#/components/parameters/Missing" not in resolver
+    assert "#/paths/~1cats" not in resolver
@@ -0,0 +1,91 @@
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3.router import compile_router
+
+
+def _operation(operation_id: str) -> Dict[str, Any]:
+    return {"operationId": operation_id, "responses": {"200": {"description": "OK"}}}
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            "/users": {"get": _operation("listUsers")},
+            "/users/{userId}": {
+                "get": _operation("getUser"),
+                "delete": _operation("deleteUser"),
+            },
+            "/users/me": {"get": _operation("getMe")},
+            "/users/{userId}/orders/{orderId}": {"get": _operation("getOrder")},
+            "/users/me/orders/latest": {"get": _operation("getLatestOrder")},
+            "/files/{name}.{extension}": {"get": _operation("getFile")},
+            "/files/{path}": {"get": _operation("getPath")},
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+@pytest.mark.parametrize(
+    "method, path, operation_id, path_params",
+    [
+        ("GET", "/users", "listUsers", {}),
+        ("get", "/users/42", "getUser", {"userId": "42"}),
+        ("DELETE", "/users/42", "deleteUser", {"userId": "42"}),
+        ("GET", "/users/me", "getMe", {}),
+        ("GET", "/users/42/orders/7", "getOrder", {"userId": "42", "orderId": "7"}),
+        # backtracks from the concrete "me" segment
+        ("GET", "/users/me/orders/7", "getOrder", {"userId": "me", "orderId": "7"}),
+        ("GET", "/users/me/orders/latest", "getLatestOrder", {}),
+        ("GET", "/users/a%20b", "getUser", {"userId": "a b"}),
+        ("GET", "/files/a.b.txt", "getFile", {"name": "a", "extension": "b.txt"}),
+        ("GET", "/files/readme", "getPath", {"path": "readme"}),
+    ],
+)
+def test_router_match(
+    version: str,
+    method: str,
+    path: str,
+    operation_id: str,
+    path_params: Dict[str, str],
+) -> None:
+    open_api = parse_obj(_document(version))
+    assert open_api.paths is not None
+    match = compile_router(open_api).match(method, path)
+    assert match is not None
+    path_item, operation, params = match
+    assert operation.operationId == operation_id
+    assert path_item in open_api.paths.values()
+    assert params == path_params
+
+
+@pytest.mark.parametrize("path", ["/", "/users/", "/users//orders/7", "/pets/1"])
+def test_router_no_match(path: str) -> None:
+    router = compile_router(parse_obj(_document("3.1.1")))
+    assert router.match("GET", path) is None
+
+
+def test_router_method_without_operation() -> None:
+    router = compile_router(parse_obj(_document("3.1.1")))
+    match = router.match("POST", "/users/42")
+    assert match is not None
+    assert match.operation is None
+    assert match.path_params == {"userId": "42"}
+    match = router.match("CONNECT", "/users")
+    assert match is not None and match.operation is None
+
+
+def test_router_lazy() -> None:
+    open_api = parse_obj(_document("3.1.1"), lazy=True)
+    router = compile_router(open_api)
+    assert open_api.paths is not None
+    paths: Any = open_api.paths
+    assert len(paths.pending) == len(paths)
+    match = router.match("GET", "/users/42")
+    assert match is not None and match.operation.operationId == "getUser"
+    assert "/users/{userId}" not in paths.pending
+    assert "/users" in paths.pending
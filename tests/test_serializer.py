@@ -0,0 +1,154 @@
+import json
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.serializer import invalidate_json_bytes, to_json_bytes
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "Pets 🐈", "version": "0.1.0"},
+        "paths": {
+            "/pets/{petId}": {
+                "get": {
+                    "parameters": [
+                        {
+                            "name": "petId",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string", "format": "uuid"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "A pet",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Pet"}
+                                }
+                            },
+                        }
+                    },
+                    "x-internal": False,
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {"type": "string", "not": {"enum": [""]}},
+                        "tag": {"type": "string", "readOnly": False},
+                    },
+                }
+            },
+            "securitySchemes": {
+                "key": {"type": "apiKey", "name": "key", "in": "header"}
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_to_json_bytes(version: str) -> None:
+    data = _document(version)
+
+    result = to_json_bytes(parse_obj(data))
+
+    # the aliases, without the default values, and the values which are set
+    assert json.loads(result) == data
+    assert "🐈".encode() in result
+    assert b", " not in result
+
+
+def test_to_json_bytes_sort_keys() -> None:
+    open_api = parse_obj(_document("3.1.1"))
+
+    result = to_json_bytes(open_api, sort_keys=True)
+
+    assert result.startswith(b'{"components":{"schemas":{"Pet":{"properties":')
+    assert json.loads(result) == json.loads(to_json_bytes(open_api))
+
+
+@pytest.mark.parametrize("open_api_class", [v3_1.OpenAPI, v3_0.OpenAPI])
+def test_to_json_bytes_default_version(open_api_class: Any) -> None:
+    open_api = open_api_class(info={"title": "foo", "version": "1"}, paths={})
+
+    result = json.loads(to_json_bytes(open_api))
+
+    assert result == {
+        "openapi": open_api.openapi,
+        "info": {"title": "foo", "version": "1"},
+        "paths": {},
+    }
+
+
+def test_to_json_bytes_cache() -> None:
+    open_api: Any = parse_obj(_document("3.1.1"))
+    result = to_json_bytes(open_api)
+    assert to_json_bytes(open_api) is result
+
+    # an added path
+    open_api.paths["/health"] = v3_1.PathItem(summary="Health")
+    added = to_json_bytes(open_api)
+    assert added is not result and b"/health" in added
+
+    # a replaced field
+    open_api.info = v3_1.Info(title="bar", version="0.2.0")
+    replaced = to_json_bytes(open_api)
+    assert json.loads(replaced)["info"]["title"] == "bar"
+
+    # a nested update
+    open_api.info.title = "baz"
+    updated = to_json_bytes(open_api)
+    assert json.loads(updated)["info"]["title"] == "baz"
+    assert to_json_bytes(open_api) is updated
+
+    # a replaced path item, which needs an invalidation, and an update under an
+    # unchanged top-level field
+    open_api.paths["/health"] = v3_1.PathItem(summary="Status")
+    assert to_json_bytes(open_api) is updated
+    invalidate_json_bytes(open_api)
+    swapped = to_json_bytes(open_api)
+    assert json.loads(swapped)["paths"]["/health"] == {"summary": "Status"}
+    open_api.paths["/health"].description = "The status"
+    assert b"The status" in to_json_bytes(open_api)
+    open_api.paths["/health"].description = None
+    assert to_json_bytes(open_api) == swapped
+
+    # an extra value
+    open_api.paths["/health"].summary = "Health"
+    open_api.info.x_logo = {"url": "/logo.png"}  # type: ignore[attr-defined,unused-ignore]
+    assert b"/logo.png" in to_json_bytes(open_api)
+
+    result = to_json_bytes(open_api)
+    invalidate_json_bytes(open_api)
+    assert to_json_bytes(open_api) is not result
+
+
+def test_to_json_bytes_cache_lazy() -> None:
+    open_api: Any = parse_obj(_document("3.1.1"), lazy=True)
+    assert open_api.paths.pending
+
+    result = to_json_bytes(open_api)
+
+    # validating the pending values is not an update
+    assert not open_api.paths.pending
+    assert to_json_bytes(open_api) is result
+    open_api.paths["/health"] = v3_1.PathItem(summary="Health")
+    assert b"/health" in to_json_bytes(open_api)
+
+
+def test_to_json_bytes_schema() -> None:
+    schema = v3_1.Schema(type="object", properties={"id": {"type": "string"}})
+
+    assert json.loads(to_json_bytes(schema)) == {
+        "type": "object",
+        "properties": {"id": {"type": "string"}},
+    }
@@ -0,0 +1,208 @@
+import gc
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import snapshot as snapshot_module
+from openapi_pydantic.v3.interning import intern_schemas
+from openapi_pydantic.v3.serializer import to_json_bytes
+from openapi_pydantic.v3.snapshot import (
+    KEY_FILE,
+    SNAPSHOT_SUFFIX,
+    load_cached,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "Pets 🐈", "version": "0.1.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "parameters": [
+                        {"name": "limit", "in": "query", "schema": {"type": "integer"}}
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "The pets",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "array",
+                                        "items": {"$ref": "#/components/schemas/Pet"},
+                                    }
+                                }
+                            },
+                        }
+                    },
+                    "x-internal": True,
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "name": {"type": "string", "not": {"enum": [""]}},
+                    },
+                }
+            }
+        },
+    }
+
+
+def _write(path: Path, version: str) -> Path:
+    source = path / "openapi.json"
+    source.write_text(json.dumps(_document(version)))
+    return source
+
+
+def _snapshots(cache_dir: Path) -> List[Path]:
+    return sorted(cache_dir.glob(f"*{SNAPSHOT_SUFFIX}"))
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_load_cached(tmp_path: Path, version: str, use_mmap: bool) -> None:
+    source = _write(tmp_path, version)
+    cache_dir = tmp_path / "cache"
+
+    parsed = load_cached(source, cache_dir, use_mmap=use_mmap)
+    assert sorted(path.name for path in cache_dir.iterdir()) == sorted(
+        [KEY_FILE, _snapshots(cache_dir)[0].name]
+    )
+    loaded: Any = load_cached(source, cache_dir, use_mmap=use_mmap)
+
+    assert loaded is not parsed
+    assert loaded == parsed == parse_obj(_document(version))
+    # the set fields and the extra values are kept
+    assert json.loads(to_json_bytes(loaded)) == _document(version)
+
+
+def test_load_cached_source_updated(tmp_path: Path) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir)
+
+    source.write_text(json.dumps({**_document("3.1.1"), "paths": {}}))
+    open_api = load_cached(source, cache_dir)
+
+    assert open_api.paths == {}
+    assert len(_snapshots(cache_dir)) == 2
+
+
+def test_load_cached_invalid_snapshot(tmp_path: Path) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir)
+    (snapshot,) = _snapshots(cache_dir)
+    key = (cache_dir / KEY_FILE).read_bytes()
+
+    valid = snapshot.read_bytes()
+    # the magic line, and the line of the versions
+    header = b"".join(valid.splitlines(keepends=True)[:2])
+    signature = valid[len(header) : len(header) + 32]
+    marker = tmp_path / "unpickled"
+    code = f"cbuiltins\nexec\n(Vopen({str(marker)!r}, 'w').close()\ntR.".encode()
+    contents = (
+        b"",
+        b"openapi-pydantic snapshot\nother version\n",
+        b"\x80\x05",
+        valid[: len(valid) // 2],
+        valid[:-1] + b"\x00",
+        # a pickle running code, without and with the signature of another one
+        header + b"\x00" * 32 + code,
+        header + signature + code,
+    )
+    for content in contents:
+        snapshot.write_bytes(content)
+        assert load_cached(source, cache_dir) == parse_obj(_document("3.1.1"))
+        # written again
+        assert load_snapshot(snapshot, key) == parse_obj(_document("3.1.1"))
+    assert not marker.exists()
+
+
+def test_load_cached_other_key(tmp_path: Path) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir, key=b"first")
+    (snapshot,) = _snapshots(cache_dir)
+
+    with pytest.raises(ValueError, match="signature"):
+        load_snapshot(snapshot, b"second")
+    assert load_cached(source, cache_dir, key=b"second") == parse_obj(
+        _document("3.1.1")
+    )
+    assert load_snapshot(snapshot, b"second") == parse_obj(_document("3.1.1"))
+    # the key file is only created without a key
+    assert not (cache_dir / KEY_FILE).exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="no POSIX permissions")
+def test_load_cached_public_key(tmp_path: Path) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir)
+    (snapshot,) = _snapshots(cache_dir)
+    (cache_dir / KEY_FILE).chmod(0o644)
+
+    # the snapshot is not used, nor written again
+    snapshot.unlink()
+    assert load_cached(source, cache_dir) == parse_obj(_document("3.1.1"))
+    assert _snapshots(cache_dir) == []
+
+
+def test_load_cached_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir)
+
+    def rebuild(*args: Any) -> None:
+        raise TypeError("bug")
+
+    # an error of a valid snapshot is not hidden by parsing the file again
+    monkeypatch.setattr(snapshot_module, "_rebuild", rebuild)
+    with pytest.raises(TypeError, match="bug"):
+        load_cached(source, cache_dir)
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_load_snapshot_gc_state(tmp_path: Path, enabled: bool) -> None:
+    source = _write(tmp_path, "3.1.1")
+    cache_dir = tmp_path / "cache"
+    load_cached(source, cache_dir)
+    was_enabled = gc.isenabled()
+    if not enabled:
+        gc.disable()
+    try:
+        load_cached(source, cache_dir)
+        # the state of the caller is restored
+        assert gc.isenabled() is enabled
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def test_snapshot_shared_objects(tmp_path: Path) -> None:
+    document = _document("3.0.4")
+    schemas = document["components"]["schemas"]["Pet"]["properties"]
+    schemas["otherId"] = {"type": "integer"}
+    open_api: Any = parse_obj(document)
+    intern_schemas(open_api)
+    path = tmp_path / f"openapi{SNAPSHOT_SUFFIX}"
+
+    save_snapshot(open_api, path, b"key")
+    loaded: Any = load_snapshot(path, b"key")
+
+    properties = loaded.components.schemas["Pet"].properties
+    assert properties["id"] is properties["otherId"]
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,110 @@
+import json
+from typing import Any, Dict
+
+import pytest
+
+from openapi_pydantic import parse_obj, parse_trusted
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.serializer import to_json_bytes
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "Pets", "version": "0.1.0", "x-audience": "public"},
+        "paths": {
+            "/pets/{petId}": {
+                "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "A pet",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Pet"}
+                                }
+                            },
+                        },
+                        "default": {"$ref": "#/components/responses/Error"},
+                    },
+                },
+            },
+            "/cats": {"$ref": "#/paths/~1pets~1{petId}"},
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {"type": "string", "not": {"enum": [""]}},
+                        "weight": {"type": "number", "minimum": 0},
+                        "birthday": {"type": "string", "format": "date"},
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                    },
+                    "additionalProperties": False,
+                },
+                "Owner": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"},
+                },
+            },
+            "parameters": {"PetId": {"name": "petId", "in": "path", "required": True}},
+            "responses": {"Error": {"description": "An error"}},
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_parse_trusted(version: str) -> None:
+    data = _document(version)
+
+    result: Any = parse_trusted(data)
+
+    assert result == parse_obj(data)
+    assert to_json_bytes(result) == to_json_bytes(parse_obj(data))
+    # the aliases, and the `$ref` of the unions
+    operation = result.paths["/pets/{petId}"].get
+    media_type = operation.responses["200"].content["application/json"]
+    assert media_type.media_type_schema.ref == "#/components/schemas/Pet"
+    assert isinstance(operation.responses["default"], (v3_1.Reference, v3_0.Reference))
+    assert isinstance(result.paths["/cats"], (v3_1.PathItem, v3_0.PathItem))
+    schema = result.components.schemas["Pet"]
+    assert schema.properties["name"].schema_not.enum == [""]
+    assert schema.properties["birthday"].schema_format == "date"
+    assert result.components.parameters["PetId"].param_in == "path"
+    assert type(schema.properties["weight"].minimum) is float
+    # the set fields and the extra values
+    fields_set = "model_fields_set" if PYDANTIC_V2 else "__fields_set__"
+    assert getattr(result, fields_set) == {"openapi", "info", "paths", "components"}
+    assert json.loads(to_json_bytes(result.info)) == data["info"]
+
+
+def test_parse_trusted_default_servers() -> None:
+    data = {"openapi": "3.1.1", "info": {"title": "foo", "version": "1"}}
+
+    first: Any = parse_trusted(data)
+    second: Any = parse_trusted(data)
+
+    assert first == parse_obj(data)
+    assert first.servers == [v3_1.Server(url="/")]
+    assert first.servers is not second.servers
+
+
+def test_parse_trusted_version() -> None:
+    data = {"info": {"title": "foo", "version": "1"}, "paths": {}}
+
+    assert isinstance(parse_trusted(data, version="3.0"), v3_0.OpenAPI)
+    assert isinstance(parse_trusted(data, version="3.1.0"), v3_1.OpenAPI)
+    with pytest.raises(ValueError, match="Unsupported OpenAPI version"):
+        parse_trusted(data)
+    with pytest.raises(ValueError, match="Unsupported OpenAPI version"):
+        parse_trusted(data, version="2.0")
+
+
+def test_parse_trusted_swagger() -> None:
+    with open("tests/data/swagger_openapi_v3.0.1.json") as f:
+        data = json.load(f)
+
+    assert parse_trusted(data) == parse_obj(data)
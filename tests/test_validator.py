@@ -0,0 +1,310 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.resolver import RefResolver
+from openapi_pydantic.v3.validator import (
+    InstanceError,
+    compile_validator,
+    validate_many,
+)
+
+
+def _schema(data: Dict[str, Any]) -> v3_1.Schema:
+    return v3_1.Schema(**data)
+
+
+@pytest.mark.parametrize(
+    "schema, valid, invalid",
+    [
+        ({"type": "string"}, ["a"], [1, None, True]),
+        ({"type": ["integer", "null"]}, [1, 1.0, None], [1.5, "1", True]),
+        ({"type": "number"}, [1, 1.5], [True, "1"]),
+        ({"type": "boolean"}, [True, False], [0, 1]),
+        ({"type": "array"}, [[]], [{}, "a"]),
+        ({"enum": ["a", 1, None]}, ["a", 1, 1.0, None], ["b", True]),
+        ({"const": None}, [None], [0, False]),
+        ({"const": False}, [False], [0, None]),
+        ({"minimum": 1, "maximum": 3}, [1, 3, "a"], [0, 3.5]),
+        ({"exclusiveMinimum": 1, "exclusiveMaximum": 3}, [2], [1, 3]),
+        ({"multipleOf": 0.5}, [1, 1.5, 0], [1.2]),
+        ({"multipleOf": 3}, [9, 9.0], [10]),
+        ({"minLength": 2, "maxLength": 3}, ["ab", "abc", 1], ["a", "abcd"]),
+        ({"pattern": "^[a-z]+-\\d{2}$"}, ["ab-12"], ["ab-1", "AB-12"]),
+        ({"items": {"type": "integer"}}, [[], [1, 2]], [[1, "2"]]),
+        (
+            {"prefixItems": [{"type": "string"}], "items": {"type": "integer"}},
+            [["a"], ["a", 1, 2]],
+            [[1], ["a", "b"]],
+        ),
+        ({"minItems": 1, "maxItems": 2}, [[1], [1, 2]], [[], [1, 2, 3]]),
+        ({"uniqueItems": True}, [[1, True], [{"a": 1}, {"a": 2}]], [[1, 1.0]]),
+        ({"contains": {"type": "string"}}, [["a", 1]], [[1, 2]]),
+        (
+            {
+                "properties": {"id": {"type": "integer"}},
+                "required": ["id"],
+                "additionalProperties": False,
+            },
+            [{"id": 1}],
+            [{}, {"id": "1"}, {"id": 1, "other": 2}],
+        ),
+        (
+            {
+                "patternProperties": {"^x-": {"type": "string"}},
+                "additionalProperties": {"type": "integer"},
+            },
+            [{"x-a": "a", "b": 1}],
+            [{"x-a": 1}, {"b": "b"}],
+        ),
+        ({"propertyNames": {"maxLength": 2}}, [{"ab": 1}], [{"abc": 1}]),
+        ({"minProperties": 1, "maxProperties": 1}, [{"a": 1}], [{}, {"a": 1, "b": 2}]),
+        (
+            {"dependentRequired": {"a": ["b"]}},
+            [{}, {"b": 1}, {"a": 1, "b": 1}],
+            [{"a": 1}],
+        ),
+        (
+            {"allOf": [{"minimum": 1}, {"maximum": 2}]},
+            [1, 2],
+            [0, 3],
+        ),
+        ({"anyOf": [{"type": "string"}, {"minimum": 1}]}, ["a", 1], [0]),
+        ({"oneOf": [{"type": "integer"}, {"minimum": 1}]}, [0, 1.5], [1]),
+        ({"not": {"type": "string"}}, [1], ["a"]),
+        (
+            {"if": {"minimum": 10}, "then": {"multipleOf": 10}, "else": {"minimum": 5}},
+            [20, 5],
+            [15, 4],
+        ),
+        (
+            {
+                "properties": {"a": {}},
+                "anyOf": [
+                    {"properties": {"b": {"type": "string"}}},
+                    {"properties": {"c": {"type": "string"}}, "required": ["c"]},
+                ],
+                "unevaluatedProperties": {"not": {}},
+            },
+            [{"a": 1, "b": "b"}, {"c": "c"}],
+            [{"a": 1, "d": 1}, {"b": 1, "c": "c"}],
+        ),
+    ],
+)
+def test_compile_validator(
+    schema: Dict[str, Any], valid: List[Any], invalid: List[Any]
+) -> None:
+    validator = compile_validator(_schema(schema))
+    for instance in valid:
+        assert validator.is_valid(instance), instance
+        validator(instance)
+    for instance in invalid:
+        assert not validator.is_valid(instance), instance
+        with pytest.raises(ValueError):
+            validator(instance)
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Node": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {"type": "string"},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Node"},
+                        },
+                    },
+                },
+                "Alias": {"$ref": "#/components/schemas/Node"},
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_compile_validator_references(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    resolver = RefResolver(open_api)
+    schema = resolver.resolve("#/components/schemas/Alias")
+    validator = compile_validator(schema, resolver)
+
+    assert validator.is_valid({"name": "a", "children": [{"name": "b"}]})
+    assert validator.errors({"name": "a", "children": [{"name": "b"}, {}]}) == [
+        InstanceError("/children/1", "'name' is a required property")
+    ]
+    assert validator.errors({"name": 1}) == [
+        InstanceError("/name", "1 is not of type 'string'")
+    ]
+    with pytest.raises(ValueError, match="A resolver is needed"):
+        compile_validator(schema)
+    # the compiled checks are cached per schema and resolver
+    assert compile_validator(schema, resolver)._check is validator._check
+
+
+def test_compile_validator_cache() -> None:
+    schema = _schema({"type": "string"})
+    # without a resolver, the checks are cached per schema
+    assert compile_validator(schema)._check is compile_validator(schema)._check
+
+    open_api = parse_obj(_document("3.1.1"))
+    resolver = RefResolver(open_api)
+    schema = resolver.resolve("#/components/schemas/Alias")
+    validator = compile_validator(schema, resolver)
+    ref = weakref.ref(resolver)
+    del resolver
+    gc.collect()
+    # the cached checks do not keep the resolver
+    assert ref() is None
+    assert validator.is_valid({"name": "a", "children": [{"name": "b"}]})
+
+
+def test_compile_validator_threads() -> None:
+    open_api = parse_obj(_document("3.1.1"))
+    instance = {"name": "a", "children": [{"name": "b", "children": [{}]}]}
+
+    def errors(resolver: RefResolver) -> List[InstanceError]:
+        schema = resolver.resolve("#/components/schemas/Alias")
+        return compile_validator(schema, resolver).errors(instance)
+
+    for _ in range(20):
+        resolver = RefResolver(open_api)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(errors, [resolver] * 32))
+        assert all(result == results[0] for result in results)
+        assert results[0] == [
+            InstanceError("/children/0/children/0", "'name' is a required property")
+        ]
+
+
+def test_compile_validator_v3_0_keywords() -> None:
+    schema = v3_0.Schema(
+        type=v3_0.DataType.INTEGER,
+        nullable=True,
+        minimum=1,
+        exclusiveMinimum=True,
+        maximum=3,
+        exclusiveMaximum=False,
+    )
+    validator = compile_validator(schema)
+    assert [validator.is_valid(i) for i in [None, 1, 2, 3, 4]] == [
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_compile_validator_error_paths() -> None:
+    validator = compile_validator(
+        _schema(
+            {
+                "properties": {
+                    "a/b": {"items": {"properties": {"c~d": {"type": "string"}}}}
+                }
+            }
+        )
+    )
+    assert validator.errors({"a/b": [{"c~d": "ok"}, {"c~d": None}]}) == [
+        InstanceError("/a~1b/1/c~0d", "None is not of type 'string'")
+    ]
+    assert validator.errors(1) == []
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_validate_many(version: str) -> None:
+    data = _document(version)
+    data["components"]["schemas"]["Item"] = {
+        "type": "object",
+        "required": ["id"],
+        "additionalProperties": False,
+        "properties": {
+            "id": {"type": "integer", "minimum": 1},
+            "price": {"type": "number", "exclusiveMaximum": 100, "multipleOf": 0.5}
+            if version.startswith("3.1")
+            else {"type": "number", "maximum": 100, "exclusiveMaximum": True},
+            "name": {"type": "string", "maxLength": 3, "pattern": "^[a-z]"},
+            "kind": {"enum": ["a", "b"]},
+            "tags": {
+                "type": "array",
+                "items": {"type": "string", "maxLength": 2},
+                "maxItems": 2,
+            },
+            "node": {"$ref": "#/components/schemas/Node"},
+        },
+    }
+    open_api = parse_obj(data)
+    resolver = RefResolver(open_api)
+    schema = resolver.resolve("#/components/schemas/Item")
+    records: List[Any] = [
+        {"id": 1, "price": 1.5, "name": "abc", "kind": "a", "node": {"name": "n"}},
+        {"id": 2, "tags": ["a", "bb"]},
+        {"id": 2, "tags": ["a", "bbb"]},
+        {"id": 2, "tags": ["a", "b", "c"]},
+        {"id": 2, "tags": [1]},
+        {"id": 0, "price": 100, "name": "Abcd", "kind": "c"},
+        {"id": "3", "price": "1", "name": 1, "kind": None},
+        {"price": 1, "node": {}, "other": 1},
+        {"id": 1.0},
+        {"id": True},
+        "not an object",
+    ]
+
+    result = validate_many(schema, records, resolver)
+
+    validator = compile_validator(schema, resolver)
+    expected = {i: validator.errors(r) for i, r in enumerate(records)}
+    assert {i: sorted(e) for i, e in result.items()} == {
+        i: sorted(e) for i, e in expected.items() if e
+    }
+    assert sorted(result) == [2, 3, 4, 5, 6, 7, 9, 10]
+    assert validate_many(schema, records[:2], resolver) == {}
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        {"maximum": 9007199254740992},
+        {"minimum": -9007199254740992, "exclusiveMaximum": 2**60},
+        {"maximum": 9007199254740993},
+        {"maximum": 1.5},
+    ],
+)
+def test_validate_many_numpy_edge_values(bounds: Dict[str, Any]) -> None:
+    pytest.importorskip("numpy")
+    schema = _schema(
+        {"type": "object", "properties": {"n": {"type": "number", **bounds}}}
+    )
+    values = [
+        1,
+        9007199254740992,
+        9007199254740993,
+        -9007199254740993,
+        2**60,
+        10**400,
+        -(10**400),
+        1e300,
+        float("inf"),
+        float("-inf"),
+        float("nan"),
+    ]
+    records = [{"n": value} for value in values]
+
+    result = validate_many(schema, records)
+
+    validator = compile_validator(schema)
+    expected = {i: validator.errors(r) for i, r in enumerate(records)}
+    assert result == {i: e for i, e in expected.items() if e}
+    assert result
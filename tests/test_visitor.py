@@ -0,0 +1,148 @@
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pydantic import BaseModel
+
+from openapi_pydantic import parse_obj
+from openapi_pydantic.v3 import v3_0, v3_1
+from openapi_pydantic.v3.visitor import SKIP, Transformer, Visitor, child_fields
+
+
+def _document(version: str) -> Dict[str, Any]:
+    return {
+        "openapi": version,
+        "info": {"title": "foo", "version": "0.1.0"},
+        "paths": {
+            "/pets/{petId}": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "A pet",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Pet"}
+                                }
+                            },
+                        }
+                    }
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "owner": {"$ref": "#/components/schemas/Owner"},
+                    },
+                },
+                "Owner": {"type": "object", "not": {"type": "string"}},
+            }
+        },
+    }
+
+
+class _Recorder(Visitor):
+    def __init__(self) -> None:
+        self.visited: List[Tuple[str, str]] = []
+
+    def visit_Schema(self, obj: Any, pointer: str) -> Any:
+        self.visited.append((pointer, "Schema"))
+        return SKIP if obj.properties else None
+
+    def visit_Reference(self, obj: Any, pointer: str) -> Any:
+        self.visited.append((pointer, "Reference"))
+
+    def generic_visit(self, obj: BaseModel, pointer: str) -> Any:
+        self.visited.append((pointer, type(obj).__name__))
+
+
+class _RefRewriter(Transformer):
+    def visit_Reference(self, obj: Any, pointer: str) -> Any:
+        return type(obj)(**{"$ref": obj.ref.replace("Owner", "Person")})
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_walk(version: str) -> None:
+    visitor = _Recorder()
+
+    visitor.walk(parse_obj(_document(version)))
+
+    response = "#/paths/~1pets~1{petId}/get/responses/200"
+    assert visitor.visited == [
+        ("#", "OpenAPI"),
+        ("#/info", "Info"),
+        ("#/paths/~1pets~1{petId}", "PathItem"),
+        ("#/paths/~1pets~1{petId}/get", "Operation"),
+        (response, "Response"),
+        (f"{response}/content/application~1json", "MediaType"),
+        (f"{response}/content/application~1json/schema", "Reference"),
+        ("#/components", "Components"),
+        ("#/components/schemas/Pet", "Schema"),
+        # the children of "Pet" are skipped
+        ("#/components/schemas/Owner", "Schema"),
+        ("#/components/schemas/Owner/not", "Schema"),
+    ]
+
+
+@pytest.mark.parametrize("schema_class", [v3_1.Schema, v3_0.Schema])
+def test_child_fields(schema_class: Any) -> None:
+    names = child_fields(schema_class)
+
+    for name in ("allOf", "anyOf", "properties", "items", "schema_not", "xml"):
+        assert name in names
+    for name in ("title", "maxLength", "required", "enum", "example", "default"):
+        assert name not in names
+    assert child_fields(v3_1.OpenAPI) == (
+        "info",
+        "servers",
+        "paths",
+        "webhooks",
+        "components",
+        "tags",
+        "externalDocs",
+    )
+
+
+def test_walk_deep_schema() -> None:
+    schema = v3_1.Schema()
+    for _ in range(5000):
+        schema = v3_1.Schema(items=schema)
+    visitor = _Recorder()
+
+    visitor.walk(schema)
+
+    assert len(visitor.visited) == 5001
+    assert visitor.visited[-1][0] == "#" + "/items" * 5000
+
+
+@pytest.mark.parametrize("version", ["3.1.1", "3.0.4"])
+def test_transform(version: str) -> None:
+    open_api = parse_obj(_document(version))
+    schemas: Any = open_api.components and open_api.components.schemas
+    pet, owner = schemas["Pet"], schemas["Owner"]
+
+    transformed: Any = _RefRewriter().transform(open_api)
+
+    new_pet = transformed.components.schemas["Pet"]
+    assert new_pet.properties["owner"].ref == "#/components/schemas/Person"
+    assert pet.properties["owner"].ref == "#/components/schemas/Owner"
+    # the objects without replaced children are shared
+    assert transformed is not open_api and new_pet is not pet
+    assert new_pet.properties["name"] is pet.properties["name"]
+    assert transformed.components.schemas["Owner"] is owner
+    assert transformed.info is open_api.info
+
+
+def test_transform_in_place() -> None:
+    open_api = parse_obj(_document("3.0.4"))
+    assert isinstance(open_api, v3_0.OpenAPI)
+    schemas: Any = open_api.components and open_api.components.schemas
+    pet = schemas["Pet"]
+
+    transformed = _RefRewriter().transform(open_api, in_place=True)
+
+    assert transformed is open_api
+    assert schemas["Pet"] is pet
+    assert pet.properties["owner"].ref == "#/components/schemas/Person"
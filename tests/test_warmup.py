@@ -0,0 +1,75 @@
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from openapi_pydantic import warmup
+from openapi_pydantic.compat import PYDANTIC_V2
+from openapi_pydantic.v3 import v3_0, v3_1
+
+
+@pytest.mark.parametrize("version", [None, "3.1.1", "3.0"])
+def test_warmup(version: Any) -> None:
+    warmup(version)
+
+    if PYDANTIC_V2:
+        for module in (v3_1, v3_0):
+            if version is None or module.__name__.endswith(
+                version[:3].replace(".", "_")
+            ):
+                assert all(
+                    getattr(value, "__pydantic_complete__")  # noqa: B009
+                    for value in vars(module).values()
+                    if isinstance(value, type) and hasattr(value, "model_fields")
+                )
+
+
+def test_warmup_unsupported() -> None:
+    with pytest.raises(ValueError, match="Unsupported OpenAPI version: '2.0'"):
+        warmup("2.0")
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="Pydantic 2 only")
+def test_deferred_build() -> None:
+    script = (
+        "from openapi_pydantic import Info, Schema, warmup\n"
+        "Info.model_validate({'title': 'a', 'version': '1'})\n"
+        "print(Info.__pydantic_complete__, Schema.__pydantic_complete__)\n"
+        "warmup('3.1')\n"
+        "print(Schema.__pydantic_complete__)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.split() == ["True", "False", "True"]
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="Pydantic 2 only")
+@pytest.mark.parametrize("module", [v3_1, v3_0])
+def test_subclass_forward_references(module: Any) -> None:
+    # the names of the forward references ("Header", "PathItem") are not imported
+    # in this module
+    class ExtendedEncoding(module.Encoding):  # type: ignore[misc]
+        pass
+
+    class ExtendedOperation(module.Operation):  # type: ignore[misc]
+        pass
+
+    class ExtendedComponents(module.Components):  # type: ignore[misc]
+        pass
+
+    # the subclasses are built on first use too
+    assert not ExtendedEncoding.__pydantic_complete__
+    assert not ExtendedOperation.__pydantic_complete__
+
+    encoding = ExtendedEncoding.model_validate({"headers": {"a": {}}})
+    operation = ExtendedOperation.model_validate(
+        {"responses": {}, "callbacks": {"a": {"/b": {}}}}
+    )
+    components = ExtendedComponents.model_validate({"callbacks": {"a": {"/b": {}}}})
+
+    assert isinstance(encoding.headers["a"], module.Header)
+    assert isinstance(operation.callbacks["a"]["/b"], module.PathItem)
+    assert isinstance(components.callbacks["a"]["/b"], module.PathItem)
@@ -56,6 +56,39 @@ def test_optional_and_computed_fields() -> None:
     assert set(resp_schema.required) == {"req", "comp"}
 
 
+@pytest.mark.skipif(not PYDANTIC_V2, reason="computed fields require Pydantic V2")
+def test_computed_fields_in_both_modes() -> None:
+    from pydantic import BaseModel, computed_field
+
+    class Inner(BaseModel):
+        req: bool
+
+        @computed_field
+        @property
+        def comp(self) -> bool:
+            return True
+
+    class InnerRequest(BaseModel):
+        inner: Inner
+        model_config = {"json_schema_mode": "validation"}
+
+    class InnerResponse(BaseModel):
+        inner: Inner
+        model_config = {"json_schema_mode": "serialization"}
+
+    result = construct_open_api_with_schema_class(
+        construct_sample_api(), [InnerRequest, InnerResponse]
+    )
+    assert result.components is not None
+    assert result.components.schemas is not None
+    assert "Inner" not in result.components.schemas
+
+    input_schema = result.components.schemas["Inner-Input"]
+    output_schema = result.components.schemas["Inner-Output"]
+    assert "comp" not in input_schema.properties
+    assert "comp" in output_schema.properties
+
+
 def construct_sample_api() -> OpenAPI:
     from typing import TYPE_CHECKING, Callable
 
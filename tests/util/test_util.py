@@ -13,9 +13,14 @@ from openapi_pydantic import (
     Reference,
     RequestBody,
     Response,
+    Tag,
 )
 from openapi_pydantic.compat import PYDANTIC_V2
-from openapi_pydantic.util import PydanticSchema, construct_open_api_with_schema_class
+from openapi_pydantic.util import (
+    PydanticSchema,
+    clear_schema_cache,
+    construct_open_api_with_schema_class,
+)
 
 
 def test_construct_open_api_with_schema_class_1() -> None:
@@ -106,6 +111,91 @@ def test_construct_open_api_with_schema_class_4_generic_response_v2() -> None:
     assert "GenericResponse_PongResponse_" in result.components.schemas
 
 
+def test_construct_open_api_with_schema_class_in_place() -> None:
+    open_api = construct_base_open_api_1()
+    expected = construct_open_api_with_schema_class(construct_base_open_api_1())
+
+    result = construct_open_api_with_schema_class(open_api, in_place=True)
+    assert result is open_api
+    assert result == expected
+
+
+def test_construct_open_api_with_schema_class_copy_on_write() -> None:
+    open_api = construct_base_open_api_1()
+    open_api.tags = [Tag(name="ping")]
+    assert open_api.paths is not None
+    ping = open_api.paths["/ping"]
+    assert ping.post is not None
+    expected = construct_open_api_with_schema_class(open_api)
+
+    result = construct_open_api_with_schema_class(open_api, copy_on_write=True)
+    assert result == expected
+    assert result is not open_api
+    assert result.info is open_api.info
+    assert result.tags is open_api.tags
+    assert result.paths is not None
+    new_ping = result.paths["/ping"]
+    assert new_ping is not ping
+    assert new_ping.post is not None
+    assert new_ping.post.requestBody is not ping.post.requestBody
+    assert open_api.components is None
+    assert isinstance(
+        ping.post.requestBody.content[  # type: ignore[union-attr]
+            "application/json"
+        ].media_type_schema,
+        PydanticSchema,
+    )
+
+
+def test_construct_open_api_without_update_is_not_copied() -> None:
+    open_api = construct_base_open_api_2()
+    assert construct_open_api_with_schema_class(open_api) is open_api
+    assert construct_open_api_with_schema_class(open_api, in_place=True) is open_api
+
+
+def test_construct_open_api_with_schema_class_uses_schema_cache() -> None:
+    clear_schema_cache()
+    result_1 = construct_open_api_with_schema_class(
+        construct_base_open_api_1(), copy_on_write=True
+    )
+    result_2 = construct_open_api_with_schema_class(
+        construct_base_open_api_1(), copy_on_write=True
+    )
+    result_3 = construct_open_api_with_schema_class(construct_base_open_api_1())
+    assert result_1 == result_2 == result_3
+    assert result_1.components is not None and result_1.components.schemas
+    assert result_2.components is not None and result_2.components.schemas
+    assert result_3.components is not None and result_3.components.schemas
+
+    # the Schema objects and their nested objects are not shared between documents
+    ping_request = result_1.components.schemas["PingRequest"]
+    assert ping_request.properties
+    assert result_2.components.schemas["PingRequest"] is not ping_request
+    assert result_2.components.schemas["PingRequest"].properties is not (
+        ping_request.properties
+    )
+    assert result_3.components.schemas["PingRequest"].properties is not (
+        ping_request.properties
+    )
+
+    # updating a generated Schema object does not update the cached definitions
+    ping_request.title = "Updated"
+    ping_request.properties["req_foo"].title = "Updated"
+    result_4 = construct_open_api_with_schema_class(
+        construct_base_open_api_1(), in_place=True
+    )
+    assert result_4 == result_3
+
+    clear_schema_cache()
+    result_5 = construct_open_api_with_schema_class(
+        construct_base_open_api_1(), copy_on_write=True
+    )
+    assert result_5.components is not None and result_5.components.schemas
+    assert result_5.components.schemas["PingRequest"].properties is not (
+        ping_request.properties
+    )
+
+
 def construct_base_open_api_1() -> OpenAPI:
     model_validate: Callable[[dict], OpenAPI] = getattr(
         OpenAPI, "model_validate" if PYDANTIC_V2 else "parse_obj"
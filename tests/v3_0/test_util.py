@@ -15,6 +15,7 @@ from openapi_pydantic.v3.v3_0 import (
     RequestBody,
     Response,
     Schema,
+    Tag,
 )
 from openapi_pydantic.v3.v3_0.util import (
     PydanticSchema,
@@ -112,6 +113,48 @@ def test_construct_open_api_with_schema_class_4_generic_response() -> None:
     assert "GenericResponse_PongResponse_" in result.components.schemas
 
 
+def test_construct_open_api_with_schema_class_in_place() -> None:
+    open_api = construct_base_open_api_1()
+    expected = construct_open_api_with_schema_class(construct_base_open_api_1())
+
+    result = construct_open_api_with_schema_class(open_api, in_place=True)
+    assert result is open_api
+    assert result == expected
+
+
+def test_construct_open_api_with_schema_class_copy_on_write() -> None:
+    open_api = construct_base_open_api_1()
+    open_api.tags = [Tag(name="ping")]
+    assert open_api.paths is not None
+    ping = open_api.paths["/ping"]
+    assert ping.post is not None
+    expected = construct_open_api_with_schema_class(open_api)
+
+    result = construct_open_api_with_schema_class(open_api, copy_on_write=True)
+    assert result == expected
+    assert result is not open_api
+    assert result.info is open_api.info
+    assert result.tags is open_api.tags
+    assert result.paths is not None
+    new_ping = result.paths["/ping"]
+    assert new_ping is not ping
+    assert new_ping.post is not None
+    assert new_ping.post.requestBody is not ping.post.requestBody
+    assert open_api.components is None
+    assert isinstance(
+        ping.post.requestBody.content[  # type: ignore[union-attr]
+            "application/json"
+        ].media_type_schema,
+        PydanticSchema,
+    )
+
+
+def test_construct_open_api_without_update_is_not_copied() -> None:
+    open_api = construct_base_open_api_2()
+    assert construct_open_api_with_schema_class(open_api) is open_api
+    assert construct_open_api_with_schema_class(open_api, in_place=True) is open_api
+
+
 def construct_base_open_api_1() -> OpenAPI:
     model_validate: Callable[[dict], OpenAPI] = getattr(
         OpenAPI, "model_validate" if PYDANTIC_V2 else "parse_obj"